@@ -0,0 +1,36 @@
+from src.models.cell_matrix import CellMatrix
+from src.enums.engine import Engine
+from argparse import ArgumentParser
+from timeit import timeit
+import random
+
+# Dev notes:
+#   - Times the per-cell paths of CellMatrix that touch every cell's state
+#   - Run from the repo root: "python -m benchmarks.cell_state_benchmark -h"
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark CellMatrix's per-cell state paths")
+    parser.add_argument("--size", type=int, default=30, metavar="cells", help="Width/height of the matrix")
+    parser.add_argument("--number", type=int, default=200, metavar="count", help="Calls to time per path")
+    args = parser.parse_args()
+
+    random.seed(0)
+    matrices = {
+        engine: CellMatrix(cols=args.size, rows=args.size, engine=engine)
+        for engine in (Engine.PYTHON, Engine.INCREMENTAL, Engine.NUMPY)
+    }
+    paths = {f"mutate ({engine.value})": matrix.mutate for engine, matrix in matrices.items()}
+    paths["alive_cell_coords"] = lambda: matrices[Engine.PYTHON].alive_cell_coords
+    paths["as_str"] = lambda: matrices[Engine.PYTHON].as_str
+
+    print(f"{args.size}x{args.size} matrix, {args.number} calls per path")
+    print(f"{'path':<24} {'us/call':>10}")
+
+    for name, path in paths.items():
+        us_per_call = timeit(path, number=args.number) * 1_000_000 / args.number
+        print(f"{name:<24} {us_per_call:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+from src.utils.numpy_utils import count_alive_neighbours, apply_rules
+from src.models.parallel_stepper import ParallelStepper
+from src.enums.neighbourhood import Neighbourhood
+from argparse import ArgumentParser
+from time import perf_counter
+import numpy as np
+import os
+
+# Dev notes:
+#   - Times the NumPy engine mutating a large board in 1 process vs across 1..N worker processes
+#   - Run from the repo root: "python -m benchmarks.parallel_benchmark -h"
+
+SURVIVAL_RULE = {2, 3}
+RESURRECTION_RULE = {3}
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark mutating across worker processes")
+    parser.add_argument("--size", type=int, default=2_000, metavar="cells", help="Width/height of the board")
+    parser.add_argument("--radius", type=int, default=1, metavar="size", help="Radius of the Moore neighbourhood")
+    parser.add_argument("--generations", type=int, default=10, metavar="count", help="Generations to time")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, metavar="count", help="Most workers to time")
+    args = parser.parse_args()
+
+    board = np.random.default_rng(0).integers(0, 2, size=(args.size, args.size), dtype=np.uint8)
+
+    single_ms = _time_single_process(board, args.radius, args.generations)
+    print(f"{args.size}x{args.size} board, radius {args.radius}, {args.generations} generations")
+    print(f"{'workers':>8} {'ms/gen':>10} {'speedup':>8}")
+    print(f"{'-':>8} {single_ms:>10.2f} {1:>8.2f}  (single process)")
+
+    for workers in range(1, args.max_workers + 1):
+        parallel_ms = _time_workers(board, args.radius, args.generations, workers)
+        print(f"{workers:>8} {parallel_ms:>10.2f} {single_ms / parallel_ms:>8.2f}")
+
+
+def _time_single_process(board: np.ndarray, radius: int, generations: int) -> float:
+    """Returns the ms per generation mutating in this process"""
+    start = perf_counter()
+
+    for _ in range(generations):
+        counts = count_alive_neighbours(board, Neighbourhood.MOORE, radius, True)
+        board = apply_rules(board, counts, SURVIVAL_RULE, RESURRECTION_RULE)
+
+    return (perf_counter() - start) * 1000 / generations
+
+
+def _time_workers(board: np.ndarray, radius: int, generations: int, workers: int) -> float:
+    """Returns the ms per generation mutating across worker processes (excluding starting them)"""
+    rows, cols = board.shape
+    stepper = ParallelStepper(rows, cols, workers, Neighbourhood.MOORE, radius, True, SURVIVAL_RULE, RESURRECTION_RULE)
+
+    try:
+        stepper.board = board
+        stepper.mutate()  # warm up (workers attach to shared memory)
+
+        start = perf_counter()
+
+        for _ in range(generations):
+            stepper.mutate()
+
+        return (perf_counter() - start) * 1000 / generations
+    finally:
+        stepper.close()
+
+
+if __name__ == "__main__":
+    main()
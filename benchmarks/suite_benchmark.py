@@ -0,0 +1,173 @@
+from src.models.simulation_screen import SimulationScreen
+from src.utils.matrix_utils import get_matrix_type
+from src.enums.neighbourhood import Neighbourhood
+from src.models.gif_writer import GifWriter
+from src.models.cell_matrix import CellMatrix
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+from src.enums.on_cycle import OnCycle
+from src.enums.engine import Engine
+from datetime import datetime
+from itertools import product
+from timeit import repeat
+import numpy as np
+import platform
+import random
+import json
+import sys
+import os
+
+# Dev notes:
+#   - Times the hot paths (stepping, compositing a frame, generating a frame, writing a GIF frame) as us per call
+#   - Each case is the best of 'repeat' timings (least noisy, what the code can do), written to JSON
+#   - Compare 2 JSON files to flag regressions, so any new engine/change is measured against the last one
+#   - Run from the repo root: "python -m benchmarks.suite_benchmark -h"
+#       - "python -m benchmarks.suite_benchmark run -o baseline.json"
+#       - "python -m benchmarks.suite_benchmark compare baseline.json current.json --threshold 0.1"
+
+DEFAULT_SIZES = [16, 30, 128]
+DEFAULT_RADII = [1, 3]
+DEFAULT_THRESHOLD = 0.1  # 10% slower
+FRAME_SIZE = 30  # cells, the largest matrix the TUI allows
+CELL_MATRIX_ENGINES = [Engine.PYTHON, Engine.NUMPY, Engine.INCREMENTAL]  # mutated by CellMatrix itself
+
+
+def main():
+    parser = ArgumentParser(description="Benchmark the hot paths, or compare 2 benchmark results")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Time every case, print them and optionally write them to JSON")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, metavar="cells", help="Widths/heights of the matrices to mutate")
+    run_parser.add_argument("--radii", type=int, nargs="+", default=DEFAULT_RADII, metavar="size", help="Radii of the neighbourhoods to mutate")
+    run_parser.add_argument("--engines", type=str, nargs="+", default=[Engine.NUMPY.value], metavar="name", help="Engines to mutate w (settings an engine doesn't support are skipped)")
+    run_parser.add_argument("--number", type=int, default=20, metavar="count", help="Calls per timing")
+    run_parser.add_argument("--repeat", type=int, default=5, metavar="count", help="Timings per case (the best is kept)")
+    run_parser.add_argument("-o", "--output", type=str, default=None, metavar="path", help="JSON file to write the results to")
+
+    compare_parser = subparsers.add_parser("compare", help="Flag cases slower than the baseline by more than the threshold")
+    compare_parser.add_argument("baseline", type=str, metavar="path", help="JSON results to compare against")
+    compare_parser.add_argument("current", type=str, metavar="path", help="JSON results to compare")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, metavar="ratio", help="Slowdown allowed (0.1 = 10%%)")
+
+    args = parser.parse_args()
+
+    match args.command:
+        case "run":
+            _run(args)
+        case "compare":
+            _compare(args)
+
+
+def get_results(sizes: list[int], radii: list[int], engines: list[Engine], number: int, repeat_count: int) -> dict[str, float]:
+    """Times every case, returns the us per call of each (by case name)"""
+    cases = {}
+
+    for engine, size, radius, neighbourhood, is_wrap in product(engines, sizes, radii, Neighbourhood, [True, False]):
+        matrix_type = get_matrix_type(engine, neighbourhood, radius)
+
+        # Unsupported settings fall back to the NumPy engine, which would be timed under the wrong name
+        if matrix_type is CellMatrix and engine not in CELL_MATRIX_ENGINES:
+            continue
+
+        name = f"mutate/{engine.value}/{size}x{size}/r{radius}/{neighbourhood.value}/{'wrap' if is_wrap else 'nowrap'}"
+        random.seed(0)
+        matrix = matrix_type(cols=size, rows=size, radius=radius, neighbourhood=neighbourhood, is_wrap=is_wrap, engine=engine)
+        cases[name] = matrix.mutate
+
+    random.seed(0)
+    compose_screen = SimulationScreen(initial_gen=CellMatrix(cols=FRAME_SIZE, rows=FRAME_SIZE))
+    compose_screen._get_next_generation()
+    cases[f"compose/{FRAME_SIZE}x{FRAME_SIZE}/ghost"] = lambda: compose_screen._get_generation_as_str(True)
+
+    random.seed(0)
+    generator_screen = SimulationScreen(initial_gen=CellMatrix(cols=FRAME_SIZE, rows=FRAME_SIZE))
+    generations = generator_screen.generations_generator(sys.maxsize, is_ghost_mode=True, on_cycle=OnCycle.CONTINUE)  # never stops
+    cases[f"generations_generator/{FRAME_SIZE}x{FRAME_SIZE}/ghost"] = lambda: next(generations)
+
+    res = {name: _time(case, number, repeat_count) for name, case in cases.items()}
+    res[f"gif_writer/{FRAME_SIZE}x{FRAME_SIZE}/frame"] = _time_gif_writer(number, repeat_count)
+    return res
+
+
+def get_regressions(baseline: dict[str, float], current: dict[str, float], threshold: float) -> dict[str, float]:
+    """Gets the cases (in both) slower than the baseline by more than the threshold, w their slowdown ratio"""
+    ratios = {name: current[name] / baseline[name] for name in baseline.keys() & current.keys() if baseline[name]}
+    res = {name: ratio for name, ratio in sorted(ratios.items()) if ratio > 1 + threshold}
+    return res
+
+
+def _run(args):
+    """Times every case, prints them and writes them to JSON (if an output is given)"""
+    engines = [Engine(engine) for engine in args.engines]
+    results = get_results(args.sizes, args.radii, engines, args.number, args.repeat)
+
+    print(f"{'case':<56} {'us/call':>10}")
+    for name, us_per_call in results.items():
+        print(f"{name:<56} {us_per_call:>10.1f}")
+
+    if args.output:
+        meta = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "number": args.number,
+            "repeat": args.repeat,
+        }
+
+        with open(args.output, "w") as file:
+            json.dump({"meta": meta, "results": results}, file, indent=2)
+
+
+def _compare(args):
+    """Prints each case's change vs the baseline, exits non-zero if any regressed beyond the threshold"""
+    with open(args.baseline) as file:
+        baseline = json.load(file)["results"]
+
+    with open(args.current) as file:
+        current = json.load(file)["results"]
+
+    regressions = get_regressions(baseline, current, args.threshold)
+
+    print(f"{'case':<56} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name in sorted(baseline.keys() | current.keys()):
+        if name not in baseline or name not in current:
+            print(f"{name:<56} {baseline.get(name, '-'):>10} {current.get(name, '-'):>10} {'(new)' if name in current else '(gone)':>8}")
+            continue
+
+        change = f"{(current[name] / baseline[name] - 1) * 100:+.1f}%" if baseline[name] else "-"
+        flag = "  REGRESSION" if name in regressions else ""
+        print(f"{name:<56} {baseline[name]:>10.1f} {current[name]:>10.1f} {change:>8}{flag}")
+
+    if regressions:
+        sys.exit(f"{len(regressions)} cases regressed by more than {args.threshold * 100:.0f}%")
+
+
+def _time(case, number: int, repeat_count: int) -> float:
+    """Returns the best us per call of a case, after a warm up call (fills caches, e.g. neighbourhood offsets)"""
+    case()
+    res = min(repeat(case, number=number, repeat=repeat_count)) * 1_000_000 / number
+    return round(res, 3)
+
+
+def _time_gif_writer(number: int, repeat_count: int) -> float:
+    """Returns the best us per frame writing a GIF (frames forwards, then backwards), closing included"""
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 5, size=(FRAME_SIZE, FRAME_SIZE), dtype=np.uint8) for _ in range(number)]
+
+    with TemporaryDirectory() as dir_path:
+        path = os.path.join(dir_path, "benchmark.gif")
+
+        def write():
+            with GifWriter(path) as gif_writer:
+                for codes in frames:
+                    gif_writer.add(codes)
+
+        write()  # warm up
+        timings = repeat(write, number=1, repeat=repeat_count)
+
+    return round(min(timings) * 1_000_000 / number, 3)
+
+
+if __name__ == "__main__":
+    main()
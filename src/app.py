@@ -1,52 +1,133 @@
 from src.models.simulation_screen import SimulationScreen
 from src.utils.settings_utils import get_settings
+from src.utils.batch_utils import get_headless_run
+from src.utils.matrix_utils import setup_matrix
+from src.utils.pattern_utils import load_pattern
+from src.utils.checkpoint_utils import get_resume
+from src.models.checkpointer import Checkpointer
+from src.models.profiler import Profiler
+from src.utils.sweep_utils import run_sweep
+from src.utils.string_utils import get_frame
 from src.models.cell_matrix import CellMatrix
 from src.models.menu_screen import MenuScreen
 from src.utils.args_utils import get_cli_args
-from src.utils.seed_utils import get_seed
-from src.models.setting import Setting
-
-
-def setup_matrix(settings: list[Setting]) -> CellMatrix:
-    """Setup the matrix w settings"""
-
-    # Convert to dict for easy assignment
-    settings_dict = {setting.name: setting.value for setting in settings}
-    matrix = CellMatrix(
-        seed=get_seed(settings_dict["seed"]),
-        cols=settings_dict["cols"],
-        rows=settings_dict["rows"],
-        random=settings_dict["random"],
-        is_wrap=settings_dict["is_wrap_mode"],
-        survival_rule=settings_dict["survival_rule"],
-        resurrection_rule=settings_dict["resurrection_rule"],
-        neighbourhood=settings_dict["neighbourhood"],
-        radius=settings_dict["radius"],
-    )
-    
-    return matrix
+from src.enums.on_cycle import OnCycle
+import random
+import json
+import sys
 
 
 def main() -> None:
     """Extracted main method to be optionally triggered by another script"""
+    initial_gen: CellMatrix | None = None
+    profiler: Profiler | None = None
+    args = get_cli_args()
+
+    # Errors are left to raise (non-zero exit) for scripts/CI
+    if args["sweep_path"]:
+        main_sweep(args)
+        return
+
+    if args["is_headless"]:
+        main_headless(args)
+        return
+
     try:
-        initial_settings = get_settings(get_cli_args())
+        cells, initial_generation = None, 0
+
+        if args["is_resume"]:
+            args, cells, initial_generation = get_resume(args)
+
+        pattern = load_pattern(args["pattern_path"]) if args["pattern_path"] else None
+        initial_settings = get_settings(args)
         settings = MenuScreen(settings=initial_settings).show()
 
-        initial_gen = setup_matrix(settings=settings)
+        initial_gen = setup_matrix(settings=settings, pattern=pattern, cells=cells)
         is_ghost_mode = next((s.value for s in settings if s.name == "is_ghost_mode"), True)
+        ghost_length = next((s.value for s in settings if s.name == "ghost_length"), 3)
         num_of_generations = next((s.value for s in settings if s.name == "num_of_generations"), 100)
         updates_per_s = next((s.value for s in settings if s.name == "updates_per_s"), 10)
+        generation_step = next((s.value for s in settings if s.name == "generation_step"), 1)
+        on_cycle = next((s.value for s in settings if s.name == "on_cycle"), OnCycle.STOP)
+        num_of_generations = max(0, num_of_generations - initial_generation // generation_step)  # only the generations left if resumed
+        checkpointer = (
+            Checkpointer(args["checkpoint_dir"], args["checkpoint_every"], {s.name: s.value for s in settings}, initial_generation)
+            if args["checkpoint_every"] > 0
+            else None
+        )
+        is_profiling = args["is_profiling"] or args["is_profiling_memory"] or bool(args["trace_path"])
+        profiler = Profiler(is_tracing_memory=args["is_profiling_memory"], is_keeping_events=bool(args["trace_path"])) if is_profiling else None
 
-        simulation = SimulationScreen(initial_gen=initial_gen, is_ghost_mode=is_ghost_mode, num_of_generations=num_of_generations, updates_per_s=updates_per_s)
-        all_gens = simulation.show()
-
-        if all_gens:
-            print(f"\n{all_gens[-1]}")
+        simulation = SimulationScreen(initial_gen=initial_gen, is_ghost_mode=is_ghost_mode, ghost_length=ghost_length, num_of_generations=num_of_generations, updates_per_s=updates_per_s, generation_step=generation_step, on_cycle=on_cycle, initial_generation=initial_generation, checkpointer=checkpointer, profiler=profiler)
+        with simulation.show() as history:
+            if len(history):
+                print(f"\n{get_frame(history[-1])}")
 
     except KeyboardInterrupt:
         print("\nExiting...")
     except Exception as ex:
         print("\nAn unexpected error has occurred...", ex)
     finally:
+        if initial_gen:
+            initial_gen.close()
+        if profiler:
+            # Also when the run is cut short (e.g. Ctrl-C), the usual way to leave a slow run
+            print("\n" + "\n".join(profiler.get_summary_lines()))
+            _write_trace(profiler, args["trace_path"])
+            profiler.close()
         print("")
+
+
+def main_headless(args: dict) -> None:
+    """
+    Runs w/o any screens (no curses, no sleeping), for scripts/CI
+        - Each run steps a new matrix (w its own RNG seed) at full speed
+        - Each run's stats and final alive cells are written as a JSON line (to the output file or stdout)
+    """
+    is_checkpointing = args["checkpoint_every"] > 0 or args["is_resume"]
+
+    if is_checkpointing and args["num_of_runs"] > 1:
+        raise SystemExit("Checkpoints (and resuming) need a single run (--runs 1)")
+
+    rng_seed = args["rng_seed"] if args["rng_seed"] is not None else random.randrange(2**32)
+    output = open(args["output"], "w") if args["output"] else sys.stdout
+
+    try:
+        for run in range(args["num_of_runs"]):
+            output.write(json.dumps({"run": run, **get_headless_run(args, rng_seed + run)}) + "\n")
+    except ValueError as ex:
+        raise SystemExit(str(ex))
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+def main_sweep(args: dict) -> None:
+    """
+    Runs a parameter sweep w/o any screens, see run_sweep
+        - Needs an output file, which is appended to (rerun the same command to resume an interrupted sweep)
+    """
+    if not args["output"]:
+        raise SystemExit("A sweep needs an output file (-o)")
+
+    with open(args["sweep_path"]) as file:
+        spec = json.load(file)
+
+    try:
+        num_of_runs_written = run_sweep(args, spec, args["output"], args["num_of_jobs"])
+    except ValueError as ex:
+        raise SystemExit(str(ex))
+
+    print(f"Wrote {num_of_runs_written} runs to {args['output']}")
+
+
+def _write_trace(profiler: Profiler, path: str | None) -> None:
+    """Writes the profiler's trace (if a path is given), w/o raising over however the run ended"""
+    if not path:
+        return
+
+    try:
+        profiler.write_trace(path)
+        print(f"\nTrace written to {path}")
+    except OSError as ex:
+        print("\nCouldn't write the trace...", ex)
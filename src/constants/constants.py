@@ -1,4 +1,8 @@
 from src.enums.neighbourhood import Neighbourhood
+from src.enums.cell_state import CellState
+from src.enums.cell_code import CellCode
+from src.enums.on_cycle import OnCycle
+from src.enums.engine import Engine
 from src.enums.seed import Seed
 
 # Bounds
@@ -20,6 +24,38 @@ MAX_RANDOM: int = 100
 MIN_RULE: int = 1
 MAX_RULE: int = 100
 
+MIN_WORKERS: int = 1
+MAX_WORKERS: int = 64
+
+MIN_GHOST_LENGTH: int = 1
+MAX_GHOST_LENGTH: int = 100
+
+MIN_GENERATION_STEP: int = 1
+MAX_GENERATION_STEP: int = 2**40
+
+# Engines
+# NumPy engine switches from shifted sums to summed-area tables at these radii (measured crossover points)
+SUMMED_AREA_MIN_RADIUS_MOORE: int = 4
+SUMMED_AREA_MIN_RADIUS_VON_NEUMANN: int = 12
+INCREMENTAL_MAX_CHANGED_RATIO: float = 0.2  # Incremental engine sweeps all cells when more have changed
+HASHLIFE_MAX_NODES: int = 1_000_000  # HashLife engine forgets memoised results when it holds more nodes
+
+# Simulation
+CELL_GLYPHS: tuple[str, ...] = tuple(CellState[code.name].value for code in CellCode)  # indexed by CellCode
+CYCLE_HISTORY_SIZE: int = 1_024  # generations remembered to detect cycles (max period detectable)
+FRAME_QUEUE_SIZE: int = 8  # frames produced ahead of being shown
+EXPORT_QUEUE_SIZE: int = 64  # frames waiting to be written to the GIF (by a background worker)
+EXPORT_PROGRESS_INTERVAL_MS: int = 100  # refresh rate of the GIF export's progress
+MAX_CHECKPOINTS: int = 3  # latest checkpoints kept, older ones are removed
+HISTORY_KEYFRAME_INTERVAL: int = 32  # generations between whole (not delta) generations in the history
+HISTORY_COMPRESSION_LEVEL: int = 6  # zlib (1 = fastest .. 9 = smallest)
+PROFILER_OVERLAY_WINDOW: int = 32  # latest timings averaged per phase in the profiler's overlay
+
+# Caches (LRU, max entries)
+NEIGHBOURHOOD_OFFSETS_CACHE_SIZE: int = 64
+NEIGHBOUR_INDICES_CACHE_SIZE: int = 8  # tables hold every cell's neighbours, keep only a few
+PATTERN_CACHE_DIR: str = ".cache/patterns"  # parsed pattern files (by content hash)
+
 # Defaults
 DEFAULT_NUM_OF_GENERATIONS: int = 32
 DEFAULT_RESURRECTION_RULE: set[int] = {3}
@@ -27,9 +63,18 @@ DEFAULT_SURVIVAL_RULE: set[int] = {2, 3}
 DEFAULT_UPDATES_PER_S: int = 8
 DEFAULT_NEIGHBOURHOOD: Neighbourhood = Neighbourhood.MOORE
 DEFAULT_IS_GHOST_MODE: bool = True
+DEFAULT_GHOST_LENGTH: int = 3  # generations
 DEFAULT_IS_WRAP_MODE: bool = True
 DEFAULT_DIMENSION_X: int = 16
 DEFAULT_DIMENSION_Y: int = 16
 DEFAULT_RANDOM: int = 50  # %
 DEFAULT_RADIUS: int = 1
 DEFAULT_SEED: Seed = Seed.NONE
+DEFAULT_ENGINE: Engine = Engine.NUMPY
+DEFAULT_GENERATION_STEP: int = 1
+DEFAULT_WORKERS: int = 1
+DEFAULT_ON_CYCLE: OnCycle = OnCycle.STOP
+DEFAULT_GIF_CELL_SIZE: int = 10  # pixels
+DEFAULT_NUM_OF_RUNS: int = 1  # headless only
+DEFAULT_CHECKPOINT_EVERY: int = 0  # generations, 0 = off
+DEFAULT_CHECKPOINT_DIR: str = "checkpoints"
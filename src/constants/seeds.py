@@ -1,5 +1,3 @@
-NONE = []
-
 GLIDER = [
     (0, 2),
     (1, 1),
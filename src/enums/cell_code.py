@@ -0,0 +1,16 @@
+from enum import IntEnum
+
+
+class CellCode(IntEnum):
+    """
+    SUMMARY:
+        - Cell's and their state represented by small ints (how matrices store cells)
+        - Same names as CellState, whose chars are only needed when rendering
+        - Ordered by priority, the higher code wins when generations are layered (ghost mode)
+    """
+
+    DEAD = 0
+    RARE = 1
+    MEDIUM = 2
+    WELL_DONE = 3
+    ALIVE = 4
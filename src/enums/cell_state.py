@@ -1,3 +1,4 @@
+from src.enums.cell_code import CellCode
 from enum import Enum
 import random
 
@@ -16,6 +17,11 @@ class CellState(Enum):
     RARE = "\u2591\u2591"       # '░░'
     DEAD = "\u0020\u0020"       # '  '
 
+    @property
+    def code(self) -> CellCode:
+        """Get the state's int code (see CellCode)"""
+        return CellCode[self.name]
+
     @classmethod
     def random(cls):
         return random.choice(list(cls))
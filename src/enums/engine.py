@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class Engine(Enum):
+    PYTHON = "Python"
+    NUMPY = "NumPy"
+    INCREMENTAL = "Incremental"
+    BITWISE = "Bitwise"
+    HASHLIFE = "HashLife"
+    SPARSE = "Sparse"
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class OnCycle(Enum):
+    """What to do once the cells repeat a previous generation (died out, froze or oscillating)"""
+
+    CONTINUE = "Continue"
+    STOP = "Stop"
+    FAST_FORWARD = "FastForward"
@@ -0,0 +1,162 @@
+from src.utils.bit_utils import pack_rows, unpack_rows, get_rule_mask, mutate_moore_rows
+from src.utils.numpy_utils import count_alive_neighbours, apply_rules, get_board
+from src.enums.neighbourhood import Neighbourhood
+from src.utils.hash_utils import get_fingerprint
+from src.models.cell_matrix import CellMatrix
+from src.enums.cell_state import CellState
+from src.enums.cell_code import CellCode
+from src.enums.engine import Engine
+import numpy as np
+import random
+
+
+class BitCellMatrix(CellMatrix):
+    """
+    Represents a single matrix of cells, bit-packed (1 bit per cell instead of a string per cell)
+        - Each row of cells is a single int (see bit_utils)
+        - Cell states (glyphs) are only built when asked for (as_str, matrix, etc)
+        - Moore radius 1 mutates w bitwise ops, other neighbourhoods fall back to the NumPy engine
+    """
+
+    # Dev notes:
+    #   - Bits can only tell alive from dead
+    #   - Ghost states are tracked outside the matrix (see GhostTrail), changing alive cells to any other state clears them
+
+    def __init__(
+        self,
+        seed: list[tuple[int, int]] | np.ndarray | None = None,
+        radius: int = 1,
+        random: int = 50,
+        cols: int = 11,
+        rows: int = 11,
+        is_wrap: bool = True,
+        survival_rule: set = {2, 3},
+        resurrection_rule: set = {3},
+        neighbourhood: Neighbourhood = Neighbourhood.MOORE,
+        engine: Engine = Engine.BITWISE,
+        workers: int = 1,  # unused, mutates in a single process
+    ):
+        self._random = random
+        self._is_wrap = is_wrap
+        self._survive_rule = survival_rule
+        self._resurrect_rule = resurrection_rule
+        self._neighbourhood = neighbourhood
+        self._radius = radius
+        self._engine = engine
+        self._cols = cols
+        self._rows: list[int] = [0 for _ in range(rows)]
+        self.apply_cells(seed) if seed is not None else self.apply_random_cells()  # empty = no cells
+
+    @property
+    def rows(self):
+        """Get the number of rows (Y-axis count aka height)"""
+        return len(self._rows)
+
+    @property
+    def cols(self):
+        """Get the number of cols (X-axis count aka width)"""
+        return self._cols
+
+    @property
+    def matrix(self):
+        """Returns the matrix of cell states (unpacked from the bits)"""
+        states = (CellState.DEAD.value, CellState.ALIVE.value)
+        res = [[states[(row >> x) & 1] for x in range(self._cols)] for row in self._rows]
+        return res
+
+    @property
+    def codes(self):
+        """Returns the matrix of cell codes (unpacked from the bits)"""
+        codes = (CellCode.DEAD.value, CellCode.ALIVE.value)
+        res = [[codes[(row >> x) & 1] for x in range(self._cols)] for row in self._rows]
+        return res
+
+    @property
+    def as_str(self):
+        """Returns the matrix in string format"""
+        res = "\n".join(["".join(row) for row in self.matrix])
+        return res
+
+    @property
+    def alive_cell_coords(self):
+        """Returns the coordinates for the alive cells"""
+        res: list[tuple[int, int]] = []
+
+        for y, row in enumerate(self._rows):
+            for x in range(self._cols):
+                if (row >> x) & 1:
+                    res.append((x, y))
+
+        return res
+
+    @property
+    def population(self) -> int:
+        """Returns the number of alive (set) cells"""
+        return sum(row.bit_count() for row in self._rows)
+
+    @property
+    def fingerprint(self) -> int:
+        """Returns a 64-bit hash of the alive cells (same alive cells = same fingerprint)"""
+        num_of_bytes = (self._cols + 7) // 8
+        return get_fingerprint(b"".join(row.to_bytes(num_of_bytes, "little") for row in self._rows))
+
+    def change_state(
+        self,
+        new_state: CellState,
+        old_state: CellState | None = None
+    ):
+        """
+        If no old state is specified, the new state will be applied to all cells that are NOT dead
+
+        NOTE: Only alive/dead cells are stored, alive cells changed to any other state can't mutate (same as CellMatrix)
+        so they're cleared, dead cells always stay dead
+        """
+        is_alive_changed = (old_state is None or old_state == CellState.ALIVE) and new_state != CellState.ALIVE
+
+        if is_alive_changed:
+            self._rows = [0 for _ in self._rows]
+
+    def apply_cells(
+        self,
+        cells: list[tuple[int, int]] | np.ndarray,
+        state: CellState = CellState.ALIVE
+    ):
+        """Adds given cells to the matrix if in bounds (placed in bulk, see get_board)"""
+        masks = pack_rows(get_board(cells, self._cols, self.rows))
+
+        for y, mask in enumerate(masks):
+            self._rows[y] = self._rows[y] & ~mask if state == CellState.DEAD else self._rows[y] | mask
+
+    def apply_random_cells(self, state: CellState = CellState.ALIVE):
+        """Randomly creates cells with a given state"""
+        for y, _ in enumerate(self._rows):
+            for x in range(self._cols):
+                random_percent = random.randint(0, 100)  # %
+                if random_percent <= self._random:
+                    self._rows[y] |= 1 << x
+
+    def mutate(self):
+        """Mutates the current cell matrix"""
+        if self._is_bitwise_supported():
+            self._rows = mutate_moore_rows(
+                self._rows,
+                self._cols,
+                self._is_wrap,
+                get_rule_mask(self._survive_rule),
+                get_rule_mask(self._resurrect_rule),
+            )
+            return
+
+        board = unpack_rows(self._rows, self._cols)
+        counts = count_alive_neighbours(board, self._neighbourhood, self._radius, self._is_wrap)
+        self._rows = pack_rows(apply_rules(board, counts, self._survive_rule, self._resurrect_rule))
+
+    def _is_bitwise_supported(self) -> bool:
+        """
+        Bitwise mutations count exactly 8 neighbours per cell (Moore radius 1)
+            - Wrapping a board smaller than 3x3 would count the same neighbour more than once
+        """
+        is_moore_radius_1 = self._neighbourhood == Neighbourhood.MOORE and self._radius == 1
+        is_wrap_too_small = self._is_wrap and (self.rows < 3 or self.cols < 3)
+
+        return is_moore_radius_1 and not is_wrap_too_small
@@ -1,5 +1,13 @@
+from src.utils.numpy_utils import count_alive_neighbours, apply_rules, get_board
+from src.utils.neighbourhood_utils import get_neighbour_indices
+from src.models.parallel_stepper import ParallelStepper
+from src.utils.hash_utils import get_fingerprint
 from src.enums.neighbourhood import Neighbourhood
 from src.enums.cell_state import CellState
+from src.enums.cell_code import CellCode
+from src.constants import constants
+from src.enums.engine import Engine
+import numpy as np
 import random
 
 
@@ -23,12 +31,18 @@ class CellMatrix:
     #
     #   - Store coords the traditional way you'd expect (x,y)
     #   - When applying coords to a matrix, access w "my_matrix[y][x]"
+    #
+    #   - Cells are stored as ints (CellCode), comparing ints is cheaper than comparing strings
+    #   - Only convert codes to chars (CellState) when rendering (matrix, as_str)
 
     _ghost_generations: list[list[str]] = []
+    _workers: int = 1
+    _parallel_stepper: ParallelStepper | None = None  # started on the first (parallel) mutation
+    _is_stepper_synced: bool = False  # the parallel stepper's board holds the current cells (no need to copy them in)
 
     def __init__(
         self,
-        seed: list[tuple[int, int]] | None = None,
+        seed: list[tuple[int, int]] | np.ndarray | None = None,
         radius: int = 1,
         random: int = 50,
         cols: int = 11,
@@ -37,6 +51,8 @@ class CellMatrix:
         survival_rule: set = {2, 3},
         resurrection_rule: set = {3},
         neighbourhood: Neighbourhood = Neighbourhood.MOORE,
+        engine: Engine = Engine.NUMPY,
+        workers: int = 1,
     ):
         self._random = random
         self._is_wrap = is_wrap
@@ -44,8 +60,12 @@ class CellMatrix:
         self._resurrect_rule = resurrection_rule
         self._neighbourhood = neighbourhood
         self._radius = radius
-        self._matrix: list[list[str]] = [[(CellState.DEAD.value) for _ in range(cols)] for _ in range(rows)]
-        self.apply_cells(seed) if seed else self.apply_random_cells()
+        self._engine = engine
+        self._workers = workers
+        self._changed_indices: set[int] | None = None  # cells changed by the last mutation, None = unknown
+        self._alive_flags: list[bool] = []  # flat (y * cols + x) alive flags, kept up to date by the incremental engine
+        self._matrix: list[list[int]] = [[CellCode.DEAD.value for _ in range(cols)] for _ in range(rows)]
+        self.apply_cells(seed) if seed is not None else self.apply_random_cells()  # empty = no cells
 
     @property
     def rows(self):
@@ -59,7 +79,14 @@ class CellMatrix:
 
     @property
     def matrix(self):
-        """Returns the RAW matrix"""
+        """Returns the matrix of cell states (chars)"""
+        glyphs = constants.CELL_GLYPHS
+        res = [[glyphs[cell] for cell in row] for row in self._matrix]
+        return res
+
+    @property
+    def codes(self):
+        """Returns the RAW matrix of cell codes (ints, see CellCode)"""
         return self._matrix
 
     @property
@@ -67,20 +94,35 @@ class CellMatrix:
         """Returns the matrix in string format"""
         # 1. Combine each row's values into a single string
         # 2. Combine all row strings w newlines
-        res = "\n".join(["".join(row) for row in self._matrix])
+        glyphs = constants.CELL_GLYPHS
+        res = "\n".join(["".join([glyphs[cell] for cell in row]) for row in self._matrix])
         return res
 
     @property
     def alive_cell_coords(self):
         """Returns the coordinates for the alive cells"""
-        res: list[tuple[int, int]] = []
+        alive = CellCode.ALIVE.value
+        res: list[tuple[int, int]] = [
+            (x, y) for y, row in enumerate(self._matrix) for x, cell in enumerate(row) if cell == alive
+        ]
+        return res
 
-        for y, row in enumerate(self._matrix):
-            for x, cell in enumerate(row):
-                if cell == CellState.ALIVE.value:
-                    res.append((x, y))
+    @property
+    def plane_cell_coords(self):
+        """Returns the coordinates for all alive cells, including any outside the matrix (engines w an unbounded plane)"""
+        return self.alive_cell_coords
 
-        return res
+    @property
+    def population(self) -> int:
+        """Returns the number of alive cells"""
+        alive = CellCode.ALIVE.value
+        return sum(row.count(alive) for row in self._matrix)
+
+    @property
+    def fingerprint(self) -> int:
+        """Returns a 64-bit hash of the alive cells (same alive cells = same fingerprint)"""
+        is_alive = np.array(self._matrix, dtype=np.uint8) == CellCode.ALIVE.value
+        return get_fingerprint(np.packbits(is_alive).tobytes())
 
     def change_state(
         self,
@@ -92,182 +134,200 @@ class CellMatrix:
         """
 
         is_old_state_specified = old_state is not None
+        new_code = new_state.code.value
+        old_code = old_state.code.value if is_old_state_specified else None
+        self._changed_indices = None
+        self._is_stepper_synced = False
 
         for row in self._matrix:
             for x, cell in enumerate(row):
-                if not is_old_state_specified and cell != CellState.DEAD.value:
-                    row[x] = new_state.value
+                if not is_old_state_specified and cell != CellCode.DEAD.value:
+                    row[x] = new_code
 
-                elif is_old_state_specified and cell == old_state.value:
-                    row[x] = new_state.value
+                elif is_old_state_specified and cell == old_code:
+                    row[x] = new_code
 
     def apply_cells(
         self,
-        cells: list[tuple[int, int]],
+        cells: list[tuple[int, int]] | np.ndarray,
         state: CellState = CellState.ALIVE
     ):
-        """Adds given cells to the matrix if in bounds"""
-
-        for cell in cells:
-            x, y = cell[0], cell[1]
-            is_in_bounds = 0 <= y < self.rows and 0 <= x < self.cols
-
-            if is_in_bounds:
-                self._matrix[y][x] = state.value
+        """Adds given cells to the matrix if in bounds (placed in bulk, see get_board)"""
+        self._changed_indices = None
+        self._is_stepper_synced = False
+        is_placed = get_board(cells, self.cols, self.rows) == 1
+        matrix = np.array(self._matrix, dtype=np.uint8)
+        matrix[is_placed] = state.code.value
+        self._matrix = matrix.tolist()
 
     def apply_random_cells(self, state: CellState = CellState.ALIVE):
         """Randomly creates cells with a given state"""
+        code = state.code.value
+        self._changed_indices = None
+        self._is_stepper_synced = False
         for row in self._matrix:
             for x, _ in enumerate(row):
                 random_percent = random.randint(0, 100)  # %
                 if random_percent <= self._random:
-                    row[x] = state.value
+                    row[x] = code
 
     def mutate(self):
-        """Mutates the current cell matrix"""
-
-        next_matrix = [[CellState.DEAD.value for _ in range(self.cols)] for _ in range(self.rows)]
-
-        # Determine if cell is alive (survive/resurrect) in the next matrix
-        for y, row in enumerate(self._matrix):
-            for x, _ in enumerate(row):
-                if self._is_alive((x, y)):
-                    next_matrix[y][x] = CellState.ALIVE.value
+        """Mutates the current cell matrix using the selected engine"""
+        match self._engine:
+            case Engine.PYTHON:
+                self._mutate_python()
+            case Engine.INCREMENTAL:
+                self._mutate_incremental()
+            case _:
+                self._mutate_numpy()
 
-        self._matrix = next_matrix
+    def close(self):
+        """Stops any worker processes used to mutate the matrix"""
+        if self._parallel_stepper:
+            self._parallel_stepper.close()
+            self._parallel_stepper = None
+            self._is_stepper_synced = False
 
-    def _is_alive(self, host_cell: tuple[int, int]):
-        """Determines if a given cell is alive based on its neighbours and rules"""
+    def follow(self) -> tuple[int, int]:
+        """Moves the matrix (a window) to follow the alive cells, returns how far it moved (x,y), the matrix is fixed"""
+        return 0, 0
 
-        is_alive = False
-        host_x, host_y = host_cell[0], host_cell[1]
-        host_cell_state = self._matrix[host_y][host_x]
-        num_of_alive_neighbours = len(self._get_alive_neighbours(host_cell=host_cell))
+    def advance(self, generations: int):
+        """Mutates the current cell matrix a number of generations"""
+        for _ in range(generations):
+            self.mutate()
 
-        match host_cell_state:
-            case CellState.ALIVE.value:
-                is_alive = (
-                    True if num_of_alive_neighbours in self._survive_rule else False
-                )
-            case CellState.DEAD.value:
-                is_alive = (
-                    True if num_of_alive_neighbours in self._resurrect_rule else False
-                )
-            case _:
-                pass
+    def _mutate_python(self):
+        """Mutates the current cell matrix, cell by cell"""
 
-        return is_alive
+        next_matrix = [[CellCode.DEAD.value for _ in range(self.cols)] for _ in range(self.rows)]
+        neighbours_table = get_neighbour_indices(self._neighbourhood, self._radius, self.cols, self.rows, self._is_wrap)
+        is_alive_cells = [cell == CellCode.ALIVE.value for row in self._matrix for cell in row]
 
-    def _get_alive_neighbours(self, host_cell: tuple[int, int]) -> set[tuple[int, int]]:
-        """
-        Determines the neighbourhood (regardless of cell state) within the bounds/context of the game:
-         - Gets the neighbours based on type and radius
-         - (Optionally) wraps the neighbourhood
-        """
-        all_neighbours: set[tuple[int, int]] = set()
-        alive_neighbours: set[tuple[int, int]] = set()
-
-        match self._neighbourhood:
-            case Neighbourhood.MOORE:
-                all_neighbours = self._get_moore_neighbourhood(host_cell)
-            case Neighbourhood.VON_NEUMANN:
-                all_neighbours = self._get_von_neumann_neighbourhood(host_cell)
-            case _:
-                pass
-
-        if self._is_wrap:
-            all_neighbours = {(n[0] % self.cols, n[1] % self.rows) for n in all_neighbours}
-
-        for neighbour in all_neighbours:
-            x, y = neighbour[0], neighbour[1]
-            is_in_bounds = 0 <= x < self.cols and 0 <= y < self.rows
+        # Determine if cell is alive (survive/resurrect) in the next matrix
+        for y, row in enumerate(self._matrix):
+            for x, cell in enumerate(row):
+                neighbours = neighbours_table[y * self.cols + x]
+                num_of_alive_neighbours = sum(is_alive_cells[idx] for idx in neighbours)
 
-            if is_in_bounds and self._matrix[y][x] == CellState.ALIVE.value:
-                alive_neighbours.add(neighbour)
+                if self._is_alive(cell, num_of_alive_neighbours):
+                    next_matrix[y][x] = CellCode.ALIVE.value
 
-        return alive_neighbours
+        self._matrix = next_matrix
 
-    def _get_von_neumann_neighbourhood(
-        self, host_cell: tuple[int, int]
-    ) -> set[tuple[int, int]]:
+    def _mutate_incremental(self):
         """
-        Calculates the Von Neumann neighbours surrounding a given host cell
-        - Travels from top to bottom (along Y-axis)
-        - Each iteration saves the cells left to right (along X-axis)
-        - Each iteration calcs the window along the X-axis to achieve Von Neumann
-        - Is not responsible for excluding neighbours out of bounds
-        - Does not save the host cell
+        Mutates the current cell matrix, only re-evaluating cells that could have changed
+            - A cell can only change if itself or a neighbour changed in the last mutation
+            - Neighbourhoods are symmetric, so those cells are the changed cells + their neighbours
+            - Sweeps all cells when the changes are unknown (first mutation, cells applied, etc) or too many
         """
-        host_x, host_y = host_cell
-
-        lower_x = host_x - self._radius
-        upper_x = host_x + self._radius
-        lower_y = host_y - self._radius
-        upper_y = host_y + self._radius
-
-        # ALGO SUMMARY TO ACHIEVE VON NEUMANN:
-        #   - Get lists holding all 'Y' coords:
-        #       - Incrementing from host cell to radius limit [y..upper_y]
-        #       - Decrementing from host cell to radius limit [y..lower_y]
-        #   - The index of a given 'Y' in these lists shows how far away 'Y' is from the host
-        #   - This value also maps nicely to how much padding is needed (both sides) to shrink the X-axis range (creating a window)
-        #   - The further away 'Y' is = the greater the padding = the smaller the window = the Von Neumann "diamond" shape
-        y_coords_up = self._spread_integers(host_y, upper_y)
-        y_coords_down = self._spread_integers(host_y, lower_y)
-
-        get_window_padding = lambda coord_range, target: (coord_range.index(target) if target in coord_range else -1)
-
-        neighbours: set[tuple[int, int]] = set()
-
-        for y in range(lower_y, upper_y + 1):
-            padding_x = 0
-
-            if y > host_y:
-                padding_x = get_window_padding(y_coords_up, y)
-            else:
-                padding_x = get_window_padding(y_coords_down, y)
+        cols = self.cols
+        num_of_cells = self.rows * cols
+        neighbours_table = get_neighbour_indices(self._neighbourhood, self._radius, cols, self.rows, self._is_wrap)
+        is_full_sweep = (
+            self._changed_indices is None
+            or len(self._changed_indices) > num_of_cells * constants.INCREMENTAL_MAX_CHANGED_RATIO
+        )
+
+        if is_full_sweep:
+            self._alive_flags = [cell == CellCode.ALIVE.value for row in self._matrix for cell in row]
+            candidates = range(num_of_cells)
+        else:
+            candidates = set(self._changed_indices)
+            for idx in self._changed_indices:
+                candidates.update(neighbours_table[idx])
+
+        # Only rows w changes are copied (not mutated in place) as older copies of this matrix may share them
+        next_matrix = list(self._matrix)
+        copied_ys: set[int] = set()
+        changed_indices: set[int] = set()
+
+        for idx in candidates:
+            y, x = divmod(idx, cols)
+            cell = self._matrix[y][x]
+            num_of_alive_neighbours = sum(self._alive_flags[i] for i in neighbours_table[idx])
+            next_cell = CellCode.ALIVE.value if self._is_alive(cell, num_of_alive_neighbours) else CellCode.DEAD.value
+
+            if next_cell != cell:
+                if y not in copied_ys:
+                    next_matrix[y] = next_matrix[y].copy()
+                    copied_ys.add(y)
+
+                next_matrix[y][x] = next_cell
+                changed_indices.add(idx)
+
+        for idx in changed_indices:
+            self._alive_flags[idx] = not self._alive_flags[idx]
 
-            # Signifies window completely closed ∴ no cells to save
-            if padding_x <= -1:
-                continue
+        self._matrix = next_matrix
+        self._changed_indices = changed_indices
 
-            # Define X-axis window bounds
-            window_lower_x = lower_x + padding_x
-            window_upper_x = upper_x - padding_x
+    def _mutate_numpy(self):
+        """Mutates the current cell matrix, all cells at once (as a uint8 board)"""
+        if self._workers > 1 and ParallelStepper.is_supported(self.rows, self._radius, self._is_wrap):
+            self._mutate_parallel()
+            return
 
-            for x in range(window_lower_x, window_upper_x + 1):
-                if (x, y) != host_cell:
-                    neighbours.add((x, y))
+        cells = np.array(self._matrix, dtype=np.uint8)
+        is_dead = cells == CellCode.DEAD.value
+        board = (cells == CellCode.ALIVE.value).astype(np.uint8)
+        counts = count_alive_neighbours(board, self._neighbourhood, self._radius, self._is_wrap)
+        next_board = apply_rules(board, counts, self._survive_rule, self._resurrect_rule)
 
-        return neighbours
+        # Only alive or dead cells can mutate (same as the Python engine)
+        is_alive = (next_board == 1) & (is_dead | (board == 1))
+        self._matrix = np.where(is_alive, CellCode.ALIVE.value, CellCode.DEAD.value).tolist()
 
-    def _get_moore_neighbourhood(
-        self, host_cell: tuple[int, int]
-    ) -> set[tuple[int, int]]:
+    def _mutate_parallel(self):
         """
-        Calculates the Moore neighbours surrounding a given host cell
-        - Travels from top to bottom (along Y-axis)
-        - Each iteration saves the cells left to right (along X-axis)
-        - Is not responsible for excluding neighbours out of bounds
-        - Does not save the host cell
+        Mutates the current cell matrix in stripes across worker processes
+            - The board stays in shared memory between mutations, cells are only copied in after being changed elsewhere
         """
-        hostX, hostY = host_cell
-
-        lowerX = hostX - self._radius
-        upperX = hostX + self._radius
-        lowerY = hostY - self._radius
-        upperY = hostY + self._radius
-
-        neighbours: set[tuple[int, int]] = set()
+        if self._parallel_stepper is None:
+            self._parallel_stepper = ParallelStepper(
+                self.rows,
+                self.cols,
+                self._workers,
+                self._neighbourhood,
+                self._radius,
+                self._is_wrap,
+                self._survive_rule,
+                self._resurrect_rule,
+            )
+
+        is_frozen = None
+
+        if not self._is_stepper_synced:
+            cells = np.array(self._matrix, dtype=np.uint8)
+            is_frozen = (cells != CellCode.DEAD.value) & (cells != CellCode.ALIVE.value)
+            self._parallel_stepper.board = cells == CellCode.ALIVE.value
+
+        self._parallel_stepper.mutate()
+        next_board = self._parallel_stepper.board  # view onto shared memory, mutated in place
+
+        # Only alive or dead cells can mutate (same as the Python engine)
+        if is_frozen is not None:
+            next_board[is_frozen] = 0
+
+        self._matrix = (next_board * CellCode.ALIVE.value).tolist()
+        self._is_stepper_synced = True
+
+    def _is_alive(self, host_cell_code: int, num_of_alive_neighbours: int):
+        """Determines if a given cell is alive based on its neighbours and rules"""
 
-        for y in range(lowerY, upperY + 1):
-            for x in range(lowerX, upperX + 1):
-                if (x, y) != host_cell:
-                    neighbours.add((x, y))
+        is_alive = False
 
-        return neighbours
+        match host_cell_code:
+            case CellCode.ALIVE.value:
+                is_alive = (
+                    True if num_of_alive_neighbours in self._survive_rule else False
+                )
+            case CellCode.DEAD.value:
+                is_alive = (
+                    True if num_of_alive_neighbours in self._resurrect_rule else False
+                )
+            case _:
+                pass
 
-    def _spread_integers(self, a: int, b: int) -> list[int]:
-        """Spreads the range of ints between a and b (inclusive)"""
-        res = list(range(a, b + 1)) if a <= b else list(range(a, b - 1, -1))
-        return res
+        return is_alive
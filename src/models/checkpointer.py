@@ -0,0 +1,49 @@
+from src.utils.checkpoint_utils import write_checkpoint, get_checkpoint_path, get_checkpoint_paths
+from src.models.cell_matrix import CellMatrix
+from src.constants import constants
+import os
+
+
+class Checkpointer:
+    """
+    Writes a checkpoint of the cells every 'every' generations to a rolling directory (see checkpoint_utils)
+        - Only the latest 'max_checkpoints' are kept, older ones are removed
+    """
+
+    def __init__(
+        self,
+        dir_path: str,
+        every: int,
+        settings_dict: dict,
+        initial_generation: int = 0,
+        max_checkpoints: int = constants.MAX_CHECKPOINTS,
+    ):
+        self._dir_path = dir_path
+        self._every = every
+        self._settings_dict = settings_dict
+        self._max_checkpoints = max_checkpoints
+        self._last_generation = initial_generation  # generation of the last checkpoint written (or started from)
+        self._num_of_checkpoints_written = 0
+        os.makedirs(dir_path, exist_ok=True)
+
+    @property
+    def num_of_checkpoints_written(self) -> int:
+        return self._num_of_checkpoints_written
+
+    def add(self, matrix: CellMatrix, generation: int) -> bool:
+        """Writes a checkpoint if the generation crossed the next multiple of 'every', returns True if written"""
+        # Generations may be stepped more than 1 at a time, so checkpoints are due once a multiple is crossed
+        if generation // self._every <= self._last_generation // self._every:
+            return False
+
+        self.write(matrix, generation)
+        return True
+
+    def write(self, matrix: CellMatrix, generation: int):
+        """Writes a checkpoint now (regardless of 'every'), removing the oldest ones past 'max_checkpoints'"""
+        write_checkpoint(get_checkpoint_path(self._dir_path, generation), matrix, generation, self._settings_dict)
+        self._last_generation = generation
+        self._num_of_checkpoints_written += 1
+
+        for path in get_checkpoint_paths(self._dir_path)[:-self._max_checkpoints]:
+            os.remove(path)
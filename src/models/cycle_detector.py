@@ -0,0 +1,35 @@
+from src.constants import constants
+from collections import OrderedDict
+
+
+class CycleDetector:
+    """
+    Detects when the cells repeat a previous generation
+        - Remembers the fingerprint of recent generations (bounded, oldest are forgotten first)
+        - Died out or frozen (still life) cells are a cycle w a period of 1
+    """
+
+    def __init__(self, max_history: int = constants.CYCLE_HISTORY_SIZE):
+        self._max_history = max_history
+        self._history: OrderedDict[int, int] = OrderedDict()  # fingerprint -> generation
+        self._cycle: tuple[int, int] | None = None
+
+    @property
+    def cycle(self) -> tuple[int, int] | None:
+        """Returns the (first generation of the cycle, period) once detected, otherwise None"""
+        return self._cycle
+
+    def add(self, fingerprint: int, generation: int) -> bool:
+        """Remembers a generation, returns True if it repeats a previous generation"""
+        first_generation = self._history.get(fingerprint)
+
+        if first_generation is not None:
+            self._cycle = (first_generation, generation - first_generation)
+            return True
+
+        self._history[fingerprint] = generation
+
+        if len(self._history) > self._max_history:
+            self._history.popitem(last=False)
+
+        return False
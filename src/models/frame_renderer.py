@@ -0,0 +1,59 @@
+from src.utils.string_utils import get_lines_diff
+import curses
+
+
+class FrameRenderer:
+    """
+    Draws frames onto a curses screen, only redrawing the chars that changed since the last frame
+        - The banner is drawn once, each frame is drawn below it and the footer below the frame
+        - Changed runs of chars are written in place (positioned), so output scales w the change not the size
+        - Each draw is batched (noutrefresh) and flushed to the terminal once (doupdate)
+    """
+
+    # Dev notes:
+    #   - Never clear the screen between frames, clearing forces curses to repaint every char
+    #   - Frames are expected to keep the same size (the footer stays put)
+    #   - Chars that don't fit on the screen are skipped (writing them raises curses.error)
+
+    def __init__(self, screen: curses.window, banner: str = ""):
+        self._screen = screen
+        self._prev_frame_lines: list[str] = []
+        self._prev_footer_lines: list[str] = []
+        self._num_of_chars_drawn = 0
+
+        self._screen.scrollok(False)  # scrolling would move what was already drawn
+        self._screen.clear()
+        self._add_str(0, 0, banner)
+        self._origin_y = self._screen.getyx()[0] if banner else 0
+
+    @property
+    def num_of_chars_drawn(self) -> int:
+        """Returns the number of chars written by the last draw"""
+        return self._num_of_chars_drawn
+
+    def draw(self, frame: str, footer_lines: list[str] | None = None):
+        """Draws a frame (and footer lines below it), only writing the chars that changed"""
+        frame_lines = frame.split("\n")
+        footer_lines = footer_lines or []
+        footer_y = self._origin_y + len(frame_lines)
+        self._num_of_chars_drawn = 0
+
+        for y, x, text in get_lines_diff(self._prev_frame_lines, frame_lines):
+            self._add_str(self._origin_y + y, x, text)
+
+        for y, x, text in get_lines_diff(self._prev_footer_lines, footer_lines):
+            self._add_str(footer_y + y, x, text)
+
+        self._prev_frame_lines = frame_lines
+        self._prev_footer_lines = footer_lines
+        self._screen.noutrefresh()
+        curses.doupdate()
+
+    def _add_str(self, y: int, x: int, text: str):
+        """Writes text at a position, skipping what doesn't fit on the screen"""
+        self._num_of_chars_drawn += len(text)
+
+        try:
+            self._screen.addstr(y, x, text)
+        except curses.error:
+            pass
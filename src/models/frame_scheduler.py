@@ -0,0 +1,120 @@
+from typing import Callable, Iterable, Iterator
+from src.constants import constants
+from threading import Event, Thread
+from queue import Queue, Full
+import time
+
+
+class FrameScheduler:
+    """
+    Paces frames at a target rate, decoupled from how long each frame takes to produce
+        - Frames are produced ahead (in a thread) into a bounded queue, producing blocks when it's full
+        - Frame N is due at an absolute deadline (start + N / rate) on a monotonic clock, so lateness never adds up
+        - When behind (slow to draw), overdue frames are dropped if a newer one is ready, producing isn't slowed down
+    """
+
+    # Dev notes:
+    #   - Iterate once, frames are yielded (on schedule) to the caller's thread
+    #   - Clock and sleep are injectable so tests can fake time
+
+    _END = object()  # queued after the last frame
+
+    def __init__(
+        self,
+        frames: Iterable,
+        updates_per_s: float,
+        max_queued: int = constants.FRAME_QUEUE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._frames = frames
+        self._interval_s = 1 / updates_per_s
+        self._queue: Queue = Queue(maxsize=max_queued)
+        self._clock = clock
+        self._sleep = sleep
+        self._stop_event = Event()
+        self._error: Exception | None = None
+        self._num_of_frames = 0
+        self._num_of_dropped_frames = 0
+        self._achieved_rate = 0.0
+
+    @property
+    def target_rate(self) -> float:
+        """Returns the target frames per second"""
+        return 1 / self._interval_s
+
+    @property
+    def achieved_rate(self) -> float:
+        """Returns the frames per second yielded so far (excluding dropped frames)"""
+        return self._achieved_rate
+
+    @property
+    def num_of_dropped_frames(self) -> int:
+        """Returns the number of frames dropped to catch up"""
+        return self._num_of_dropped_frames
+
+    def __iter__(self) -> Iterator:
+        producer = Thread(target=self._produce, daemon=True)
+        producer.start()
+
+        try:
+            yield from self._schedule()
+        finally:
+            self._stop_event.set()
+
+        if self._error:
+            raise self._error
+
+    def _schedule(self) -> Iterator:
+        """Yields each frame once it's due"""
+        start_s = self._clock()
+        deadline_s = start_s
+        item = self._queue.get()
+
+        while item is not self._END:
+            frame, item = item, None
+            deadline_s += self._interval_s
+            now_s = self._clock()
+
+            # Behind: skip to the newest frame that's ready while the next deadline has passed too
+            while now_s >= deadline_s + self._interval_s and not self._queue.empty():
+                item = self._queue.get_nowait()
+
+                if item is self._END:
+                    break
+
+                frame, item = item, None
+                deadline_s += self._interval_s
+                self._num_of_dropped_frames += 1
+
+            if now_s < deadline_s:
+                self._sleep(deadline_s - now_s)
+                now_s = deadline_s
+
+            self._num_of_frames += 1
+            self._achieved_rate = self._num_of_frames / (now_s - start_s)
+            yield frame
+
+            item = item if item is not None else self._queue.get()
+
+    def _produce(self):
+        """Produces all frames into the queue (runs in a thread), stops early if the schedule stops"""
+        try:
+            for frame in self._frames:
+                if not self._put(frame):
+                    return
+        except Exception as ex:
+            self._error = ex
+
+        self._put(self._END)
+
+    def _put(self, item) -> bool:
+        """Queues an item once there's room, returns False if the schedule stopped first"""
+        while not self._stop_event.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+
+        return False
@@ -0,0 +1,96 @@
+from src.constants import constants
+from tempfile import TemporaryFile
+from array import array
+import numpy as np
+import zlib
+import os
+
+
+class GenerationHistory:
+    """
+    Records every generation (matrix of cell codes) compactly, w random access to any of them (replay, export)
+        - Every 'keyframe_interval'th generation is a keyframe, stored whole
+        - Generations in between are stored as an XOR delta against their keyframe (mostly zeros, compresses well)
+        - Each record is zlib compressed and appended to a single (temporary) file, only the index is in memory
+    """
+
+    # Dev notes:
+    #   - Getting any generation decompresses at most 2 records (its keyframe + its delta), however long the history
+    #   - Deltas are against the keyframe (not the previous generation), so they never chain
+    #   - The last keyframe is also kept in memory, deltas are made w/o reading it back from the file
+    #   - All generations must be the same size (same as the first)
+
+    def __init__(
+        self,
+        keyframe_interval: int = constants.HISTORY_KEYFRAME_INTERVAL,
+        compression_level: int = constants.HISTORY_COMPRESSION_LEVEL,
+    ):
+        self._keyframe_interval = keyframe_interval
+        self._compression_level = compression_level
+        self._file = TemporaryFile(buffering=0)  # unbuffered, records are read back w pread as soon as they're written
+        self._offsets = array("q")  # of each record in the file (+ its end)
+        self._offsets.append(0)
+        self._shape: tuple[int, int] | None = None  # of the first generation's codes
+        self._keyframe: np.ndarray | None = None  # the last keyframe added
+
+    @property
+    def num_of_bytes(self) -> int:
+        """Returns the number of bytes stored (compressed, on disk)"""
+        return self._offsets[-1]
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """Gets a generation's codes by its index (in the order added, negative counts from the end)"""
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"Generation {index} is out of range (history has {len(self)})")
+
+        index %= len(self)
+        keyframe_index = index - index % self._keyframe_interval
+        res = self._read(keyframe_index)
+
+        if index != keyframe_index:
+            np.bitwise_xor(res, self._read(index), out=res)
+
+        return res
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def add(self, codes: np.ndarray):
+        """Adds the next generation (matrix of cell codes)"""
+        codes = np.ascontiguousarray(codes, dtype=np.uint8)
+
+        if self._shape is None:
+            self._shape = codes.shape
+
+        if codes.shape != self._shape:
+            raise ValueError(f"Generation is {codes.shape} cells, expected {self._shape} (same as the first generation)")
+
+        if len(self) % self._keyframe_interval == 0:
+            self._keyframe = codes.copy()
+            record = codes
+        else:
+            record = np.bitwise_xor(codes, self._keyframe)
+
+        self._file.write(zlib.compress(record.tobytes(), self._compression_level))
+        self._offsets.append(self._file.tell())
+
+    def close(self):
+        """Removes the stored generations"""
+        self._file.close()
+
+    def _read(self, index: int) -> np.ndarray:
+        """Reads a record (keyframe or delta) back from the file"""
+        start, end = self._offsets[index], self._offsets[index + 1]
+        data = zlib.decompress(os.pread(self._file.fileno(), end - start, start))
+        res = np.frombuffer(bytearray(data), dtype=np.uint8).reshape(self._shape)
+        return res
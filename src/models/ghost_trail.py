@@ -0,0 +1,72 @@
+from src.enums.cell_code import CellCode
+from src.constants import constants
+import numpy as np
+
+
+class GhostTrail:
+    """
+    Tracks how many generations ago each cell was last alive (its age) for ghost mode
+        - Age 0 = alive, ages 1..length fade through the ghost states (newest -> oldest), older = dead
+        - A single age per cell is updated in place each generation, no previous generations are kept
+    """
+
+    # Dev notes:
+    #   - Ages saturate at length + 1 (dead), so they fit in a uint8
+    #   - Trails longer than the 3 ghost states share each state across a run of ages
+
+    _ghost_codes = [CellCode.WELL_DONE, CellCode.MEDIUM, CellCode.RARE]  # newest -> oldest
+
+    def __init__(self, length: int = constants.DEFAULT_GHOST_LENGTH):
+        self._length = length
+        self._ages: np.ndarray | None = None  # started by the first update
+        self._codes_by_age = np.array(
+            [CellCode.ALIVE]
+            + [self._ghost_codes[(age - 1) * len(self._ghost_codes) // length] for age in range(1, length + 1)]
+            + [CellCode.DEAD],
+            dtype=np.uint8,
+        )
+
+    @property
+    def length(self) -> int:
+        """Returns the number of generations a dead cell is shown as a ghost"""
+        return self._length
+
+    @property
+    def ages(self) -> np.ndarray | None:
+        """Returns the generations since each cell was last alive (capped at length + 1), None if not started"""
+        return self._ages
+
+    @property
+    def codes(self) -> np.ndarray | None:
+        """Returns each cell's ghost code (see CellCode) looked up by its age, None if not started"""
+        if self._ages is None:
+            return None
+
+        return self._codes_by_age[self._ages]
+
+    def update(self, codes: np.ndarray):
+        """Ages every cell by a generation, alive cells (in the given codes) are reset to age 0"""
+        if self._ages is None or self._ages.shape != codes.shape:
+            self._ages = np.full(codes.shape, self._length + 1, dtype=np.uint8)
+
+        self._ages += self._ages <= self._length
+        self._ages[codes == CellCode.ALIVE] = 0
+
+    def shift(self, dx: int, dy: int):
+        """Moves every age (dx,dy) cells (e.g. the matrix's window moved the other way), cells moved in are dead"""
+        if self._ages is None or (dx, dy) == (0, 0):
+            return
+
+        rows, cols = self._ages.shape
+        shifted = np.full(self._ages.shape, self._length + 1, dtype=np.uint8)
+
+        if abs(dx) < cols and abs(dy) < rows:
+            shifted[max(dy, 0):rows + min(dy, 0), max(dx, 0):cols + min(dx, 0)] = (
+                self._ages[max(-dy, 0):rows + min(-dy, 0), max(-dx, 0):cols + min(-dx, 0)]
+            )
+
+        self._ages = shifted
+
+    def reset(self):
+        """Forgets all ages (the next update starts a new trail)"""
+        self._ages = None
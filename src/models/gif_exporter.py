@@ -0,0 +1,132 @@
+from src.models.gif_writer import GifWriter
+from src.constants import constants
+from queue import Full
+import multiprocessing
+import numpy as np
+import weakref
+import signal
+
+
+class GifExporter:
+    """
+    Exports a GIF in a background worker process (see GifWriter), so adding frames never waits on encoding
+        - Frames (cell codes) are sent to the worker through a bounded queue as they're added
+        - The worker writes each frame as it arrives, counting them (progress) in shared memory
+        - Once finished, the worker replays the frames backwards (BOOMERANG EFFECT) and ends the file
+        - Doesn't need curses, usable from a headless script
+        - Raises a RuntimeError (adding or finishing) once the worker has failed
+    """
+
+    _PUT_TIMEOUT_S = 0.1  # between checks the worker is still alive, while the queue is full
+
+    def __init__(
+        self,
+        path: str,
+        cell_size: int = constants.DEFAULT_GIF_CELL_SIZE,
+        is_boomerang: bool = True,
+        max_queued: int = constants.EXPORT_QUEUE_SIZE,
+    ):
+        self._path = path
+        self._num_of_frames_added = 0
+        self._is_finishing = False
+
+        # Spawn (not fork) as the app may be running other threads
+        context = multiprocessing.get_context("spawn")
+        self._queue = context.Queue(maxsize=max_queued)
+        self._num_of_frames_written = context.Value("q", 0)
+        self._process = context.Process(
+            target=_export,
+            args=(path, cell_size, is_boomerang, self._queue, self._num_of_frames_written),
+            daemon=True,
+        )
+        self._process.start()
+
+        # Always finish the file, even if finish() is never called
+        self._finalizer = weakref.finalize(self, _release, self._process, self._queue)
+
+    @property
+    def path(self) -> str:
+        """Returns the GIF's path"""
+        return self._path
+
+    @property
+    def num_of_frames_added(self) -> int:
+        """Returns the number of frames added (sent to the worker)"""
+        return self._num_of_frames_added
+
+    @property
+    def num_of_frames_written(self) -> int:
+        """Returns the number of frames the worker has written so far (progress)"""
+        return self._num_of_frames_written.value
+
+    @property
+    def is_done(self) -> bool:
+        """Returns True once the file is finished (the worker has exited)"""
+        return self._is_finishing and not self._process.is_alive()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.finish()
+
+    def add(self, codes: np.ndarray):
+        """Sends a frame (matrix of cell codes) to the worker, waits if too many frames are queued"""
+        if self._is_finishing:
+            raise RuntimeError("Can't add frames to a GIF that is finishing")
+
+        self._put(codes)
+        self._num_of_frames_added += 1
+
+    def finish(self, timeout_s: float | None = None) -> bool:
+        """
+        Tells the worker no more frames are coming, returns True once the file is finished
+            - Waits up to 'timeout_s' seconds (forever if None), call again to keep waiting
+        """
+        if not self._is_finishing:
+            self._is_finishing = True
+            self._put(None)
+
+        self._process.join(timeout_s)
+        self._raise_if_failed()
+        return self.is_done
+
+    def _put(self, codes: np.ndarray | None):
+        """Queues a frame (or None to finish), waiting while the queue is full unless the worker has failed"""
+        while True:
+            self._raise_if_failed()
+
+            try:
+                self._queue.put(codes, timeout=self._PUT_TIMEOUT_S)
+                return
+            except Full:
+                continue
+
+    def _raise_if_failed(self):
+        """Raises a RuntimeError if the worker has exited w an error"""
+        if self._process.exitcode not in (None, 0):
+            raise RuntimeError(f"GIF export failed (worker exit code {self._process.exitcode})")
+
+
+def _release(process, queue):
+    """Finishes the file (if not already) and stops the worker"""
+    if process.is_alive():
+        queue.put(None)
+        process.join()
+
+    # Nothing reads what's left queued after the worker exits (e.g. it failed), don't wait to flush it
+    queue.cancel_join_thread()
+    queue.close()
+
+
+def _export(path: str, cell_size: int, is_boomerang: bool, queue, num_of_frames_written):
+    """Writes each queued frame until told to finish (None), runs in the worker process"""
+    # Ctrl-C reaches every process in the terminal's group, the main process decides when the file is finished
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    with GifWriter(path, cell_size, is_boomerang) as gif_writer:
+        while (codes := queue.get()) is not None:
+            gif_writer.add(codes)
+
+            with num_of_frames_written.get_lock():
+                num_of_frames_written.value += 1
@@ -0,0 +1,162 @@
+from src.utils.gif_utils import convert_to_img, get_cells_offset, FRAME_DURATION
+from PIL import GifImagePlugin
+from src.constants import constants
+from tempfile import TemporaryFile
+import numpy as np
+import os
+
+
+class GifWriter:
+    """
+    Writes a GIF one frame at a time (streamed), instead of holding every frame in memory
+        - Identical consecutive frames are merged into 1 frame that's shown for longer
+        - After the first frame, only the box of cells that changed is painted, encoded and drawn over the last frame
+        - Frames are also kept (as raw cell codes) in a temporary on-disk store, to replay them backwards
+        - Closing replays the store backwards (BOOMERANG EFFECT) and ends the file (removed if no frames were added)
+    """
+
+    # Dev notes:
+    #   - A frame is written once a different frame is added (til then, it may still be shown for longer)
+    #   - All frames must be the same size, the store is fixed size records (codes + number of repeats)
+    #   - Only a couple of frames are in memory at a time, however many frames are written
+    #   - Frames are drawn over the last (disposal 1 = "do not dispose"), so unchanged pixels are kept
+    #   - Frames shown for longer than a GIF delay can hold are split into several frames
+
+    _DISPOSAL = 1
+    _MAX_DURATION_MS = 65535 * 10  # a frame's delay is stored as 16-bit centiseconds
+
+    def __init__(
+        self,
+        path: str,
+        cell_size: int = constants.DEFAULT_GIF_CELL_SIZE,
+        is_boomerang: bool = True,
+    ):
+        self._path = path
+        self._file = open(path, "wb")
+        self._store = TemporaryFile() if is_boomerang else None
+        self._cell_size = cell_size
+        self._shape: tuple[int, int] | None = None  # of the first frame's codes
+        self._num_of_frames = 0
+        self._num_of_frames_written = 0
+        self._pending_codes: np.ndarray | None = None  # the last frame added, not yet written
+        self._pending_repeats = 0
+        self._prev_written_codes: np.ndarray | None = None  # what's currently drawn
+
+    @property
+    def num_of_frames(self) -> int:
+        """Returns the number of frames added"""
+        return self._num_of_frames
+
+    @property
+    def num_of_frames_written(self) -> int:
+        """Returns the number of frames written to the file (identical consecutive frames are merged)"""
+        return self._num_of_frames_written
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def add(self, codes: np.ndarray):
+        """Adds a frame (matrix of cell codes), the previous frame is written if this one is different"""
+        codes = np.ascontiguousarray(codes, dtype=np.uint8)
+
+        if self._shape is None:
+            self._shape = codes.shape
+            self._write_header(codes)
+
+        if codes.shape != self._shape:
+            raise ValueError(f"Frame is {codes.shape} cells, expected {self._shape} (same as the first frame)")
+
+        self._num_of_frames += 1
+
+        if self._pending_codes is not None and np.array_equal(codes, self._pending_codes):
+            self._pending_repeats += 1
+            return
+
+        if self._pending_codes is not None:
+            self._write_frame(self._pending_codes, self._pending_repeats)
+            self._store_frame(self._pending_codes, self._pending_repeats)
+
+        self._pending_codes = codes.copy()
+        self._pending_repeats = 1
+
+    def close(self):
+        """Writes the last frame, replays the frames backwards (if boomerang) and ends the file"""
+        if self._file.closed:
+            return
+
+        try:
+            if self._pending_codes is not None:
+                # Going backwards starts w the last frame's repeats (minus itself), merged into the last frame
+                repeats = 2 * self._pending_repeats - 1 if self._store else self._pending_repeats
+                self._write_frame(self._pending_codes, repeats)
+
+            if self._pending_codes is not None and self._store:
+                self._replay_backwards()
+
+            if self._shape is not None:
+                self._file.write(b";")  # trailer
+        finally:
+            self._file.close()
+
+            if self._store:
+                self._store.close()
+
+        if self._shape is None:
+            os.remove(self._path)
+
+    def _store_frame(self, codes: np.ndarray, repeats: int):
+        """Adds a frame (and its number of repeats) to the end of the store"""
+        if self._store:
+            self._store.write(codes.tobytes() + repeats.to_bytes(4, "little"))
+
+    def _replay_backwards(self):
+        """Writes every stored frame, from newest to oldest"""
+        num_of_cells = self._shape[0] * self._shape[1]
+        record_size = num_of_cells + 4
+        num_of_records = self._store.seek(0, os.SEEK_END) // record_size
+
+        for idx in range(num_of_records - 1, -1, -1):
+            self._store.seek(idx * record_size)
+            record = self._store.read(record_size)
+            codes = np.frombuffer(record[:num_of_cells], dtype=np.uint8).reshape(self._shape)
+            self._write_frame(codes, int.from_bytes(record[num_of_cells:], "little"))
+
+    def _write_header(self, codes: np.ndarray):
+        """Writes the GIF header (w the palette and loop forever)"""
+        header, _ = GifImagePlugin.getheader(convert_to_img(codes, self._cell_size), info={"loop": 0})
+        self._file.write(b"".join(header))
+
+    def _write_frame(self, codes: np.ndarray, repeats: int):
+        """Writes a frame shown for 'repeats' frames, split into as many frames as the max GIF delay needs"""
+        max_repeats = self._MAX_DURATION_MS // FRAME_DURATION
+
+        while repeats > 0:
+            self._write_frame_data(codes, min(repeats, max_repeats))
+            repeats -= max_repeats
+
+    def _write_frame_data(self, codes: np.ndarray, repeats: int):
+        """Writes a frame shown for 'repeats' frames, only the box of cells that changed (after the first frame)"""
+        if self._prev_written_codes is None:
+            img = convert_to_img(codes, self._cell_size)
+            offset = (0, 0)
+        else:
+            is_changed = codes != self._prev_written_codes
+            ys = np.flatnonzero(is_changed.any(axis=1))
+            xs = np.flatnonzero(is_changed.any(axis=0))
+
+            if not ys.size:
+                ys = xs = np.zeros(1, dtype=np.intp)  # nothing changed (a split frame), redraws 1 cell to hold it
+
+            y0, y1, x0, x1 = ys[0], ys[-1] + 1, xs[0], xs[-1] + 1
+            cells_offset = get_cells_offset(self._cell_size)
+
+            img = convert_to_img(codes[y0:y1, x0:x1], self._cell_size, is_bordered=False)
+            offset = (int(cells_offset + x0 * self._cell_size), int(cells_offset + y0 * self._cell_size))
+
+        data = GifImagePlugin.getdata(img, offset, duration=FRAME_DURATION * repeats, disposal=self._DISPOSAL)
+        self._file.write(b"".join(data))
+        self._prev_written_codes = codes
+        self._num_of_frames_written += 1
@@ -0,0 +1,434 @@
+from src.enums.neighbourhood import Neighbourhood
+from src.utils.hash_utils import get_fingerprint
+from src.models.cell_matrix import CellMatrix
+from src.enums.cell_state import CellState
+from src.enums.cell_code import CellCode
+from src.constants import constants
+from src.enums.engine import Engine
+import numpy as np
+import random
+
+
+class _Node:
+    """
+    A square of 2^level x 2^level cells, made of 4 quadrant nodes (1 level lower)
+        - Nodes are canonical (one node per unique square) so they can be compared/memoised by identity
+        - Level 0 nodes are single cells (population 0 or 1)
+        - A node's fingerprint (hash of its cells) is only computed when needed, then kept (see HashLifeMatrix._get_fingerprint)
+    """
+
+    __slots__ = ("level", "nw", "ne", "sw", "se", "population", "fingerprint")
+
+    def __init__(self, level: int, nw, ne, sw, se, population: int):
+        self.level = level
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.population = population
+        self.fingerprint: int | None = None
+
+
+class HashLifeMatrix(CellMatrix):
+    """
+    Represents cells on an unbounded plane, evolved w the HashLife algorithm
+        - Cells are stored in a quadtree of canonical nodes
+        - The result of evolving each node is memoised, so repeating patterns are only ever computed once
+        - Can jump 2^k generations at a time (see advance)
+        - Only supports Moore radius 1 rules (counts 0..8)
+        - The matrix (rows x cols from 0,0) is a window onto the plane, the plane never wraps
+    """
+
+    # Dev notes:
+    #   - The root node is always centred on (0,0), a node of level L covers -2^(L-1) <= x,y < 2^(L-1)
+    #   - Quadrants: nw = top left, ne = top right, sw = bottom left, se = bottom right
+    #   - _successor(node, j) returns the centre (half the size) of a node, 2^j generations later
+    #   - Caches are bounded, when full only the nodes reachable from the root are kept (see _collect_garbage)
+    #   - A pattern outgrowing the cap raises it, otherwise every jump would collect (and recompute) everything
+
+    _OFF = _Node(0, None, None, None, None, 0)
+    _ON = _Node(0, None, None, None, None, 1)
+
+    def __init__(
+        self,
+        seed: list[tuple[int, int]] | np.ndarray | None = None,
+        radius: int = 1,
+        random: int = 50,
+        cols: int = 11,
+        rows: int = 11,
+        is_wrap: bool = False,
+        survival_rule: set = {2, 3},
+        resurrection_rule: set = {3},
+        neighbourhood: Neighbourhood = Neighbourhood.MOORE,
+        engine: Engine = Engine.HASHLIFE,
+        workers: int = 1,  # unused, mutates in a single process
+    ):
+        self._random = random
+        self._is_wrap = is_wrap
+        self._survive_rule = survival_rule
+        self._resurrect_rule = resurrection_rule
+        self._neighbourhood = neighbourhood
+        self._radius = radius
+        self._engine = engine
+        self._rows = rows
+        self._cols = cols
+        self._nodes: dict[tuple[_Node, _Node, _Node, _Node], _Node] = {}
+        self._successors: dict[tuple[_Node, int], _Node] = {}
+        self._empty_nodes: list[_Node] = [self._OFF]
+        self._max_nodes = constants.HASHLIFE_MAX_NODES  # collects garbage once there are more nodes (see _collect_garbage)
+        self._root = self._get_empty_node(3)
+        self.apply_cells(seed) if seed is not None else self.apply_random_cells()  # empty = no cells
+
+    @property
+    def rows(self):
+        """Get the number of rows (Y-axis count aka height)"""
+        return self._rows
+
+    @property
+    def cols(self):
+        """Get the number of cols (X-axis count aka width)"""
+        return self._cols
+
+    @property
+    def population(self) -> int:
+        """Returns the number of alive cells on the entire plane"""
+        return self._root.population
+
+    @property
+    def fingerprint(self) -> int:
+        """
+        Returns a 64-bit hash of the alive cells on the entire plane (same alive cells = same fingerprint)
+            - Hashes the smallest (centred) node holding every alive cell, so the same cells hash the same at any root size
+            - Only nodes new since the last fingerprint are hashed, not every cell
+        """
+        node = self._root
+
+        while node.level > 3 and self._get_inner(node).population == node.population:
+            node = self._get_inner(node)
+
+        return self._get_fingerprint(node)
+
+    @property
+    def matrix(self):
+        """Returns the matrix (window onto the plane) of cell states"""
+        res = [[CellState.DEAD.value for _ in range(self._cols)] for _ in range(self._rows)]
+
+        for x, y in self._get_cells(self._root, *self._get_root_origin(), is_window_only=True):
+            res[y][x] = CellState.ALIVE.value
+
+        return res
+
+    @property
+    def codes(self):
+        """Returns the matrix (window onto the plane) of cell codes"""
+        res = [[CellCode.DEAD.value for _ in range(self._cols)] for _ in range(self._rows)]
+        code = CellCode.ALIVE.value
+
+        for x, y in self._get_cells(self._root, *self._get_root_origin(), is_window_only=True):
+            res[y][x] = code
+
+        return res
+
+    @property
+    def as_str(self):
+        """Returns the matrix in string format"""
+        res = "\n".join(["".join(row) for row in self.matrix])
+        return res
+
+    @property
+    def alive_cell_coords(self):
+        """Returns the coordinates for the alive cells (in the matrix)"""
+        cells = self._get_cells(self._root, *self._get_root_origin(), is_window_only=True)
+        return sorted(cells, key=lambda cell: (cell[1], cell[0]))  # rows first, same as CellMatrix
+
+    @property
+    def plane_cell_coords(self):
+        """Returns the coordinates for all alive cells, including any outside the matrix"""
+        cells = self._get_cells(self._root, *self._get_root_origin())
+        return sorted(cells, key=lambda cell: (cell[1], cell[0]))  # rows first, same as CellMatrix
+
+    def change_state(
+        self,
+        new_state: CellState,
+        old_state: CellState | None = None
+    ):
+        """
+        If no old state is specified, the new state will be applied to all cells that are NOT dead
+
+        NOTE: Only alive/dead cells are stored, alive cells changed to any other state can't mutate (same as CellMatrix)
+        so they're cleared, dead cells always stay dead
+        """
+        is_alive_changed = (old_state is None or old_state == CellState.ALIVE) and new_state != CellState.ALIVE
+
+        if is_alive_changed:
+            self._root = self._get_empty_node(3)
+
+    def apply_cells(
+        self,
+        cells: list[tuple[int, int]] | np.ndarray,
+        state: CellState = CellState.ALIVE
+    ):
+        """Adds given cells to the plane (unbounded, cells outside the matrix are kept)"""
+        alive_cells = set(self._get_cells(self._root, *self._get_root_origin()))
+        coords = map(tuple, np.asarray(cells, dtype=np.int64).reshape(-1, 2).tolist())
+
+        if state == CellState.DEAD:
+            alive_cells.difference_update(coords)
+        else:
+            alive_cells.update(coords)
+
+        self._root = self._build_root(alive_cells)
+
+    def apply_random_cells(self, state: CellState = CellState.ALIVE):
+        """Randomly creates cells with a given state (in the matrix)"""
+        cells: list[tuple[int, int]] = []
+
+        for y in range(self._rows):
+            for x in range(self._cols):
+                random_percent = random.randint(0, 100)  # %
+                if random_percent <= self._random:
+                    cells.append((x, y))
+
+        self.apply_cells(cells, state)
+
+    def mutate(self):
+        """Mutates the current cell matrix"""
+        self.advance(1)
+
+    def advance(self, generations: int):
+        """
+        Jumps forward a number of generations without computing the generations in between
+            - Breaks the count into powers of 2 (one jump per bit)
+            - Before a jump of 2^j, pads the root w empty space so cells can't travel out of it
+        """
+        j = 0
+
+        while generations > 0:
+            if generations & 1:
+                root = self._root
+
+                while root.level < j + 2:
+                    root = self._centre(root)
+
+                root = self._centre(self._centre(root))
+                self._root = self._crop(self._successor(root, j))
+
+                if len(self._nodes) > self._max_nodes:
+                    self._collect_garbage()
+
+            generations >>= 1
+            j += 1
+
+    def _join(self, nw: _Node, ne: _Node, sw: _Node, se: _Node) -> _Node:
+        """Returns the canonical node for the given quadrants"""
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+
+        if node is None:
+            population = nw.population + ne.population + sw.population + se.population
+            node = _Node(nw.level + 1, nw, ne, sw, se, population)
+            self._nodes[key] = node
+
+        return node
+
+    def _get_empty_node(self, level: int) -> _Node:
+        """Returns the canonical node w no alive cells"""
+        while len(self._empty_nodes) <= level:
+            empty = self._empty_nodes[-1]
+            self._empty_nodes.append(self._join(empty, empty, empty, empty))
+
+        return self._empty_nodes[level]
+
+    def _centre(self, node: _Node) -> _Node:
+        """Returns the node surrounded by empty space (1 level higher, same centre)"""
+        empty = self._get_empty_node(node.level - 1)
+
+        return self._join(
+            self._join(empty, empty, empty, node.nw),
+            self._join(empty, empty, node.ne, empty),
+            self._join(empty, node.sw, empty, empty),
+            self._join(node.se, empty, empty, empty),
+        )
+
+    def _get_inner(self, node: _Node) -> _Node:
+        """Returns the centre of a node (1 level lower, same centre)"""
+        return self._join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def _crop(self, node: _Node) -> _Node:
+        """Shrinks the node while all of its alive cells fit in its centre"""
+        while node.level > 3 and self._get_inner(self._get_inner(node)).population == node.population:
+            node = self._get_inner(node)
+
+        return node
+
+    def _successor(self, node: _Node, j: int) -> _Node:
+        """Returns the centre of a node (1 level lower), 2^j generations later (j <= level - 2)"""
+        if node.population == 0:
+            return node.nw
+
+        key = (node, j)
+        res = self._successors.get(key)
+
+        if res is not None:
+            return res
+
+        if node.level == 2:
+            res = self._mutate_4x4(node)
+        else:
+            j = min(j, node.level - 2)
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+
+            # 9 overlapping sub-squares (half the size), each advanced (up to) 2^(j-1) generations
+            c1 = self._successor(self._join(nw.nw, nw.ne, nw.sw, nw.se), j)
+            c2 = self._successor(self._join(nw.ne, ne.nw, nw.se, ne.sw), j)
+            c3 = self._successor(self._join(ne.nw, ne.ne, ne.sw, ne.se), j)
+            c4 = self._successor(self._join(nw.sw, nw.se, sw.nw, sw.ne), j)
+            c5 = self._successor(self._join(nw.se, ne.sw, sw.ne, se.nw), j)
+            c6 = self._successor(self._join(ne.sw, ne.se, se.nw, se.ne), j)
+            c7 = self._successor(self._join(sw.nw, sw.ne, sw.sw, sw.se), j)
+            c8 = self._successor(self._join(sw.ne, se.nw, sw.se, se.sw), j)
+            c9 = self._successor(self._join(se.nw, se.ne, se.sw, se.se), j)
+
+            if j < node.level - 2:
+                # Sub-squares are already 2^j generations later, stitch their centres together
+                res = self._join(
+                    self._join(c1.se, c2.sw, c4.ne, c5.nw),
+                    self._join(c2.se, c3.sw, c5.ne, c6.nw),
+                    self._join(c4.se, c5.sw, c7.ne, c8.nw),
+                    self._join(c5.se, c6.sw, c8.ne, c9.nw),
+                )
+            else:
+                # Sub-squares are 2^(j-1) generations later, advance them another 2^(j-1) generations
+                res = self._join(
+                    self._successor(self._join(c1, c2, c4, c5), j),
+                    self._successor(self._join(c2, c3, c5, c6), j),
+                    self._successor(self._join(c4, c5, c7, c8), j),
+                    self._successor(self._join(c5, c6, c8, c9), j),
+                )
+
+        self._successors[key] = res
+        return res
+
+    def _mutate_4x4(self, node: _Node) -> _Node:
+        """Returns the centre 2x2 cells of a 4x4 node, 1 generation later (base case)"""
+        rows = [
+            [node.nw.nw, node.nw.ne, node.ne.nw, node.ne.ne],
+            [node.nw.sw, node.nw.se, node.ne.sw, node.ne.se],
+            [node.sw.nw, node.sw.ne, node.se.nw, node.se.ne],
+            [node.sw.sw, node.sw.se, node.se.sw, node.se.se],
+        ]
+        next_cells: list[_Node] = []
+
+        for y in (1, 2):
+            for x in (1, 2):
+                num_of_alive_neighbours = sum(
+                    rows[y + dy][x + dx].population
+                    for dy in (-1, 0, 1)
+                    for dx in (-1, 0, 1)
+                    if (dx, dy) != (0, 0)
+                )
+                rule = self._survive_rule if rows[y][x].population else self._resurrect_rule
+                next_cells.append(self._ON if num_of_alive_neighbours in rule else self._OFF)
+
+        return self._join(*next_cells)
+
+    def _collect_garbage(self):
+        """
+        Forgets all memoised results and keeps only the nodes reachable from the root
+            - If the nodes kept fill most of the cap, the pattern has outgrown it (collecting every jump would recompute
+              everything), so the max is raised to twice the nodes there were, back to the cap once the pattern shrinks
+        """
+        num_of_nodes = len(self._nodes)
+        self._successors = {}
+        self._nodes = {}
+        self._empty_nodes = [self._OFF]
+        stack = [self._root]
+
+        while stack:
+            node = stack.pop()
+            if node.level == 0:
+                continue
+
+            key = (node.nw, node.ne, node.sw, node.se)
+            if key not in self._nodes:
+                self._nodes[key] = node
+                stack.extend(key)
+
+        is_cap_outgrown = len(self._nodes) > constants.HASHLIFE_MAX_NODES // 2
+        self._max_nodes = 2 * num_of_nodes if is_cap_outgrown else constants.HASHLIFE_MAX_NODES
+
+    def _get_fingerprint(self, node: _Node) -> int:
+        """Returns a node's 64-bit hash (of its level + its quadrants' hashes), computed once per node"""
+        if node.fingerprint is None:
+            if node.level == 0:
+                data = bytes([node.population])
+            else:
+                quadrants = (node.nw, node.ne, node.sw, node.se)
+                data = bytes([node.level]) + b"".join(self._get_fingerprint(q).to_bytes(8, "little") for q in quadrants)
+
+            node.fingerprint = get_fingerprint(data)
+
+        return node.fingerprint
+
+    def _get_root_origin(self) -> tuple[int, int]:
+        """Returns the (x,y) of the top left cell of the root"""
+        half = -(1 << (self._root.level - 1))
+        return half, half
+
+    def _get_cells(self, node: _Node, x: int, y: int, is_window_only: bool = False) -> list[tuple[int, int]]:
+        """Returns the alive cells in a node (whose top left cell is x,y), skipping empty nodes"""
+        res: list[tuple[int, int]] = []
+        stack = [(node, x, y)]
+
+        while stack:
+            node, x, y = stack.pop()
+            size = 1 << node.level
+
+            if node.population == 0:
+                continue
+            if is_window_only and (x >= self._cols or y >= self._rows or x + size <= 0 or y + size <= 0):
+                continue
+            if node.level == 0:
+                res.append((x, y))
+                continue
+
+            half = size >> 1
+            stack.extend([
+                (node.nw, x, y),
+                (node.ne, x + half, y),
+                (node.sw, x, y + half),
+                (node.se, x + half, y + half),
+            ])
+
+        return res
+
+    def _build_root(self, cells: set[tuple[int, int]]) -> _Node:
+        """Builds a root node (centred on 0,0) holding the given alive cells"""
+        level = 3
+        extent = max((max(-x, x + 1, -y, y + 1) for x, y in cells), default=0)  # -extent <= x,y < extent
+
+        while (1 << (level - 1)) < extent:
+            level += 1
+
+        half = 1 << (level - 1)
+        return self._build(list(cells), level, -half, -half)
+
+    def _build(self, cells: list[tuple[int, int]], level: int, x: int, y: int) -> _Node:
+        """Builds a node (whose top left cell is x,y) holding the given alive cells"""
+        if not cells:
+            return self._get_empty_node(level)
+        if level == 0:
+            return self._ON
+
+        half = 1 << (level - 1)
+        quadrants: list[list[tuple[int, int]]] = [[], [], [], []]
+
+        for cell in cells:
+            quadrants[(cell[1] >= y + half) * 2 + (cell[0] >= x + half)].append(cell)
+
+        return self._join(
+            self._build(quadrants[0], level - 1, x, y),
+            self._build(quadrants[1], level - 1, x + half, y),
+            self._build(quadrants[2], level - 1, x, y + half),
+            self._build(quadrants[3], level - 1, x + half, y + half),
+        )
@@ -0,0 +1,141 @@
+from src.utils.numpy_utils import count_alive_neighbours, apply_rules
+from multiprocessing.shared_memory import SharedMemory
+from src.enums.neighbourhood import Neighbourhood
+import multiprocessing
+import numpy as np
+import weakref
+import sys
+
+# Boards (shared memory) attached by each worker process, see _init_worker
+_worker_boards: list[np.ndarray] = []
+_worker_memory: list[SharedMemory] = []
+_worker_settings: dict = {}
+
+
+class ParallelStepper:
+    """
+    Mutates a uint8 board (1 = alive, 0 = dead) across a pool of worker processes
+        - The board is split into horizontal stripes, 1 per worker
+        - Workers read their stripe + the rows around it (radius-r "halo"), wrapping top/bottom if wrap mode
+        - 2 boards live in shared memory (double buffering), workers read one and write the other
+        - Nothing is copied between processes besides the stripe bounds
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        workers: int,
+        neighbourhood: Neighbourhood,
+        radius: int,
+        is_wrap: bool,
+        survival_rule: set[int],
+        resurrection_rule: set[int],
+    ):
+        self._memory = [SharedMemory(create=True, size=rows * cols) for _ in range(2)]
+        self._boards = [np.ndarray((rows, cols), dtype=np.uint8, buffer=m.buf) for m in self._memory]
+        self._curr_idx = 0
+        self._stripes = [(int(s[0]), int(s[-1]) + 1) for s in np.array_split(np.arange(rows), workers) if len(s)]
+
+        settings = {
+            "neighbourhood": neighbourhood,
+            "radius": radius,
+            "is_wrap": is_wrap,
+            "survival_rule": survival_rule,
+            "resurrection_rule": resurrection_rule,
+        }
+
+        # Spawn (not fork) as the app may be running other threads
+        context = multiprocessing.get_context("spawn")
+        self._pool = context.Pool(
+            processes=len(self._stripes),
+            initializer=_init_worker,
+            initargs=([m.name for m in self._memory], rows, cols, settings),
+        )
+
+        # Always release the pool + shared memory, even if close() is never called
+        self._finalizer = weakref.finalize(self, _release, self._pool, self._memory)
+
+    @property
+    def board(self) -> np.ndarray:
+        """Returns the current board (a view onto shared memory, copy to keep it)"""
+        return self._boards[self._curr_idx]
+
+    @board.setter
+    def board(self, board: np.ndarray):
+        self._boards[self._curr_idx][:] = board
+
+    def mutate(self):
+        """Mutates the current board (each worker mutates its stripe into the other board)"""
+        self._pool.starmap(_mutate_stripe, [(self._curr_idx, start, stop) for start, stop in self._stripes])
+        self._curr_idx ^= 1
+
+    def close(self):
+        """Stops the workers and frees the shared memory"""
+        self._boards = []
+        self._finalizer()
+
+    @staticmethod
+    def is_supported(rows: int, radius: int, is_wrap: bool) -> bool:
+        """
+        Halo rows are gathered per stripe
+            - Wrapping a board shorter than the neighbourhood would count the same row more than once
+        """
+        return not is_wrap or 2 * radius + 1 <= rows
+
+
+def _release(pool, memory: list[SharedMemory]):
+    """Stops the pool and frees the shared memory"""
+    pool.terminate()
+
+    for m in memory:
+        m.close()
+        m.unlink()
+
+
+def _init_worker(names: list[str], rows: int, cols: int, settings: dict):
+    """Attaches the worker process to the shared memory boards"""
+    _worker_memory.extend(_attach_memory(name) for name in names)
+    _worker_boards.extend(np.ndarray((rows, cols), dtype=np.uint8, buffer=m.buf) for m in _worker_memory)
+    _worker_settings.update(settings)
+
+
+def _attach_memory(name: str) -> SharedMemory:
+    """
+    Attaches to shared memory owned (unlinked) by the main process
+        - Python 3.13+ can skip tracking it, before that spawned workers share the main process's resource tracker,
+          where it's already registered (and unregistered once unlinked)
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+
+    return SharedMemory(name=name)
+
+
+def _mutate_stripe(curr_idx: int, start: int, stop: int):
+    """Mutates rows start..stop (exclusive) of the current board into the other board"""
+    radius = _worker_settings["radius"]
+    is_wrap = _worker_settings["is_wrap"]
+    board = _worker_boards[curr_idx]
+    next_board = _worker_boards[curr_idx ^ 1]
+    rows = board.shape[0]
+
+    # Stripe + halo rows, out of bounds rows are dead unless wrapped
+    halo_ys = np.arange(start - radius, stop + radius)
+
+    if is_wrap:
+        stripe = board[halo_ys % rows]
+    else:
+        is_in_bounds = (0 <= halo_ys) & (halo_ys < rows)
+        stripe = np.zeros((len(halo_ys), board.shape[1]), dtype=np.uint8)
+        stripe[is_in_bounds] = board[halo_ys[is_in_bounds]]
+
+    # Halo rows hold the neighbours of the stripe's rows, any (wrapped) counts for the halo rows themselves are cropped
+    counts = count_alive_neighbours(stripe, _worker_settings["neighbourhood"], radius, is_wrap)[radius:radius + stop - start]
+
+    next_board[start:stop] = apply_rules(
+        board[start:stop],
+        counts,
+        _worker_settings["survival_rule"],
+        _worker_settings["resurrection_rule"],
+    )
@@ -0,0 +1,149 @@
+from src.constants import constants
+from contextlib import contextmanager
+from time import perf_counter
+from array import array
+import numpy as np
+import threading
+import tracemalloc
+import json
+import os
+
+
+class Profiler:
+    """
+    Records how long each phase of a run takes (every time it runs), to see where a slow run's time goes
+        - Phases are named (e.g. "mutate", "draw"), timed w 'phase' or added w 'add'
+        - Counters (e.g. population) are recorded per generation w 'count'
+        - Optionally traces memory (tracemalloc), recording the net bytes each phase allocates (negative if it frees more)
+        - Optionally keeps every event, to be written as a Chrome trace (chrome://tracing, Perfetto)
+    """
+
+    # Dev notes:
+    #   - Phases may run in different threads (stepping ahead vs drawing), each is recorded against its own thread
+    #   - tracemalloc's counts are process wide, so a phase's allocations include any other thread's at the same time
+    #   - Durations are kept in arrays of floats (not objects), so recording costs little and holds little memory
+
+    def __init__(self, is_tracing_memory: bool = False, is_keeping_events: bool = False):
+        self._is_tracing_memory = is_tracing_memory
+        self._is_keeping_events = is_keeping_events
+        self._durations_s: dict[str, array] = {}
+        self._allocated_bytes: dict[str, array] = {}
+        self._counters: dict[str, int] = {}
+        self._events: list[dict] = []
+        self._start_s = perf_counter()
+        self._is_tracemalloc_started = is_tracing_memory and not tracemalloc.is_tracing()
+
+        if self._is_tracemalloc_started:
+            tracemalloc.start()
+
+    @property
+    def phases(self) -> list[str]:
+        """Returns the names of the phases recorded (in the order first seen)"""
+        return list(self._durations_s)
+
+    @property
+    def counters(self) -> dict[str, int]:
+        """Returns the latest value of each counter"""
+        return dict(self._counters)
+
+    @contextmanager
+    def phase(self, name: str):
+        """Times (and traces the memory of) the code run inside, as a phase"""
+        allocated_bytes = tracemalloc.get_traced_memory()[0] if self._is_tracing_memory else 0
+        start_s = perf_counter()
+
+        try:
+            yield
+        finally:
+            end_s = perf_counter()
+
+            if self._is_tracing_memory:
+                self._allocated_bytes.setdefault(name, array("q")).append(tracemalloc.get_traced_memory()[0] - allocated_bytes)
+
+            self.add(name, start_s, end_s)
+
+    def add(self, name: str, start_s: float, end_s: float):
+        """Adds a phase that's already been timed (perf_counter seconds), e.g. time spent waiting between 2 points"""
+        self._durations_s.setdefault(name, array("d")).append(end_s - start_s)
+
+        if self._is_keeping_events:
+            self._events.append({
+                "name": name,
+                "ph": "X",
+                "ts": (start_s - self._start_s) * 1_000_000,
+                "dur": (end_s - start_s) * 1_000_000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            })
+
+    def count(self, name: str, value: int):
+        """Records a counter's value (e.g. population per generation)"""
+        self._counters[name] = value
+
+        if self._is_keeping_events:
+            self._events.append({
+                "name": name,
+                "ph": "C",
+                "ts": (perf_counter() - self._start_s) * 1_000_000,
+                "pid": os.getpid(),
+                "args": {name: value},
+            })
+
+    def get_summary(self) -> dict[str, dict]:
+        """Gets each phase's stats (calls, p50/p95/max/total ms and mean KiB allocated if tracing memory)"""
+        res = {}
+
+        for name, durations_s in self._durations_s.items():
+            durations_ms = np.frombuffer(durations_s, dtype=np.float64) * 1000
+            p50_ms, p95_ms = np.percentile(durations_ms, [50, 95])
+            res[name] = {
+                "calls": len(durations_ms),
+                "p50_ms": round(float(p50_ms), 3),
+                "p95_ms": round(float(p95_ms), 3),
+                "max_ms": round(float(durations_ms.max()), 3),
+                "total_ms": round(float(durations_ms.sum()), 3),
+            }
+
+            if name in self._allocated_bytes:
+                res[name]["mean_alloc_kib"] = round(float(np.mean(self._allocated_bytes[name])) / 1024, 1)
+
+        return res
+
+    def get_summary_lines(self) -> list[str]:
+        """Gets the summary as a table (1 line per phase)"""
+        summary = self.get_summary()
+        is_alloc = any("mean_alloc_kib" in stats for stats in summary.values())
+        res = [f"{'phase':<12} {'calls':>7} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'total ms':>10}" + (f" {'alloc KiB':>10}" if is_alloc else "")]
+
+        for name, stats in summary.items():
+            line = f"{name:<12} {stats['calls']:>7} {stats['p50_ms']:>9.3f} {stats['p95_ms']:>9.3f} {stats['max_ms']:>9.3f} {stats['total_ms']:>10.1f}"
+            res.append(line + (f" {stats.get('mean_alloc_kib', 0):>10.1f}" if is_alloc else ""))
+
+        return res
+
+    def get_overlay_lines(self, line_width: int = 0) -> list[str]:
+        """Gets the recent mean ms of each phase (+ counters) as short lines, for a live overlay"""
+        # Copied before iterating, phases may be added by another thread meanwhile
+        window = constants.PROFILER_OVERLAY_WINDOW
+        res = [
+            f"{name} {np.mean(durations_s[-window:]) * 1000:.2f}ms".center(line_width)
+            for name, durations_s in list(self._durations_s.items())
+        ]
+        res += [f"{name} {value}".center(line_width) for name, value in list(self._counters.items())]
+
+        if self._is_tracing_memory:
+            current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            res.append(f"memory {current_bytes // 1024}/{peak_bytes // 1024} KiB".center(line_width))
+
+        return res
+
+    def write_trace(self, path: str):
+        """Writes the events kept as a Chrome trace (JSON)"""
+        with open(path, "w") as file:
+            json.dump({"traceEvents": self._events, "displayTimeUnit": "ms"}, file)
+
+    def close(self):
+        """Stops tracing memory (if started by this profiler)"""
+        if self._is_tracemalloc_started:
+            tracemalloc.stop()
+            self._is_tracemalloc_started = False
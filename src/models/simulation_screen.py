@@ -1,81 +1,142 @@
-from src.utils.string_utils import get_banner
+from src.utils.string_utils import get_banner, get_frame
+from src.models.cycle_detector import CycleDetector
+from src.models.frame_scheduler import FrameScheduler
+from src.models.frame_renderer import FrameRenderer
+from src.models.generation_history import GenerationHistory
+from src.models.gif_exporter import GifExporter
+from src.models.checkpointer import Checkpointer
+from src.models.profiler import Profiler
 from src.models.cell_matrix import CellMatrix
-from src.enums.cell_state import CellState
-from src.utils.gif_utils import export_as_gif
-from time import sleep
-from copy import copy
+from src.models.ghost_trail import GhostTrail
+from src.utils.gif_utils import get_gif_path
+from src.enums.on_cycle import OnCycle
+from src.constants import constants
+from contextlib import nullcontext
+from time import perf_counter
 import numpy as np
 import curses
 
 
 class SimulationScreen:
-    _gen_string_history: list[str] = []
-    _prev_gens: list[CellMatrix] = []  # newest -> oldest
-    _ghost_state_list = [CellState.WELL_DONE, CellState.MEDIUM, CellState.RARE] # applied newest -> oldest
-    _priority_order = [
-        CellState.DEAD.value,
-        CellState.RARE.value,
-        CellState.MEDIUM.value,
-        CellState.WELL_DONE.value,
-        CellState.ALIVE.value,
-    ]
-
     def __init__(
         self,
         num_of_generations: int = 100,
         is_ghost_mode: bool = True,
+        ghost_length: int = 3,
         updates_per_s: int = 10,
-        initial_gen: CellMatrix = CellMatrix()
+        initial_gen: CellMatrix = CellMatrix(),
+        generation_step: int = 1,
+        on_cycle: OnCycle = OnCycle.STOP,
+        initial_generation: int = 0,
+        checkpointer: Checkpointer | None = None,
+        profiler: Profiler | None = None,
     ):
         self._num_of_generations = num_of_generations
         self._is_ghost_mode = is_ghost_mode
+        self._ghost_trail = GhostTrail(ghost_length)
         self._updates_per_s = updates_per_s
+        self._generation_step = generation_step
+        self._on_cycle = on_cycle
         self._curr_gen = initial_gen
+        self._generation = initial_generation  # counts on from a resumed checkpoint
+        self._checkpointer = checkpointer
+        self._profiler = profiler  # times each phase (shown in the footer) if given
+        self._cycle: tuple[int, int] | None = None
+        self._frame_codes: np.ndarray | None = None  # codes of the last generation got as a string
+        self._history = GenerationHistory()  # codes of each generation shown (ghost trail included)
+
+    @property
+    def history(self) -> GenerationHistory:
+        """Returns the history of each generation shown (as codes, see get_frame to get them as strings)"""
+        return self._history
 
     @property
     def curr_gen(self):
         """Returns the current generation's cell matrix"""
         return self._curr_gen
 
+    @property
+    def generation(self) -> int:
+        """Returns the current generation's number"""
+        return self._generation
+
+    @property
+    def cycle(self) -> tuple[int, int] | None:
+        """Returns the (first generation of the cycle, period) if the cells repeated a previous generation, otherwise None"""
+        return self._cycle
+
     def show(self):
         """
         SHOW SCREEN:
             - Blocks thread til exit
             - Starts simulation
             - Exists when simulation ends
-            - Returns all generations as strings
+            - Returns the history of all generations (see history)
         """
         curses.wrapper(self._render_screen)
-        return self._gen_string_history
+        return self._history
 
     def assign_new_cell_matrix(self, matrix: CellMatrix):
         """
-        Assigns a new cell matrix as the current generation and resets previous generations history
+        Assigns a new cell matrix as the current generation and resets the ghost trail
         """
-        self._prev_gens = []
+        self._ghost_trail.reset()
         self._curr_gen = matrix
+        self._generation = 0
+        self._cycle = None
 
-    def generations_generator(self, num_of_generations: int, is_ghost_mode: bool = True):
+    def generations_generator(
+        self,
+        num_of_generations: int,
+        is_ghost_mode: bool = True,
+        generation_step: int = 1,
+        on_cycle: OnCycle | None = None,
+    ):
         """
         Returns a generator for accessing each generation as the cells evolve
+            - Each generation yielded is 'generation_step' generations after the last
+            - Engines that can jump (HashLife) skip computing the generations in between
+            - Once the cells repeat a previous generation (see cycle), either:
+                - CONTINUE: keeps going
+                - STOP: stops early
+                - FAST_FORWARD: skips to the last generation (using the cycle's period) and stops
         """
-        border_sides = "┊{}┊".format
-        border_top = f"╭{"┈┈" * self._curr_gen.cols}╮"
-        border_bottom = f"╰{"┈┈" * self._curr_gen.cols}╯"
+        on_cycle = on_cycle if on_cycle is not None else self._on_cycle
+        last_generation = self._generation + num_of_generations * generation_step
+        cycle_detector = CycleDetector()
+        cycle_detector.add(self._curr_gen.fingerprint, self._generation)
 
         for _ in range(0, num_of_generations):
-            self._get_next_generation()
-            next_gen = (
-                self._combine_all_gens_as_str()
-                if is_ghost_mode
-                else self._curr_gen.as_str
-            )
-            
+            self._get_next_generation(generation_step)
+
+            if on_cycle != OnCycle.CONTINUE and cycle_detector.add(self._curr_gen.fingerprint, self._generation):
+                self._cycle = cycle_detector.cycle
+                _, period = self._cycle
+
+                if on_cycle == OnCycle.FAST_FORWARD:
+                    # Only the generations left over after repeating the cycle need computing
+                    remaining_generations = (last_generation - self._generation) % period
+                    if remaining_generations:
+                        self._get_next_generation(remaining_generations)
+                    self._generation = last_generation
+
+                yield self._get_generation_as_str(is_ghost_mode)
+                return
+
+            yield self._get_generation_as_str(is_ghost_mode)
+
+    def _get_generation_as_str(self, is_ghost_mode: bool) -> str:
+        """Gets the current generation (optionally combined w the ghost trail) as a string w borders"""
+        with self._phase("compose"):
+            codes = np.array(self._curr_gen.codes, dtype=np.uint8)
+
+            # Codes are ordered by priority (dead -> alive), so the highest code per cell wins
+            if is_ghost_mode and self._ghost_trail.codes is not None:
+                np.maximum(codes, self._ghost_trail.codes, out=codes)
+
             # Add border - TODO: turn into option?
-            next_gen_w_side_borders = '\n'.join(border_sides(line) for line in next_gen.split('\n'))
-            next_gen_w_all_borders = "{}\n{}\n{}".format(border_top, next_gen_w_side_borders, border_bottom)
-            
-            yield next_gen_w_all_borders
+            self._frame_codes = codes
+            return get_frame(codes, is_bordered=True)
 
     def _render_screen(self, screen: curses.window):
         """
@@ -84,101 +145,116 @@ class SimulationScreen:
 
         # Init curses and colors
         curses.use_default_colors()  # !important
-        screen.scrollok(True)
-
-        screen.clear()
 
-        generations = self.generations_generator(self._num_of_generations, self._is_ghost_mode)
-        delay_s = 1 / self._updates_per_s
+        generations = self.generations_generator(self._num_of_generations, self._is_ghost_mode, self._generation_step)
         line_width = len(self.curr_gen.as_str.split("\n")[0])
+        renderer = FrameRenderer(screen, "\n\n" + get_banner(line_width) + "\n\n")
+        gen = self._get_generation_as_str(self._is_ghost_mode)
 
-        self._render_banner(screen, line_width)
-        screen.addstr(self.curr_gen.as_str)
-        self._render_footer(screen, 1, line_width)
-
-        for idx, gen in enumerate(generations):
-            self._gen_string_history.append(gen)
-
-            sleep(delay_s)
-
-            screen.clear()
-            self._render_banner(screen, line_width)
-            screen.addstr(gen)
-            self._render_footer(screen, idx + 1, line_width)
-            screen.refresh()
-
-        screen.addstr("Press any key to export as GIF!".center(line_width))
-        screen.addstr("\n")
-        screen.getkey()
-        screen.addstr("Exporting GIF, please wait...".center(line_width))
-        screen.addstr("\n")
-        screen.refresh()
-        export_as_gif(self._gen_string_history)
-
-    def _render_footer(self, screen: curses.window, idx: int, line_width: int = 0):
-        """Renders the footer"""
-        screen.addstr("\n")
-        screen.addstr(f"Generation #{idx}".center(line_width))
-        screen.addstr("\n")
-    
-    def _render_banner(self, screen: curses.window, line_width: int = 0):
-        screen.addstr("\n\n" + get_banner(line_width) + "\n\n")
-
-    def _get_next_generation(self):
-        """
-        Gets the next generation and responsible for updating the previous generation history
-        """
-        curr_gen_copy: CellMatrix = copy(self._curr_gen)
-        self._curr_gen.mutate()
+        footer_lines = self._get_footer_lines(self._generation, self._cycle, line_width)
 
-        # GHOST:
-        #   - Insert current gen at beginning (newest -> oldest)
-        #   - Slice to keep only 3 most recent generations (3 is based on amount of non DEAD/ALIVE cell states)
-        #   - Apply a different ghost affect, showing generations fading away as they get older
-        self._prev_gens.insert(0, curr_gen_copy)
-        self._prev_gens = self._prev_gens[:3]
+        renderer.draw(gen, footer_lines)
 
-        for idx, state in enumerate(self._ghost_state_list):
-            if 0 <= idx < len(self._prev_gens):
-                gen = self._prev_gens[idx]
-                gen.change_state(state)
+        # Generations are stepped ahead (in a thread) w the generation/cycle they were at, then shown on schedule
+        # Each generation is also sent to the GIF as it's stepped, written by a background worker
+        gif_exporter = GifExporter(get_gif_path())
 
-        return self._curr_gen
+        try:
+            frames = ((self._record(gen, gif_exporter), self._generation, self._cycle) for gen in generations)
+            scheduler = FrameScheduler(frames, self._updates_per_s)
 
-    def _combine_all_gens_as_str(self) -> str:
-        """
-        Combines all generations into a single matrix (prioritising cell state)
-        """
+            # Waiting = time between drawing a generation and the next being due (sleeping + stepping behind)
+            wait_start_s = perf_counter()
 
-        # Convert cell states to cell priority per layer (matrix)
-        layers: list[list[list[int]]] = [
-            np.vectorize(self._cell_to_priority)(self._curr_gen.matrix)
-        ]
+            for gen, generation, cycle in scheduler:
+                if self._profiler:
+                    self._profiler.add("wait", wait_start_s, perf_counter())
 
-        for gen in self._prev_gens:
-            layers.append(np.vectorize(self._cell_to_priority)(gen.matrix))
+                rate = f"{scheduler.achieved_rate:.1f}/{self._updates_per_s} updates per second"
+                footer_lines = self._get_footer_lines(generation, cycle, line_width) + [rate.center(line_width)]
+                footer_lines += self._profiler.get_overlay_lines(line_width) if self._profiler else []
 
-        # Flatten/reduce/combine layers into 1
-        combined_matrix: list[list[int]] = np.maximum.reduce(layers, axis=0)
+                with self._phase("draw"):
+                    renderer.draw(gen, footer_lines + [self._get_export_progress(gif_exporter, line_width)])
 
-        # Convert priorities back to corresponding cell states
-        combined_matrix_cell_states: list[list[str]] = np.array(
-            self._priority_order
-        )[combined_matrix].tolist()
+                wait_start_s = perf_counter()
 
-        as_str = "\n".join(["".join(row) for row in combined_matrix_cell_states])
+            # Keep the progress live while waiting for a key
+            screen.timeout(constants.EXPORT_PROGRESS_INTERVAL_MS)
+            key = -1
 
-        return as_str
+            while key == -1:
+                progress = self._get_export_progress(gif_exporter, line_width)
+                renderer.draw(gen, footer_lines + [progress, "Press any key to exit!".center(line_width)])
+                key = screen.getch()
 
-    def _cell_to_priority(self, value: str) -> int:
-        """
-        Maps a cell state value to its priority over other cell states values
+            while not gif_exporter.finish(timeout_s=constants.EXPORT_PROGRESS_INTERVAL_MS / 1000):
+                progress = self._get_export_progress(gif_exporter, line_width)
+                renderer.draw(gen, footer_lines + [progress, "Finishing GIF, please wait...".center(line_width)])
+        except BaseException:
+            # Still finish the file, w/o the export's own failure hiding what's already raised (e.g. Ctrl-C)
+            try:
+                gif_exporter.finish()
+            except RuntimeError:
+                pass
+
+            raise
+
+    def _record(self, gen: str, gif_exporter: GifExporter) -> str:
+        """Adds a generation's codes to the history and the GIF, returns it (as a string)"""
+        with self._phase("record"):
+            self._history.add(self._frame_codes)
+            gif_exporter.add(self._frame_codes)
+
+        return gen
+
+    def _phase(self, name: str):
+        """Times the code run inside as a phase (if profiling), see Profiler.phase"""
+        return self._profiler.phase(name) if self._profiler else nullcontext()
+
+    def _get_export_progress(self, gif_exporter: GifExporter, line_width: int = 0) -> str:
+        """Gets the GIF export's progress as a line"""
+        if gif_exporter.is_done:
+            return f"GIF saved to {gif_exporter.path}".center(line_width)
+
+        return f"GIF {gif_exporter.num_of_frames_written}/{gif_exporter.num_of_frames_added} frames".center(line_width)
 
-        Priority = (lowest -> highest / dead -> alive)
+    def _get_footer_lines(self, generation: int, cycle: tuple[int, int] | None, line_width: int = 0) -> list[str]:
+        """Gets the footer's lines"""
+        res = [f"Generation #{generation}".center(line_width)]
+
+        if cycle:
+            first_generation, period = cycle
+            res.append(f"Cycle (period {period}) from #{first_generation}".center(line_width))
+
+        return res
+
+    def _get_next_generation(self, generation_step: int = 1):
         """
-        priority = -1  # assume not in list
+        Gets the next generation and responsible for updating the ghost trail
+        """
+        # GHOST:
+        #   - Each cell's age (generations since last alive) is updated in place
+        #   - Older ages show a different ghost affect, showing generations fading away as they get older
+        if self._ghost_trail.ages is None:
+            self._ghost_trail.update(np.array(self._curr_gen.codes, dtype=np.uint8))
 
-        if value in self._priority_order:
-            priority = self._priority_order.index(value)
+        with self._phase("mutate"):
+            self._curr_gen.advance(generation_step)
+            self._generation += generation_step
 
-        return priority
+        # Unbounded engines may move the window to keep showing the cells, the trail moves w them
+        dx, dy = self._curr_gen.follow()
+        self._ghost_trail.shift(-dx, -dy)
+
+        if self._checkpointer:
+            with self._phase("checkpoint"):
+                self._checkpointer.add(self._curr_gen, self._generation)
+
+        with self._phase("ghost"):
+            self._ghost_trail.update(np.array(self._curr_gen.codes, dtype=np.uint8))
+
+        if self._profiler:
+            self._profiler.count("population", self._curr_gen.population)
+
+        return self._curr_gen
@@ -0,0 +1,236 @@
+from src.utils.neighbourhood_utils import get_offsets, get_wrapped_offsets
+from src.enums.neighbourhood import Neighbourhood
+from src.utils.hash_utils import get_fingerprint
+from src.models.cell_matrix import CellMatrix
+from src.enums.cell_state import CellState
+from src.enums.cell_code import CellCode
+from src.enums.engine import Engine
+import numpy as np
+import random
+
+
+class SparseCellMatrix(CellMatrix):
+    """
+    Represents a single matrix of cells, sparse (only the alive cells are stored)
+        - Mutating only visits alive cells, costs scale w the population (not the area)
+        - Without wrap, cells live on an unbounded plane and the matrix (rows x cols) is a window onto it
+        - The window starts at 0,0 and can follow the cells (see follow), renderers keep showing them as they travel
+        - With wrap, cells live on the matrix (wrapping around its bounds) same as CellMatrix
+    """
+
+    # Dev notes:
+    #   - Alive cells are a sorted array of keys, each key packs a cell's (x,y) coords into a single int64
+    #   - Keys limit the plane to -2^30 <= x,y < 2^30
+    #   - Births/survivals come from counting how many times each cell appears as an alive cell's neighbour
+    #   - Rules w 0 neighbours are ignored (out of MIN_RULE bounds), on a plane they would birth infinite cells
+
+    _KEY_OFFSET = 1 << 30
+
+    def __init__(
+        self,
+        seed: list[tuple[int, int]] | np.ndarray | None = None,
+        radius: int = 1,
+        random: int = 50,
+        cols: int = 11,
+        rows: int = 11,
+        is_wrap: bool = True,
+        survival_rule: set = {2, 3},
+        resurrection_rule: set = {3},
+        neighbourhood: Neighbourhood = Neighbourhood.MOORE,
+        engine: Engine = Engine.SPARSE,
+        workers: int = 1,  # unused, mutates in a single process
+    ):
+        self._random = random
+        self._is_wrap = is_wrap
+        self._survive_rule = survival_rule
+        self._resurrect_rule = resurrection_rule
+        self._neighbourhood = neighbourhood
+        self._radius = radius
+        self._engine = engine
+        self._rows = rows
+        self._cols = cols
+        self._keys = np.empty(0, dtype=np.int64)
+        self._window_origin = (0, 0)  # (x,y) of the matrix's top left cell on the plane
+        self.apply_cells(seed) if seed is not None else self.apply_random_cells()  # empty = no cells
+
+    @property
+    def rows(self):
+        """Get the number of rows (Y-axis count aka height)"""
+        return self._rows
+
+    @property
+    def cols(self):
+        """Get the number of cols (X-axis count aka width)"""
+        return self._cols
+
+    @property
+    def population(self) -> int:
+        """Returns the number of alive cells (including outside the matrix)"""
+        return len(self._keys)
+
+    @property
+    def bounding_box(self) -> tuple[int, int, int, int] | None:
+        """Returns the smallest box (min x, min y, max x, max y inclusive) holding all alive cells, None if there are none"""
+        if not len(self._keys):
+            return None
+
+        xs, ys = self._to_coords(self._keys)
+        return int(xs.min()), int(ys.min()), int(xs.max()), int(ys.max())
+
+    @property
+    def window_origin(self) -> tuple[int, int]:
+        """Returns the (x,y) of the matrix's top left cell on the plane"""
+        return self._window_origin
+
+    @property
+    def fingerprint(self) -> int:
+        """Returns a 64-bit hash of the alive cells (same alive cells = same fingerprint)"""
+        return get_fingerprint(self._keys.tobytes())
+
+    @property
+    def matrix(self):
+        """Returns the matrix (window onto the cells) of cell states"""
+        res = [[CellState.DEAD.value for _ in range(self._cols)] for _ in range(self._rows)]
+
+        for x, y in self._get_window_cells():
+            res[y][x] = CellState.ALIVE.value
+
+        return res
+
+    @property
+    def codes(self):
+        """Returns the matrix (window onto the cells) of cell codes"""
+        res = [[CellCode.DEAD.value for _ in range(self._cols)] for _ in range(self._rows)]
+        code = CellCode.ALIVE.value
+
+        for x, y in self._get_window_cells():
+            res[y][x] = code
+
+        return res
+
+    @property
+    def as_str(self):
+        """Returns the matrix in string format"""
+        res = "\n".join(["".join(row) for row in self.matrix])
+        return res
+
+    @property
+    def alive_cell_coords(self):
+        """Returns the coordinates for the alive cells (in the matrix)"""
+        return sorted(self._get_window_cells(), key=lambda cell: (cell[1], cell[0]))  # rows first, same as CellMatrix
+
+    @property
+    def plane_cell_coords(self):
+        """Returns the coordinates for all alive cells, including any outside the matrix (w/o wrap mode)"""
+        xs, ys = self._to_coords(self._keys)
+        return sorted(zip(xs.tolist(), ys.tolist()), key=lambda cell: (cell[1], cell[0]))  # rows first, same as CellMatrix
+
+    def change_state(
+        self,
+        new_state: CellState,
+        old_state: CellState | None = None
+    ):
+        """
+        If no old state is specified, the new state will be applied to all cells that are NOT dead
+
+        NOTE: Only alive/dead cells are stored, alive cells changed to any other state can't mutate (same as CellMatrix)
+        so they're cleared, dead cells always stay dead
+        """
+        is_alive_changed = (old_state is None or old_state == CellState.ALIVE) and new_state != CellState.ALIVE
+
+        if is_alive_changed:
+            self._keys = np.empty(0, dtype=np.int64)
+
+    def apply_cells(
+        self,
+        cells: list[tuple[int, int]] | np.ndarray,
+        state: CellState = CellState.ALIVE
+    ):
+        """Adds given cells (wrapped if wrap mode, otherwise kept even if outside the matrix)"""
+        if not len(cells):
+            return
+
+        coords = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+        xs, ys = coords[:, 0], coords[:, 1]
+
+        if self._is_wrap:
+            xs, ys = xs % self._cols, ys % self._rows
+
+        keys = self._to_keys(xs, ys)
+
+        if state == CellState.DEAD:
+            self._keys = np.setdiff1d(self._keys, keys)
+        else:
+            self._keys = np.union1d(self._keys, keys)
+
+    def apply_random_cells(self, state: CellState = CellState.ALIVE):
+        """Randomly creates cells with a given state (in the matrix)"""
+        cells: list[tuple[int, int]] = []
+
+        for y in range(self._rows):
+            for x in range(self._cols):
+                random_percent = random.randint(0, 100)  # %
+                if random_percent <= self._random:
+                    cells.append((x, y))
+
+        self.apply_cells(cells, state)
+
+    def mutate(self):
+        """Mutates the cells, only visiting alive cells and their neighbours"""
+        if not len(self._keys):
+            return
+
+        if self._is_wrap:
+            offsets = np.array(get_wrapped_offsets(self._neighbourhood, self._radius, self._cols, self._rows), dtype=np.int64)
+        else:
+            offsets = np.array(get_offsets(self._neighbourhood, self._radius), dtype=np.int64)
+
+        # Every alive cell adds 1 to each of its neighbours
+        xs, ys = self._to_coords(self._keys)
+        neighbour_xs = (xs[:, None] + offsets[None, :, 0]).ravel()
+        neighbour_ys = (ys[:, None] + offsets[None, :, 1]).ravel()
+
+        if self._is_wrap:
+            neighbour_xs, neighbour_ys = neighbour_xs % self._cols, neighbour_ys % self._rows
+
+        neighbour_keys, counts = np.unique(self._to_keys(neighbour_xs, neighbour_ys), return_counts=True)
+        is_alive = np.isin(neighbour_keys, self._keys, assume_unique=True)
+
+        is_surviving = is_alive & np.isin(counts, list(self._survive_rule))
+        is_resurrecting = ~is_alive & np.isin(counts, list(self._resurrect_rule))
+
+        self._keys = neighbour_keys[is_surviving | is_resurrecting]
+
+    def follow(self) -> tuple[int, int]:
+        """
+        Re-centres the window on the alive cells (their bounding box) once any has left it, returns how far it moved (x,y)
+            - Only w/o wrap (on the unbounded plane), the window stays put while every alive cell is in it
+        """
+        box = self.bounding_box
+
+        if self._is_wrap or box is None:
+            return 0, 0
+
+        min_x, min_y, max_x, max_y = box
+        origin_x, origin_y = self._window_origin
+
+        if origin_x <= min_x and max_x < origin_x + self._cols and origin_y <= min_y and max_y < origin_y + self._rows:
+            return 0, 0
+
+        self._window_origin = ((min_x + max_x) // 2 - (self._cols - 1) // 2, (min_y + max_y) // 2 - (self._rows - 1) // 2)
+        return self._window_origin[0] - origin_x, self._window_origin[1] - origin_y
+
+    def _get_window_cells(self) -> list[tuple[int, int]]:
+        """Returns the alive cells in the matrix (relative to the window's origin)"""
+        xs, ys = self._to_coords(self._keys)
+        xs, ys = xs - self._window_origin[0], ys - self._window_origin[1]
+        is_in_window = (0 <= xs) & (xs < self._cols) & (0 <= ys) & (ys < self._rows)
+        return list(zip(xs[is_in_window].tolist(), ys[is_in_window].tolist()))
+
+    def _to_keys(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Packs (x,y) coords into int64 keys (sorted by x then y)"""
+        return ((xs + self._KEY_OFFSET) << 32) | (ys + self._KEY_OFFSET)
+
+    def _to_coords(self, keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Unpacks int64 keys back into (x,y) coords"""
+        return (keys >> 32) - self._KEY_OFFSET, (keys & 0xFFFFFFFF) - self._KEY_OFFSET
@@ -17,11 +17,29 @@ def get_cli_args() -> dict:
         "num_of_generations": args.generations,
         "updates_per_s": args.updates_per_second,
         "is_ghost_mode": args.ghost,
+        "ghost_length": args.ghost_length,
         "is_wrap_mode": args.wrap,
         "survival_rule": args.survival_rule,
         "resurrection_rule": args.resurrection_rule,
         "neighbourhood": args.neighbourhood,
         "radius": args.radius,
+        "engine": args.engine,
+        "generation_step": args.step,
+        "workers": args.workers,
+        "on_cycle": args.on_cycle,
+        "is_headless": args.headless,
+        "num_of_runs": args.runs,
+        "rng_seed": args.rng_seed,
+        "output": args.output,
+        "sweep_path": args.sweep,
+        "num_of_jobs": args.jobs,
+        "pattern_path": args.pattern,
+        "checkpoint_every": args.checkpoint_every,
+        "checkpoint_dir": args.checkpoint_dir,
+        "is_resume": args.resume,
+        "is_profiling": args.profile,
+        "is_profiling_memory": args.profile_memory,
+        "trace_path": args.trace,
     }
 
     return res
@@ -86,6 +104,14 @@ def _add_game_of_life_args(parser: ArgumentParser):
         help="Toggle ghost mode (older generations fading away)",
     )
 
+    parser.add_argument(
+        "--ghost-length",
+        type=int,
+        default=constants.DEFAULT_GHOST_LENGTH,
+        metavar="count",
+        help="Number of generations a dead cell fades away for (in ghost mode)",
+    )
+
     parser.add_argument(
         "-w",
         "--wrap",
@@ -127,3 +153,135 @@ def _add_game_of_life_args(parser: ArgumentParser):
         metavar="size",
         help="Radius a.k.a size of neighbourhood",
     )
+
+    parser.add_argument(
+        "-e",
+        "--engine",
+        type=str,
+        default=constants.DEFAULT_ENGINE.value,
+        metavar="type",
+        help="Engine used to mutate the cells: 'Python', 'NumPy', 'Incremental', 'Bitwise', 'HashLife' (unbounded, Moore radius 1 only) or 'Sparse' (unbounded unless wrapped)",
+    )
+
+    parser.add_argument(
+        "-s",
+        "--step",
+        type=int,
+        default=constants.DEFAULT_GENERATION_STEP,
+        metavar="count",
+        help="Number of generations between each update (HashLife jumps straight there)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=constants.DEFAULT_WORKERS,
+        metavar="count",
+        help="Number of processes the NumPy engine mutates the cells across (in horizontal stripes)",
+    )
+
+    parser.add_argument(
+        "--on-cycle",
+        type=str,
+        default=constants.DEFAULT_ON_CYCLE.value,
+        metavar="action",
+        help="Once cells repeat a previous generation (died out, froze or oscillating): 'Stop', 'Continue' or 'FastForward' (to the last generation)",
+    )
+
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Skip the screens, run at full speed and write each run's stats (JSON lines) instead",
+    )
+
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=constants.DEFAULT_NUM_OF_RUNS,
+        metavar="count",
+        help="Number of runs back to back, each w its own RNG seed (headless only)",
+    )
+
+    parser.add_argument(
+        "--rng-seed",
+        type=int,
+        default=None,
+        metavar="number",
+        help="RNG seed of the first run, the next runs count up from it (headless only, random if not given)",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default=None,
+        metavar="path",
+        help="File to write the runs' stats to (headless only, stdout if not given)",
+    )
+
+    parser.add_argument(
+        "--sweep",
+        type=str,
+        default=None,
+        metavar="path",
+        help="JSON file of settings to sweep over (lists or 'start..stop:step' ranges), runs every combination 'runs' times into the output (headless, resumable)",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="count",
+        help="Number of processes to run a sweep across (all CPUs if not given)",
+    )
+
+    parser.add_argument(
+        "-p",
+        "--pattern",
+        type=str,
+        default=None,
+        metavar="path",
+        help="Pattern file to start from, centred in the matrix instead of the seed/random cells (RLE, plaintext or Life 1.06)",
+    )
+
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=constants.DEFAULT_CHECKPOINT_EVERY,
+        metavar="count",
+        help="Write a checkpoint of the cells every 'count' generations, only the latest few are kept (0 = off)",
+    )
+
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=str,
+        default=constants.DEFAULT_CHECKPOINT_DIR,
+        metavar="path",
+        help="Directory to write checkpoints to (and resume from)",
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the latest checkpoint (its dimensions, rules, neighbourhood, radius and wrap override the args)",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time each phase of the run (stepping, ghost, compose, record, draw, waiting), shown live below the cells and summarised at exit",
+    )
+
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Also trace the memory each phase allocates (tracemalloc, slows the run down), implies --profile",
+    )
+
+    parser.add_argument(
+        "--trace",
+        type=str,
+        default=None,
+        metavar="path",
+        help="File to write a Chrome trace (JSON) of every phase to at exit, open in chrome://tracing or Perfetto, implies --profile",
+    )
@@ -0,0 +1,121 @@
+from src.models.cycle_detector import CycleDetector
+from src.utils.settings_utils import get_settings
+from src.utils.matrix_utils import setup_matrix
+from src.utils.pattern_utils import load_pattern
+from src.utils.checkpoint_utils import get_resume
+from src.models.checkpointer import Checkpointer
+from src.models.cell_matrix import CellMatrix
+from src.models.setting import Setting
+from src.enums.on_cycle import OnCycle
+from time import perf_counter
+import random
+
+# Dev notes:
+#   - Steps a matrix at full speed, no rendering or sleeping (headless mode)
+#   - Same cycle handling as SimulationScreen.generations_generator, see OnCycle
+
+
+def get_run_stats(
+    matrix: CellMatrix,
+    num_of_generations: int,
+    generation_step: int = 1,
+    on_cycle: OnCycle = OnCycle.STOP,
+    initial_generation: int = 0,
+    checkpointer: Checkpointer | None = None,
+) -> dict:
+    """
+    Steps a matrix 'num_of_generations' times ('generation_step' generations each), returns the run's stats
+        - Generations count on from 'initial_generation' (e.g. resumed from a checkpoint)
+        - Each generation is offered to the checkpointer (if any), see Checkpointer.add
+    """
+    last_generation = initial_generation + num_of_generations * generation_step
+    generation = initial_generation
+    cycle: tuple[int, int] | None = None
+    extinct_generation: int | None = None
+    cycle_detector = CycleDetector()
+    cycle_detector.add(matrix.fingerprint, generation)
+    start_s = perf_counter()
+
+    for _ in range(num_of_generations):
+        matrix.advance(generation_step)
+        generation += generation_step
+
+        if checkpointer:
+            checkpointer.add(matrix, generation)
+
+        if extinct_generation is None and matrix.population == 0:
+            extinct_generation = generation
+
+        if on_cycle != OnCycle.CONTINUE and cycle_detector.add(matrix.fingerprint, generation):
+            cycle = cycle_detector.cycle
+
+            if on_cycle == OnCycle.FAST_FORWARD:
+                # Only the generations left over after repeating the cycle need computing
+                remaining_generations = (last_generation - generation) % cycle[1]
+                matrix.advance(remaining_generations)
+                generation = last_generation
+
+            break
+
+    elapsed_s = perf_counter() - start_s
+    res = {
+        "generation": generation,
+        "population": matrix.population,
+        "cycle_start": cycle[0] if cycle else None,
+        "period": cycle[1] if cycle else None,
+        "extinct_generation": extinct_generation,
+        "elapsed_s": round(elapsed_s, 6),
+        "generations_per_s": round((generation - initial_generation) / elapsed_s, 1) if elapsed_s else None,
+        "alive_cell_coords": matrix.alive_cell_coords,
+    }
+
+    return res
+
+
+def get_parsed_settings(args: dict) -> list[Setting]:
+    """Gets the settings from args (see get_cli_args), parsed to their usable values, raises a ValueError (naming them) if any are invalid"""
+    settings = get_settings(args)
+    invalid_settings = [setting.display_name for setting in settings if not setting.parse_value()]
+
+    if invalid_settings:
+        raise ValueError(f"Invalid settings: {', '.join(invalid_settings)}")
+
+    return settings
+
+
+def get_headless_run(args: dict, rng_seed: int) -> dict:
+    """
+    Runs a new matrix (built from args, see get_cli_args) w a RNG seed, returns the run's stats
+        - Continues from the latest checkpoint if resuming (only the generations left are run), see get_resume
+        - Raises a ValueError if any settings are invalid, see get_parsed_settings
+    """
+    cells, initial_generation = None, 0
+
+    if args["is_resume"]:
+        args, cells, initial_generation = get_resume(args)
+
+    settings = get_parsed_settings(args)
+    settings_dict = {setting.name: setting.value for setting in settings}
+    pattern = load_pattern(args["pattern_path"]) if args["pattern_path"] else None
+    random.seed(rng_seed)
+    matrix = setup_matrix(settings=settings, pattern=pattern, cells=cells)
+    checkpointer = (
+        Checkpointer(args["checkpoint_dir"], args["checkpoint_every"], settings_dict, initial_generation)
+        if args["checkpoint_every"] > 0
+        else None
+    )
+
+    try:
+        stats = get_run_stats(
+            matrix,
+            max(0, settings_dict["num_of_generations"] - initial_generation // settings_dict["generation_step"]),
+            settings_dict["generation_step"],
+            settings_dict["on_cycle"],
+            initial_generation,
+            checkpointer,
+        )
+    finally:
+        matrix.close()
+
+    res = {"rng_seed": rng_seed, **stats}
+    return res
@@ -0,0 +1,109 @@
+import numpy as np
+
+# Dev notes:
+#   - Each row of cells is packed into a single int, the cell at X-axis 'x' is bit 'x' (least significant bit = x0)
+#   - Every bitwise op on a row updates all of its cells at once (SWAR: SIMD within a register)
+
+
+def pack_rows(board: np.ndarray) -> list[int]:
+    """Packs a uint8 board (1 = alive, 0 = dead) into an int per row"""
+    weights = [1 << x for x in range(board.shape[1])]
+    res = [sum(w for w, cell in zip(weights, row) if cell) for row in board.tolist()]
+    return res
+
+
+def unpack_rows(rows: list[int], cols: int) -> np.ndarray:
+    """Unpacks an int per row back into a uint8 board (1 = alive, 0 = dead)"""
+    res = np.array([[(row >> x) & 1 for x in range(cols)] for row in rows], dtype=np.uint8)
+    return res.reshape(len(rows), cols)
+
+
+def get_rule_mask(rule: set[int]) -> int:
+    """Packs a rule (counts of alive neighbours) into a bit mask, Moore radius 1 counts are 0..8"""
+    res = sum(1 << count for count in rule if 0 <= count <= 8)
+    return res
+
+
+def mutate_moore_rows(
+    rows: list[int],
+    cols: int,
+    is_wrap: bool,
+    survival_mask: int,
+    resurrection_mask: int,
+) -> list[int]:
+    """
+    Mutates packed rows w a Moore neighbourhood of radius 1
+        - Gets the 8 neighbours of every cell in the row as shifted rows
+        - Adds them w full-adder logic into 4 bit-planes (count = s0 + 2*s1 + 4*s2 + 8*s3)
+        - Keeps cells whose count matches the survival (alive) or resurrection (dead) rule
+    """
+    full = (1 << cols) - 1
+    num_of_rows = len(rows)
+    res: list[int] = []
+
+    for y, row in enumerate(rows):
+        if is_wrap:
+            above = rows[(y - 1) % num_of_rows]
+            below = rows[(y + 1) % num_of_rows]
+        else:
+            above = rows[y - 1] if y > 0 else 0
+            below = rows[y + 1] if y < num_of_rows - 1 else 0
+
+        neighbours = [above, below]
+
+        for r in (above, row, below):
+            neighbours.append(_shift_left(r, cols, full, is_wrap))
+            neighbours.append(_shift_right(r, cols, is_wrap))
+
+        s0, s1, s2, s3 = _add_bits(neighbours)
+        planes = (s0, s1, s2, s3)
+
+        survivors = 0
+        resurrections = 0
+
+        for count in range(9):
+            is_count = full
+
+            for bit, plane in enumerate(planes):
+                is_count &= plane if (count >> bit) & 1 else ~plane
+
+            if (survival_mask >> count) & 1:
+                survivors |= is_count
+            if (resurrection_mask >> count) & 1:
+                resurrections |= is_count
+
+        res.append(((row & survivors) | (~row & resurrections)) & full)
+
+    return res
+
+
+def _shift_left(row: int, cols: int, full: int, is_wrap: bool) -> int:
+    """Moves each cell one to the right (cell 'x' now holds its left neighbour 'x-1')"""
+    shifted = (row << 1) & full
+    return shifted | (row >> (cols - 1)) if is_wrap else shifted
+
+
+def _shift_right(row: int, cols: int, is_wrap: bool) -> int:
+    """Moves each cell one to the left (cell 'x' now holds its right neighbour 'x+1')"""
+    shifted = row >> 1
+    return shifted | ((row & 1) << (cols - 1)) if is_wrap else shifted
+
+
+def _add_bits(n: list[int]) -> tuple[int, int, int, int]:
+    """Adds 8 rows of 1-bit values into 4 bit-planes w full/half adders"""
+    ones_a, twos_a = _full_add(n[0], n[1], n[2])
+    ones_b, twos_b = _full_add(n[3], n[4], n[5])
+    ones_c, twos_c = n[6] ^ n[7], n[6] & n[7]
+
+    s0, twos_d = _full_add(ones_a, ones_b, ones_c)
+    twos, fours_a = _full_add(twos_a, twos_b, twos_c)
+    s1, fours_b = twos ^ twos_d, twos & twos_d
+    s2, s3 = fours_a ^ fours_b, fours_a & fours_b
+
+    return s0, s1, s2, s3
+
+
+def _full_add(a: int, b: int, c: int) -> tuple[int, int]:
+    """Returns the (sum, carry) bits"""
+    a_xor_b = a ^ b
+    return a_xor_b ^ c, (a & b) | (c & a_xor_b)
@@ -0,0 +1,155 @@
+from src.enums.neighbourhood import Neighbourhood
+from src.models.cell_matrix import CellMatrix
+from src.utils.numpy_utils import get_board
+import numpy as np
+import struct
+import os
+
+# Dev notes:
+#   - A checkpoint is a fixed-size header (see HEADER_FORMAT) followed by the alive cells, as 1 of 2 payloads:
+#       - Bounded (every cell inside the matrix): the matrix's board as bits, packed row by row (each row padded to whole bytes)
+#       - Unbounded (cells outside the matrix, e.g. HashLife after a jump): the cells' (x,y) coords as int64 pairs
+#   - A bounded board is rows x cols bits, coords cost 16 bytes per cell however far apart they are
+#   - Either payload is memory-mapped back as is (no parsing)
+#   - Rules (counts 1..MAX_RULE) are packed into a 128-bit mask each
+#   - Only alive/dead is kept (ghost states are rebuilt as the cells evolve)
+
+MAGIC = b"GOLCKPT\0"
+VERSION = 1
+HEADER_FORMAT = struct.Struct("<8sHHIIQBBH16s16sBQ")  # magic, version, header size, cols, rows, generation, neighbourhood, is wrap, radius, survival rule, resurrection rule, is coords payload, number of cells
+HEADER_SIZE = 128  # payload offset, room to grow the header w/o moving the payload
+FILE_PREFIX = "checkpoint-"
+FILE_EXTENSION = ".ckpt"
+NEIGHBOURHOODS = list(Neighbourhood)
+COORDS_DTYPE = np.dtype("<i8")
+
+
+def write_checkpoint(path: str, matrix: CellMatrix, generation: int, settings_dict: dict):
+    """
+    Writes a matrix's alive cells and the settings needed to continue it (rules, neighbourhood, radius, wrap)
+        - Written to a temporary file then renamed, so a checkpoint is never seen half-written
+    """
+    cells = np.asarray(matrix.plane_cell_coords, dtype=np.int64).reshape(-1, 2)
+    is_coords_payload = not ((0 <= cells) & (cells < (matrix.cols, matrix.rows))).all()
+    header = HEADER_FORMAT.pack(
+        MAGIC,
+        VERSION,
+        HEADER_SIZE,
+        matrix.cols,
+        matrix.rows,
+        generation,
+        NEIGHBOURHOODS.index(settings_dict["neighbourhood"]),
+        settings_dict["is_wrap_mode"],
+        settings_dict["radius"],
+        _get_rule_mask(settings_dict["survival_rule"]),
+        _get_rule_mask(settings_dict["resurrection_rule"]),
+        is_coords_payload,
+        len(cells),
+    )
+    temp_path = f"{path}.tmp"
+
+    with open(temp_path, "wb") as file:
+        file.write(header.ljust(HEADER_SIZE, b"\0"))
+
+        if is_coords_payload:
+            file.write(cells.astype(COORDS_DTYPE).tobytes())
+        else:
+            file.write(np.packbits(get_board(cells, matrix.cols, matrix.rows), axis=1).tobytes())
+
+    os.replace(temp_path, path)
+
+
+def read_checkpoint(path: str) -> tuple[dict, np.ndarray]:
+    """
+    Reads a checkpoint's header (generation + settings, keys match get_cli_args) and its alive cells' (x,y) coords
+        - The payload is memory-mapped, a board's bits are only unpacked (no parsing)
+        - Raises a ValueError if the file is not a checkpoint (or a newer version)
+    """
+    with open(path, "rb") as file:
+        header_bytes = file.read(HEADER_FORMAT.size)
+
+    if len(header_bytes) < HEADER_FORMAT.size:
+        raise ValueError(f"Not a checkpoint: {path}")
+
+    (
+        magic, version, header_size, cols, rows, generation, neighbourhood, is_wrap, radius, survival, resurrection,
+        is_coords_payload, num_of_cells,
+    ) = HEADER_FORMAT.unpack(header_bytes)
+
+    if magic != MAGIC or version > VERSION:
+        raise ValueError(f"Not a checkpoint (or a newer version): {path}")
+
+    if is_coords_payload:
+        cells = np.array(np.memmap(path, dtype=COORDS_DTYPE, mode="r", offset=header_size, shape=(num_of_cells, 2)), dtype=np.int64)
+    else:
+        packed = np.memmap(path, dtype=np.uint8, mode="r", offset=header_size, shape=(rows, (cols + 7) // 8))
+        cells = get_alive_cell_coords(np.unpackbits(packed, axis=1, count=cols))
+
+    header = {
+        "generation": generation,
+        "cols": cols,
+        "rows": rows,
+        "neighbourhood": NEIGHBOURHOODS[neighbourhood].value,
+        "is_wrap_mode": bool(is_wrap),
+        "radius": radius,
+        "survival_rule": _get_rule(survival),
+        "resurrection_rule": _get_rule(resurrection),
+    }
+
+    return header, cells
+
+
+def get_checkpoint_path(dir_path: str, generation: int) -> str:
+    """Gets a checkpoint's path, names sort by generation"""
+    return os.path.join(dir_path, f"{FILE_PREFIX}{generation:020d}{FILE_EXTENSION}")
+
+
+def get_checkpoint_paths(dir_path: str) -> list[str]:
+    """Gets the paths of the checkpoints in a directory, oldest generation first"""
+    if not os.path.isdir(dir_path):
+        return []
+
+    file_names = [f for f in os.listdir(dir_path) if f.startswith(FILE_PREFIX) and f.endswith(FILE_EXTENSION)]
+    res = [os.path.join(dir_path, f) for f in sorted(file_names)]
+    return res
+
+
+def get_latest_checkpoint(dir_path: str) -> str | None:
+    """Gets the path of the latest (highest generation) checkpoint in a directory, otherwise None"""
+    paths = get_checkpoint_paths(dir_path)
+    return paths[-1] if paths else None
+
+
+def get_resume(args: dict) -> tuple[dict, np.ndarray, int]:
+    """
+    Gets what's needed to continue from the latest checkpoint in the args' checkpoint directory:
+        - The args w the checkpoint's settings (overriding the dimensions, rules, neighbourhood, radius and wrap)
+        - The alive cells' (x,y) coords
+        - The generation it was written at
+    Raises a ValueError if there are no checkpoints to resume from
+    """
+    path = get_latest_checkpoint(args["checkpoint_dir"])
+
+    if path is None:
+        raise ValueError(f"No checkpoints to resume from in '{args['checkpoint_dir']}'")
+
+    header, cells = read_checkpoint(path)
+    generation = header.pop("generation")
+
+    return {**args, **header}, cells, generation
+
+
+def get_alive_cell_coords(board: np.ndarray) -> np.ndarray:
+    """Gets the (x,y) coords of a board's alive cells"""
+    return np.argwhere(board)[:, ::-1]
+
+
+def _get_rule_mask(rule: set[int]) -> bytes:
+    """Packs a rule (counts of alive neighbours) into a 128-bit mask"""
+    return sum(1 << count for count in rule).to_bytes(16, "little")
+
+
+def _get_rule(mask: bytes) -> str:
+    """Unpacks a 128-bit mask back into a rule (comma separated, as a CLI arg)"""
+    bits = int.from_bytes(mask, "little")
+    return ",".join(str(count) for count in range(bits.bit_length()) if bits >> count & 1)
@@ -1,97 +1,77 @@
-import matplotlib.pyplot as plot
+from src.enums.cell_code import CellCode
 from datetime import datetime
-from io import BytesIO
 from PIL import Image
-import math
+import numpy as np
 import os
 
-FONT_POINTS = 10
-
-
-def export_as_gif(strings: list[str], updates_per_s: int = 1) -> bool:
-    """Returns True if successful, False otherwise"""
-
-    if not strings:
-        return False
-
-    # File name
+# Dev notes:
+#   - Frames are matrices of cell codes (see CellCode), painted straight into palettised (P mode) images
+#   - Each code is also its colour's index in the palette, borders get the next index
+#   - GIFs are written a frame at a time (see GifWriter)
+
+BORDER_INDEX = len(CellCode)
+PALETTE: list[tuple[int, int, int]] = [
+    (192, 192, 192),  # DEAD (silver background)
+    (144, 144, 144),  # RARE
+    (96, 96, 96),     # MEDIUM
+    (48, 48, 48),     # WELL_DONE
+    (0, 0, 0),        # ALIVE
+    (96, 96, 96),     # BORDER
+]
+
+# NOTE: Known issues with Pillow ignoring duration param for GIF...
+# For now use a constant
+# See:
+#   - https://github.com/python-pillow/Pillow/issues/3073
+#   - https://stackoverflow.com/a/64530622
+FRAME_DURATION = 33  # ms
+
+
+def get_gif_path() -> str:
+    """Gets a new GIF's path (timestamped), ensuring its directory exists"""
     DIR_NAME = "gifs"
     _ensure_gif_dir_exists(DIR_NAME)
     now = datetime.now().strftime("%Y%m%d%H%M%S")
     file_name = f"GAMEofLIFE-{now}.gif"
 
-    # Generate frames
-    img_bytes_list = []
-    x, y = _get_inches_xy(strings[0])
+    return f"{DIR_NAME}/{file_name}"
 
-    for s in strings:
-        img_bytes_list.append(_convert_to_img_bytes(s, x, y))
 
-    frames = [Image.open(img) for img in img_bytes_list]
-    final_frames = frames[1:]
+def convert_to_img(codes: np.ndarray, cell_size: int, is_bordered: bool = True) -> Image.Image:
+    """
+    Paints a matrix of cell codes into a palettised image, each cell is a square of 'cell_size' pixels
+        - Bordered images are surrounded by a border then a margin, the cells start at get_cells_offset
+    """
 
-    # BOOMERANG EFFECT
-    if len(frames) > 1:
-        final_frames = frames[1:] + frames[-2::-1]
+    # 1. Scale each cell up to a square of pixels
+    # 2. Surround w a border, then a margin (background)
+    pixels = np.repeat(np.repeat(codes.astype(np.uint8), cell_size, axis=0), cell_size, axis=1)
 
-    # NOTE: Known issues with Pillow ignoring duration param for GIF...
-    # For now use a constant
-    # See:
-    #   - https://github.com/python-pillow/Pillow/issues/3073
-    #   - https://stackoverflow.com/a/64530622
-    FRAME_DURATION = 33
-    frames[0].save(
-        f"{DIR_NAME}/{file_name}",
-        save_all=True,
-        append_images=final_frames,
-        duration=FRAME_DURATION,
-        loop=0,
-    )
+    if is_bordered:
+        pixels = np.pad(pixels, _get_border_size(cell_size), constant_values=BORDER_INDEX)
+        pixels = np.pad(pixels, _get_margin_size(cell_size), constant_values=CellCode.DEAD)
 
-    return True
+    height, width = pixels.shape
+    img = Image.frombytes("P", (width, height), np.ascontiguousarray(pixels).tobytes())
+    img.putpalette([channel for colour in PALETTE for channel in colour])
 
+    return img
 
-def _ensure_gif_dir_exists(name: str):
-    """Ensures a directory exists in the directory the app is executed"""
-    if not os.path.exists(name):
-        os.makedirs(name)
 
+def get_cells_offset(cell_size: int) -> int:
+    """Gets the offset (x and y, in pixels) of the cells in a bordered image"""
+    return _get_margin_size(cell_size) + _get_border_size(cell_size)
 
-def _get_inches_xy(string: str) -> tuple[float, float]:
-    # COMPUTE SIZE DYNAMICALLY
-    # Great summary for Matplotlib's size ratios (dots vs inches): https://stackoverflow.com/a/47639545
-    lines = string.split("\n")
-    string_width = math.floor((len(lines[0]) / 2))  # divide by 2 as cells are 2 chars wide '██'
-    string_height = len(lines)
 
-    font_points_x = FONT_POINTS * string_width
-    font_points_y = FONT_POINTS * string_height
+def _get_border_size(cell_size: int) -> int:
+    return max(1, cell_size // 5)
 
-    # Divding values were determined from testing exporting gifs...
-    inches_x = font_points_x / 46.4
-    inches_y = font_points_y / 45
 
-    # Avoid errors ensuring values are within bounds for Pillow and Matplotlib
-    inches_x = 0.1 if inches_x == 0 else inches_x
-    inches_y = 0.1 if inches_y == 0 else inches_y
+def _get_margin_size(cell_size: int) -> int:
+    return cell_size // 2
 
-    return (inches_x, inches_y)
 
-
-def _convert_to_img_bytes(string: str, width: float, height: float):
-    img_bytes = BytesIO()
-
-    plot.figure(figsize=(width, height), facecolor="silver")
-    plot.axis("off")  # toggle "on" (comment out) for debugging
-    plot.text(0, 0, string, fontfamily="monospace", fontsize=FONT_POINTS)
-    plot.savefig(
-        img_bytes,
-        dpi=100,
-        format="png",
-        # NOTE: Issue when removing padding, images are slightly different sizes which causes Pillow to throw when merging into GIF
-        # pad_inches=0,
-        # bbox_inches="tight",
-    )
-    plot.close()
-
-    return img_bytes
+def _ensure_gif_dir_exists(name: str):
+    """Ensures a directory exists in the directory the app is executed"""
+    if not os.path.exists(name):
+        os.makedirs(name)
@@ -0,0 +1,7 @@
+from hashlib import blake2b
+
+
+def get_fingerprint(data: bytes) -> int:
+    """Returns a 64-bit hash of the data"""
+    res = int.from_bytes(blake2b(data, digest_size=8).digest(), "little")
+    return res
@@ -0,0 +1,67 @@
+from src.models.sparse_cell_matrix import SparseCellMatrix
+from src.models.hash_life_matrix import HashLifeMatrix
+from src.models.bit_cell_matrix import BitCellMatrix
+from src.models.cell_matrix import CellMatrix
+from src.utils.pattern_utils import get_centred_cells
+from src.utils.seed_utils import get_seed
+from src.models.setting import Setting
+from src.enums.neighbourhood import Neighbourhood
+from src.enums.engine import Engine
+import numpy as np
+
+
+def setup_matrix(
+    settings: list[Setting],
+    pattern: np.ndarray | None = None,
+    cells: np.ndarray | None = None,
+) -> CellMatrix:
+    """
+    Setup the matrix w settings, instead of the seed:
+        - A pattern's cells (see load_pattern) are centred in the matrix
+        - Cells (e.g. resumed from a checkpoint) are placed as is
+    """
+
+    # Convert to dict for easy assignment
+    settings_dict = {setting.name: setting.value for setting in settings}
+
+    if cells is not None:
+        seed = cells
+    elif pattern is not None:
+        seed = get_centred_cells(pattern, settings_dict["cols"], settings_dict["rows"])
+    else:
+        seed = get_seed(settings_dict["seed"])
+
+    matrix_type = get_matrix_type(settings_dict["engine"], settings_dict["neighbourhood"], settings_dict["radius"])
+    matrix = matrix_type(
+        seed=seed,
+        cols=settings_dict["cols"],
+        rows=settings_dict["rows"],
+        random=settings_dict["random"],
+        is_wrap=settings_dict["is_wrap_mode"],
+        survival_rule=settings_dict["survival_rule"],
+        resurrection_rule=settings_dict["resurrection_rule"],
+        neighbourhood=settings_dict["neighbourhood"],
+        radius=settings_dict["radius"],
+        engine=settings_dict["engine"],
+        workers=settings_dict["workers"],
+    )
+
+    return matrix
+
+
+def get_matrix_type(engine: Engine, neighbourhood: Neighbourhood, radius: int) -> type[CellMatrix]:
+    """Gets the matrix class that mutates w an engine (CellMatrix for its own engines, or if unsupported)"""
+    is_moore_radius_1 = neighbourhood == Neighbourhood.MOORE and radius == 1
+
+    match engine:
+        case Engine.BITWISE:
+            res = BitCellMatrix
+        case Engine.HASHLIFE if is_moore_radius_1:
+            res = HashLifeMatrix
+        case Engine.SPARSE:
+            res = SparseCellMatrix
+        case _:
+            # HashLife only supports Moore radius 1, other neighbourhoods fall back to the NumPy engine
+            res = CellMatrix
+
+    return res
@@ -0,0 +1,79 @@
+from src.enums.neighbourhood import Neighbourhood
+from src.constants import constants
+from functools import lru_cache
+
+# Dev notes:
+#   - A neighbourhood's shape only depends on its type and radius, never on the host cell
+#   - Shapes are built once as relative (x,y) offsets and shared (cached) by every matrix and engine
+#   - Cached values are tuples so they can't be modified by whoever shares them
+
+
+@lru_cache(maxsize=constants.NEIGHBOURHOOD_OFFSETS_CACHE_SIZE)
+def get_offsets(neighbourhood: Neighbourhood, radius: int) -> tuple[tuple[int, int], ...]:
+    """
+    Gets the relative (x,y) offsets of the neighbours surrounding a host cell
+        - Travels from top to bottom (along Y-axis)
+        - Each iteration saves the offsets left to right (along X-axis)
+        - Does not save the host cell
+    """
+    offsets: list[tuple[int, int]] = []
+
+    for dy in range(-radius, radius + 1):
+        # ALGO SUMMARY TO ACHIEVE VON NEUMANN:
+        #   - How far 'Y' is from the host maps nicely to how much padding is needed (both sides) to shrink the X-axis range
+        #   - The further away 'Y' is = the greater the padding = the smaller the window = the Von Neumann "diamond" shape
+        padding_x = abs(dy) if neighbourhood == Neighbourhood.VON_NEUMANN else 0
+
+        for dx in range(-radius + padding_x, radius - padding_x + 1):
+            if (dx, dy) != (0, 0):
+                offsets.append((dx, dy))
+
+    return tuple(offsets)
+
+
+@lru_cache(maxsize=constants.NEIGHBOURHOOD_OFFSETS_CACHE_SIZE)
+def get_wrapped_offsets(neighbourhood: Neighbourhood, radius: int, cols: int, rows: int) -> tuple[tuple[int, int], ...]:
+    """
+    Gets the distinct offsets once wrapped around the matrix bounds (0 <= x < cols and 0 <= y < rows)
+        - Offsets wider than the matrix land on the same cell and are only kept once
+        - An offset can wrap back onto the host cell (0,0), which is then its own neighbour
+    """
+    wrapped_offsets = {(dx % cols, dy % rows) for dx, dy in get_offsets(neighbourhood, radius)}
+    return tuple(sorted(wrapped_offsets))
+
+
+@lru_cache(maxsize=constants.NEIGHBOUR_INDICES_CACHE_SIZE)
+def get_neighbour_indices(
+    neighbourhood: Neighbourhood,
+    radius: int,
+    cols: int,
+    rows: int,
+    is_wrap: bool,
+) -> tuple[tuple[int, ...], ...]:
+    """
+    Gets a table of the neighbours for every cell in a matrix, as flat indices (y * cols + x)
+        - Access the neighbours of cell (x,y) w table[y * cols + x]
+        - Wrapping (modulo) and excluding neighbours out of bounds is done once here, never when looked up
+    """
+    res: list[tuple[int, ...]] = []
+
+    if is_wrap:
+        offsets = get_wrapped_offsets(neighbourhood, radius, cols, rows)
+
+        for y in range(rows):
+            for x in range(cols):
+                res.append(tuple(((y + dy) % rows) * cols + (x + dx) % cols for dx, dy in offsets))
+
+        return tuple(res)
+
+    offsets = get_offsets(neighbourhood, radius)
+
+    for y in range(rows):
+        for x in range(cols):
+            res.append(tuple(
+                (y + dy) * cols + (x + dx)
+                for dx, dy in offsets
+                if 0 <= x + dx < cols and 0 <= y + dy < rows
+            ))
+
+    return tuple(res)
@@ -0,0 +1,200 @@
+from src.utils.neighbourhood_utils import get_offsets, get_wrapped_offsets
+from src.enums.neighbourhood import Neighbourhood
+from src.constants import constants
+import numpy as np
+
+
+def count_alive_neighbours(
+    board: np.ndarray,
+    neighbourhood: Neighbourhood,
+    radius: int,
+    is_wrap: bool,
+) -> np.ndarray:
+    """
+    Counts the alive neighbours for every cell at once
+        - Board is a uint8 array (1 = alive, 0 = dead)
+        - Small radii sum shifted copies of the board (cost grows w the neighbourhood size)
+        - Larger radii use summed-area tables (cost is the same whatever the radius)
+    """
+    min_radius = (
+        constants.SUMMED_AREA_MIN_RADIUS_MOORE
+        if neighbourhood == Neighbourhood.MOORE
+        else constants.SUMMED_AREA_MIN_RADIUS_VON_NEUMANN
+    )
+
+    if radius >= min_radius and _is_summed_area_supported(board, neighbourhood, radius, is_wrap):
+        return _count_by_summed_area(board, neighbourhood, radius, is_wrap)
+
+    return _count_by_shifts(board, neighbourhood, radius, is_wrap)
+
+
+def _count_by_shifts(
+    board: np.ndarray,
+    neighbourhood: Neighbourhood,
+    radius: int,
+    is_wrap: bool,
+) -> np.ndarray:
+    """
+    Counts the alive neighbours by summing a shifted copy of the board per neighbour offset
+        - Wraps with np.roll, otherwise shifts into zero-padded slices
+    """
+    rows, cols = board.shape
+    counts = np.zeros(board.shape, dtype=np.int32)
+
+    if is_wrap:
+        # Wrapped offsets may land on the same cell (radius >= dimension), only count each cell once
+        for dx, dy in get_wrapped_offsets(neighbourhood, radius, cols, rows):
+            counts += np.roll(board, shift=(-dy, -dx), axis=(0, 1))
+
+        return counts
+
+    for dx, dy in get_offsets(neighbourhood, radius):
+        # Offsets beyond the bounds never land on a cell
+        if abs(dx) >= cols or abs(dy) >= rows:
+            continue
+
+        dst_y, src_y = _get_shifted_slices(dy, rows)
+        dst_x, src_x = _get_shifted_slices(dx, cols)
+        counts[dst_y, dst_x] += board[src_y, src_x]
+
+    return counts
+
+
+def apply_rules(
+    board: np.ndarray,
+    counts: np.ndarray,
+    survival_rule: set[int],
+    resurrection_rule: set[int],
+) -> np.ndarray:
+    """Returns the next board (uint8) given each cell's count of alive neighbours"""
+    is_surviving = np.isin(counts, list(survival_rule))
+    is_resurrecting = np.isin(counts, list(resurrection_rule))
+    res = np.where(board == 1, is_surviving, is_resurrecting).astype(np.uint8)
+    return res
+
+
+def get_board(cells: list[tuple[int, int]] | np.ndarray, cols: int, rows: int) -> np.ndarray:
+    """Places (x,y) coords on a uint8 board (1 = alive, 0 = dead) in 1 go, coords out of bounds are dropped"""
+    coords = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+    xs, ys = coords[:, 0], coords[:, 1]
+    is_in_bounds = (0 <= xs) & (xs < cols) & (0 <= ys) & (ys < rows)
+
+    res = np.zeros((rows, cols), dtype=np.uint8)
+    res[ys[is_in_bounds], xs[is_in_bounds]] = 1
+    return res
+
+
+def _is_summed_area_supported(
+    board: np.ndarray,
+    neighbourhood: Neighbourhood,
+    radius: int,
+    is_wrap: bool,
+) -> bool:
+    """
+    Summed-area tables count each cell under the window once per time it's covered
+        - Moore windows are handled per axis, so any radius is supported
+        - Wrapped Von Neumann "diamonds" overlap themselves once they're as wide as the board
+    """
+    if neighbourhood == Neighbourhood.VON_NEUMANN and is_wrap:
+        return 2 * radius < min(board.shape)
+
+    return True
+
+
+def _count_by_summed_area(
+    board: np.ndarray,
+    neighbourhood: Neighbourhood,
+    radius: int,
+    is_wrap: bool,
+) -> np.ndarray:
+    """
+    Counts the alive neighbours w prefix sums, each window is a constant number of lookups
+        - Moore: the square window is the sum of a window along the Y-axis then along the X-axis
+        - Von Neumann: rotating the board 45 degrees turns the "diamond" into a square window
+    """
+    rows, cols = board.shape
+    values = board.astype(np.int32)
+
+    match neighbourhood:
+        case Neighbourhood.MOORE:
+            window_sums = _get_window_sums(values, radius, axis=0, is_wrap=is_wrap)
+            window_sums = _get_window_sums(window_sums, radius, axis=1, is_wrap=is_wrap)
+
+            # The host cell is in its own window, unless a wrapped offset lands back on it (same as the Python engine)
+            is_host_neighbour = is_wrap and (radius >= rows or radius >= cols)
+            return window_sums if is_host_neighbour else window_sums - values
+
+        case Neighbourhood.VON_NEUMANN:
+            if not is_wrap:
+                return _get_diamond_sums(values, radius) - values
+
+            # Wrap by padding w the opposite edges, then crop back to the board
+            padded = np.pad(values, radius, mode="wrap")
+            diamond_sums = _get_diamond_sums(padded, radius)[radius:radius + rows, radius:radius + cols]
+            return diamond_sums - values
+
+        case _:
+            return np.zeros(board.shape, dtype=np.int32)
+
+
+def _get_window_sums(values: np.ndarray, radius: int, axis: int, is_wrap: bool) -> np.ndarray:
+    """Sums each value w its neighbours (within the radius) along an axis using 1D prefix sums"""
+    size = values.shape[axis]
+
+    # Window covers the entire (wrapped) axis, each cell is only counted once
+    if is_wrap and 2 * radius + 1 >= size:
+        return np.broadcast_to(values.sum(axis=axis, keepdims=True), values.shape)
+
+    if is_wrap:
+        pad_width = [(0, 0), (0, 0)]
+        pad_width[axis] = (radius, radius)
+        values = np.pad(values, pad_width, mode="wrap")
+
+    prefix_sums = np.cumsum(values, axis=axis)
+    prefix_sums = np.insert(prefix_sums, 0, 0, axis=axis)  # prefix_sums[i] = sum of the first i values
+
+    if is_wrap:
+        upper = np.arange(2 * radius + 1, size + 2 * radius + 1)
+        lower = np.arange(0, size)
+    else:
+        upper = np.minimum(np.arange(size) + radius + 1, size)
+        lower = np.maximum(np.arange(size) - radius, 0)
+
+    return np.take(prefix_sums, upper, axis=axis) - np.take(prefix_sums, lower, axis=axis)
+
+
+def _get_diamond_sums(values: np.ndarray, radius: int) -> np.ndarray:
+    """
+    Sums each value w its Von Neumann neighbourhood (inclusive), treating out of bounds as dead
+        - Rotates the board 45 degrees: (x,y) -> (u,v) = (x+y, x-y)
+        - Diamond |dx|+|dy| <= radius becomes the square |du| <= radius and |dv| <= radius
+        - Cells in the rotated board that don't map back to the original board are zeros
+        - Square windows are then summed w a 2D summed-area table (integral image)
+    """
+    rows, cols = values.shape
+    size = rows + cols - 1
+    ys, xs = np.indices(values.shape)
+    us = xs + ys
+    vs = xs - ys + rows - 1
+
+    rotated = np.zeros((size, size), dtype=np.int32)
+    rotated[us, vs] = values
+
+    # table[u][v] = sum of rotated[:u, :v]
+    table = np.zeros((size + 1, size + 1), dtype=np.int32)
+    table[1:, 1:] = rotated.cumsum(axis=0).cumsum(axis=1)
+
+    lower_u = np.clip(us - radius, 0, size)
+    upper_u = np.clip(us + radius + 1, 0, size)
+    lower_v = np.clip(vs - radius, 0, size)
+    upper_v = np.clip(vs + radius + 1, 0, size)
+
+    return table[upper_u, upper_v] - table[lower_u, upper_v] - table[upper_u, lower_v] + table[lower_u, lower_v]
+
+
+def _get_shifted_slices(offset: int, size: int) -> tuple[slice, slice]:
+    """Gets the (destination, source) slices to shift an axis by the offset, leaving the rest as zeros"""
+    if offset >= 0:
+        return slice(0, size - offset), slice(offset, size)
+
+    return slice(-offset, size), slice(0, size + offset)
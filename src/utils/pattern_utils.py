@@ -0,0 +1,147 @@
+from src.utils.hash_utils import get_fingerprint
+from src.constants import constants
+from array import array
+import numpy as np
+import re
+import os
+
+# Dev notes:
+#   - Patterns are parsed into an (N, 2) array of (x,y) coords, shifted so the top-left cell is (0,0)
+#   - Coords are never built cell by cell (RLE runs are expanded in bulk, plaintext rows are scanned as bytes)
+#   - Parsed patterns are cached on disk (.npy) by content hash, reloading a big pattern skips parsing entirely
+#   - Formats (sniffed from the content, not the file extension):
+#       - Life 1.06: "#Life 1.06" header, then one "x y" pair per line
+#       - RLE: "x = m, y = n" header, then runs of "<count><tag>" ("b" dead, "o" alive, "$" end of row, "!" end)
+#       - Plaintext: "!" comment lines, then rows of "." dead and "O" alive
+
+RLE_HEADER_PATTERN = re.compile(rb"^x\s*=", re.MULTILINE)
+RLE_TOKEN_PATTERN = re.compile(rb"(\d*)([a-zA-Z.$!])")
+
+
+def load_pattern(path: str) -> np.ndarray:
+    """Loads a pattern file's (x,y) coords, from the cache if the same content was loaded before"""
+    with open(path, "rb") as file:
+        content = file.read()
+
+    cache_path = os.path.join(constants.PATTERN_CACHE_DIR, f"{get_fingerprint(content):016x}.npy")
+
+    try:
+        return np.load(cache_path)
+    except:
+        pass
+
+    res = parse_pattern(content)
+
+    # Write then rename, so a half-written cache entry is never loaded
+    os.makedirs(constants.PATTERN_CACHE_DIR, exist_ok=True)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+
+    with open(temp_path, "wb") as file:
+        np.save(file, res)
+
+    os.replace(temp_path, cache_path)
+    return res
+
+
+def parse_pattern(content: bytes) -> np.ndarray:
+    """Parses a pattern's (x,y) coords, the format is sniffed from the content"""
+    if content.lstrip().startswith(b"#Life 1.06"):
+        res = parse_life_106(content)
+    elif RLE_HEADER_PATTERN.search(content):
+        res = parse_rle(content)
+    else:
+        res = parse_plaintext(content)
+
+    return _get_normalised(res)
+
+
+def parse_rle(content: bytes) -> np.ndarray:
+    """Parses an RLE pattern's (x,y) coords, any tag other than "b" is an alive cell (multi-state patterns)"""
+    # Only the alive runs are kept (start x, y, length), expanded to coords in 1 go at the end
+    run_xs, run_ys, run_lengths = array("q"), array("q"), array("q")
+    x, y = 0, 0
+
+    # Lines are joined before tokenising, as a run's count may be split across lines
+    body = b"".join(
+        line.strip() for line in content.splitlines() if not line.startswith(b"#") and not RLE_HEADER_PATTERN.match(line)
+    )
+
+    for count, tag in RLE_TOKEN_PATTERN.findall(body):
+        count = int(count) if count else 1
+
+        match tag:
+            case b"!":
+                break
+            case b"$":
+                x, y = 0, y + count
+            case b"b" | b".":
+                x += count
+            case _:
+                run_xs.append(x)
+                run_ys.append(y)
+                run_lengths.append(count)
+                x += count
+
+    return _get_run_coords(run_xs, run_ys, run_lengths)
+
+
+def parse_plaintext(content: bytes) -> np.ndarray:
+    """Parses a plaintext pattern's (x,y) coords, "O" or "*" is an alive cell"""
+    data = np.frombuffer(content, dtype=np.uint8)
+
+    if not len(data):
+        return np.empty((0, 2), dtype=np.int64)
+
+    # Every byte's line (index) and col (x), from the newlines before it
+    is_newline = data == ord("\n")
+    indices = np.arange(len(data))
+    lines = np.cumsum(is_newline) - is_newline
+    line_starts = np.concatenate(([0], np.flatnonzero(is_newline) + 1))
+    xs = indices - line_starts[lines]
+
+    # Comment lines are skipped, so rows are counted w/o them
+    is_comment_line = np.zeros(len(line_starts), dtype=bool)
+    is_comment_line[line_starts < len(data)] = data[line_starts[line_starts < len(data)]] == ord("!")
+    rows = np.cumsum(~is_comment_line) - 1
+
+    is_alive = ((data == ord("O")) | (data == ord("*"))) & ~is_comment_line[lines]
+    res = np.column_stack((xs[is_alive], rows[lines[is_alive]]))
+    return res
+
+
+def parse_life_106(content: bytes) -> np.ndarray:
+    """Parses a Life 1.06 pattern's (x,y) coords"""
+    numbers = [line for line in content.split(b"\n") if line.strip() and not line.lstrip().startswith(b"#")]
+    res = np.array(b" ".join(numbers).split(), dtype=np.int64).reshape(-1, 2)
+    return res
+
+
+def get_centred_cells(cells: np.ndarray, cols: int, rows: int) -> np.ndarray:
+    """Shifts a pattern's (x,y) coords to the centre of a matrix (patterns bigger than the matrix overflow evenly)"""
+    if not len(cells):
+        return cells
+
+    width, height = cells.max(axis=0) + 1
+    res = cells + ((cols - width) // 2, (rows - height) // 2)
+    return res
+
+
+def _get_run_coords(run_xs: array, run_ys: array, run_lengths: array) -> np.ndarray:
+    """Expands runs of alive cells (start x, y, length) to (x,y) coords"""
+    lengths = np.frombuffer(run_lengths, dtype=np.int64)
+    run_indices = np.repeat(np.arange(len(lengths)), lengths)
+    run_offsets = np.arange(len(run_indices)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+    xs = np.frombuffer(run_xs, dtype=np.int64)[run_indices] + run_offsets
+    ys = np.frombuffer(run_ys, dtype=np.int64)[run_indices]
+    res = np.column_stack((xs, ys))
+    return res
+
+
+def _get_normalised(cells: np.ndarray) -> np.ndarray:
+    """Shifts (x,y) coords so the top-left cell is (0,0)"""
+    if not len(cells):
+        return np.empty((0, 2), dtype=np.int64)
+
+    res = (cells - cells.min(axis=0)).astype(np.int64)
+    return res
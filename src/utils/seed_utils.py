@@ -1,13 +1,11 @@
-from src.constants.seeds import NONE, GLIDER
+from src.constants.seeds import GLIDER
 from src.enums.seed import Seed
 
 
-def get_seed(name: Seed) -> list[tuple[int, int]]:
-    """Returns a list of (x,y) coords to plant the seed"""
+def get_seed(name: Seed) -> list[tuple[int, int]] | None:
+    """Returns a list of (x,y) coords to plant the seed (None = random cells)"""
     match name:
-        case Seed.NONE:
-            return NONE
         case Seed.GLIDER:
             return GLIDER
         case _:
-            return []
+            return None
@@ -1,4 +1,6 @@
 from src.enums.neighbourhood import Neighbourhood
+from src.enums.on_cycle import OnCycle
+from src.enums.engine import Engine
 from src.models.setting import Setting
 from src.constants import constants
 from src.enums.seed import Seed
@@ -62,6 +64,14 @@ def get_settings(args: dict[str, object]) -> list[Setting]:
             parse_value_callback=parse_bool,
             helper_text="Toggle ghost mode (older generations fading away)",
         ),
+        Setting(
+            display_name="Ghost length",
+            name="ghost_length",
+            value=args.get("ghost_length", constants.DEFAULT_GHOST_LENGTH),
+            default_value=constants.DEFAULT_GHOST_LENGTH,
+            parse_value_callback=parse_ghost_length,
+            helper_text=f"Generations a dead cell fades away for {constants.MIN_GHOST_LENGTH}..{constants.MAX_GHOST_LENGTH} inclusive",
+        ),
         Setting(
             display_name="Wrap mode",
             name="is_wrap_mode",
@@ -104,6 +114,40 @@ def get_settings(args: dict[str, object]) -> list[Setting]:
             parse_value_callback=parse_radius,
             helper_text="Size of the neighbourhood",
         ),
+        Setting(
+            display_name="Engine",
+            name="engine",
+            value=args.get("engine", constants.DEFAULT_ENGINE.value),
+            default_value=constants.DEFAULT_ENGINE.value,
+            possible_values=["Python", "NumPy", "Incremental", "Bitwise", "HashLife", "Sparse"],
+            parse_value_callback=parse_engine,
+            helper_text="Engine used to mutate the cells",
+        ),
+        Setting(
+            display_name="Workers",
+            name="workers",
+            value=args.get("workers", constants.DEFAULT_WORKERS),
+            default_value=constants.DEFAULT_WORKERS,
+            parse_value_callback=parse_workers,
+            helper_text=f"Processes to mutate the cells across (NumPy engine) {constants.MIN_WORKERS}..{constants.MAX_WORKERS} inclusive",
+        ),
+        Setting(
+            display_name="Generation step",
+            name="generation_step",
+            value=args.get("generation_step", constants.DEFAULT_GENERATION_STEP),
+            default_value=constants.DEFAULT_GENERATION_STEP,
+            parse_value_callback=parse_generation_step,
+            helper_text=f"Generations between each update {constants.MIN_GENERATION_STEP}..{constants.MAX_GENERATION_STEP} inclusive",
+        ),
+        Setting(
+            display_name="On cycle",
+            name="on_cycle",
+            value=args.get("on_cycle", constants.DEFAULT_ON_CYCLE.value),
+            default_value=constants.DEFAULT_ON_CYCLE.value,
+            possible_values=["Stop", "Continue", "FastForward"],
+            parse_value_callback=parse_on_cycle,
+            helper_text="Once cells repeat a previous generation (died out, froze or oscillating)",
+        ),
         # NOTE: Seed setting not accessable via CLI yet
         Setting(
             display_name="Seed",
@@ -169,6 +213,15 @@ def parse_bool(value) -> bool | None:
         return None
 
 
+def parse_ghost_length(value) -> int | None:
+    """Returns the parsed ghost length, otherwise None"""
+    try:
+        if constants.MIN_GHOST_LENGTH <= int(value) <= constants.MAX_GHOST_LENGTH:
+            return int(value)
+    except:
+        return None
+
+
 def parse_rule(value) -> set | None:
     """Returns the parsed rule, otherwise None"""
 
@@ -209,6 +262,31 @@ def parse_neighbourhood(value) -> Neighbourhood | None:
         return None
 
 
+def parse_engine(value) -> Engine | None:
+    """Returns the parsed engine, otherwise None"""
+    try:
+        if not isinstance(value, str):
+            return None
+
+        match value.lower():
+            case "python":
+                return Engine.PYTHON
+            case "numpy":
+                return Engine.NUMPY
+            case "incremental":
+                return Engine.INCREMENTAL
+            case "bitwise":
+                return Engine.BITWISE
+            case "hashlife":
+                return Engine.HASHLIFE
+            case "sparse":
+                return Engine.SPARSE
+            case _:
+                return None
+    except:
+        return None
+
+
 def parse_radius(value) -> int | None:
     """Returns the parsed radius, otherwise None"""
     try:
@@ -218,6 +296,43 @@ def parse_radius(value) -> int | None:
         return None
 
 
+def parse_workers(value) -> int | None:
+    """Returns the parsed workers count, otherwise None"""
+    try:
+        if constants.MIN_WORKERS <= int(value) <= constants.MAX_WORKERS:
+            return int(value)
+    except:
+        return None
+
+
+def parse_generation_step(value) -> int | None:
+    """Returns the parsed generation step, otherwise None"""
+    try:
+        if constants.MIN_GENERATION_STEP <= int(value) <= constants.MAX_GENERATION_STEP:
+            return int(value)
+    except:
+        return None
+
+
+def parse_on_cycle(value) -> OnCycle | None:
+    """Returns the parsed on cycle action, otherwise None"""
+    try:
+        if not isinstance(value, str):
+            return None
+
+        match value.lower():
+            case "stop":
+                return OnCycle.STOP
+            case "continue":
+                return OnCycle.CONTINUE
+            case "fastforward":
+                return OnCycle.FAST_FORWARD
+            case _:
+                return None
+    except:
+        return None
+
+
 def parse_seed(value) -> Seed | None:
     """Returns the parsed seed, otherwise None"""
     try:
@@ -1,3 +1,16 @@
+from src.constants import constants
+import numpy as np
+
+# Dev notes:
+#   - Frames are built as a buffer of unicode code points (uint32), then decoded to a string once
+#   - Every cell is the same width (2 chars) so each row of the buffer is the same width
+
+_GLYPH_CODE_POINTS = np.array(
+    [[ord(char) for char in glyph] for glyph in constants.CELL_GLYPHS],
+    dtype="<u4",
+)  # indexed by CellCode
+
+
 def get_banner(line_width: int = 0):
     """Gets the banner as a single string, optionally centered"""
 
@@ -12,3 +25,59 @@ def get_banner(line_width: int = 0):
 
     res = "\n".join([line.center(line_width + 1) for line in lines])
     return res
+
+
+def get_frame(codes: np.ndarray, is_bordered: bool = True) -> str:
+    """Gets a matrix of cell codes (see CellCode) as a single string of cell states, optionally w borders"""
+    rows, cols = codes.shape
+    cells = _GLYPH_CODE_POINTS[codes].reshape(rows, -1)
+    width = cells.shape[1]
+
+    if not is_bordered:
+        buffer = np.empty((rows, width + 1), dtype="<u4")
+        buffer[:, :-1] = cells
+        buffer[:, -1] = ord("\n")
+        return buffer.tobytes().decode("utf-32-le")[:-1]  # drop the last newline
+
+    # Border the cells (sides, top and bottom) and end each line w a newline
+    buffer = np.empty((rows + 2, width + 3), dtype="<u4")
+    buffer[0, 0], buffer[0, -2] = ord("╭"), ord("╮")
+    buffer[-1, 0], buffer[-1, -2] = ord("╰"), ord("╯")
+    buffer[[0, -1], 1:-2] = ord("┈")
+    buffer[1:-1, [0, -2]] = ord("┊")
+    buffer[1:-1, 1:-2] = cells
+    buffer[:, -1] = ord("\n")
+
+    return buffer.tobytes().decode("utf-32-le")[:-1]  # drop the last newline
+
+
+def get_lines_diff(prev_lines: list[str], lines: list[str]) -> list[tuple[int, int, str]]:
+    """
+    Gets the runs of chars that changed between 2 lists of lines, as (y, x, text) to write over the previous lines
+        - Lines that are shorter (or missing) are treated as blank (spaces), so left over chars get overwritten
+    """
+    res: list[tuple[int, int, str]] = []
+
+    for y in range(max(len(prev_lines), len(lines))):
+        prev_line = prev_lines[y] if y < len(prev_lines) else ""
+        line = lines[y] if y < len(lines) else ""
+
+        if line == prev_line:
+            continue
+
+        width = max(len(prev_line), len(line))
+        prev_line, line = prev_line.ljust(width), line.ljust(width)
+        x = 0
+
+        while x < width:
+            if prev_line[x] == line[x]:
+                x += 1
+                continue
+
+            start = x
+            while x < width and prev_line[x] != line[x]:
+                x += 1
+
+            res.append((y, start, line[start:x]))
+
+    return res
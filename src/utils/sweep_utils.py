@@ -0,0 +1,141 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from src.utils.batch_utils import get_headless_run, get_parsed_settings
+from itertools import product
+import multiprocessing
+import json
+import re
+import os
+
+# Dev notes:
+#   - A sweep runs every combination of the spec's values (see get_sweep_combinations) across a process pool
+#   - Each run is appended to the output (JSON lines) as soon as it finishes, so an interrupted sweep resumes
+#     by skipping the runs already written (see get_done_keys)
+#   - Run 'n' of every combination shares the RNG seed 'rng_seed + n', so combinations are compared on the same soups
+
+RANGE_PATTERN = re.compile(r"^(-?\d+)\.\.(-?\d+)(?::(\d+))?$")  # 'start..stop' or 'start..stop:step' (inclusive)
+
+
+def get_sweep_values(value: object) -> list:
+    """
+    Gets the values to sweep over from a spec value
+        - Lists are kept as is
+        - Ranges ('10..90:20') are expanded (inclusive)
+        - Anything else is a single value
+    """
+    if isinstance(value, list):
+        return value
+
+    match = RANGE_PATTERN.match(value) if isinstance(value, str) else None
+
+    if match:
+        start, stop, step = int(match[1]), int(match[2]), int(match[3] or 1)
+        return list(range(start, stop + 1, step))
+
+    return [value]
+
+
+def get_sweep_combinations(spec: dict, args: dict) -> list[dict]:
+    """
+    Gets every combination of the spec's values (see get_sweep_values), keys are the args' keys (see get_cli_args)
+        - Raises a ValueError if a key is not an arg or a value is empty
+    """
+    unknown_keys = sorted(key for key in spec if key not in args)
+
+    if unknown_keys:
+        raise ValueError(f"Unknown sweep keys: {', '.join(unknown_keys)}")
+
+    keys = sorted(spec)
+    values = [get_sweep_values(spec[key]) for key in keys]
+    empty_keys = [key for key, key_values in zip(keys, values) if not key_values]
+
+    if empty_keys:
+        raise ValueError(f"Empty sweep keys: {', '.join(empty_keys)}")
+
+    res = [dict(zip(keys, combination)) for combination in product(*values)]
+    return res
+
+
+def get_run_key(combination: dict, run: int) -> tuple[str, int]:
+    """Gets a run's key, the same for equal combinations (regardless of key order)"""
+    return json.dumps(combination, sort_keys=True), run
+
+
+def get_done_keys(path: str) -> set[tuple[str, int]]:
+    """Gets the keys of the runs already written to a sweep's output, skips unreadable (cut off) lines"""
+    res: set[tuple[str, int]] = set()
+
+    if not os.path.exists(path):
+        return res
+
+    with open(path) as file:
+        for line in file:
+            try:
+                result = json.loads(line)
+                res.add(get_run_key(result["combination"], result["run"]))
+            except:
+                continue
+
+    return res
+
+
+def get_sweep_run(args: dict, combination: dict, run: int, rng_seed: int) -> dict:
+    """Runs a combination (overriding the args) w a RNG seed, returns the run's stats w/o the alive cells (too big to keep per run)"""
+    # Checkpoints are per run (a sweep resumes from its output instead)
+    stats = get_headless_run({**args, **combination, "checkpoint_every": 0, "is_resume": False}, rng_seed)
+    del stats["alive_cell_coords"]
+
+    res = {"combination": combination, "run": run, **stats}
+    return res
+
+
+def run_sweep(args: dict, spec: dict, path: str, num_of_jobs: int | None = None) -> int:
+    """
+    Runs every combination of the spec 'num_of_runs' times across a process pool, appends each run to the output (JSON lines)
+        - Runs already in the output are skipped (resumes an interrupted sweep)
+        - Raises a ValueError if the spec or any combination's settings are invalid (before any runs)
+        - Returns the number of runs written
+    """
+    combinations = get_sweep_combinations(spec, args)
+
+    for combination in combinations:
+        get_parsed_settings({**args, **combination})
+
+    done_keys = get_done_keys(path)
+    rng_seed = args["rng_seed"] or 0
+    pending_runs = [
+        (combination, run)
+        for combination in combinations
+        for run in range(args["num_of_runs"])
+        if get_run_key(combination, run) not in done_keys
+    ]
+
+    if not pending_runs:
+        return 0
+
+    # Spawn (not fork) like GifExporter, workers start clean instead of copying the parent's state
+    executor = ProcessPoolExecutor(max_workers=num_of_jobs, mp_context=multiprocessing.get_context("spawn"))
+    num_of_runs_written = 0
+
+    try:
+        with open(path, "a") as output:
+            # End a line cut off by an interrupted sweep, so the next run starts on its own line
+            if output.tell() > 0 and not _is_line_ended(path):
+                output.write("\n")
+
+            futures = [executor.submit(get_sweep_run, args, combination, run, rng_seed + run) for combination, run in pending_runs]
+
+            for future in as_completed(futures):
+                output.write(json.dumps(future.result()) + "\n")
+                output.flush()
+                num_of_runs_written += 1
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+    return num_of_runs_written
+
+
+def _is_line_ended(path: str) -> bool:
+    """Checks if a (non-empty) file ends w a newline"""
+    with open(path, "rb") as file:
+        file.seek(-1, os.SEEK_END)
+        return file.read(1) == b"\n"
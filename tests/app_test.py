@@ -0,0 +1,29 @@
+from src.models.simulation_screen import SimulationScreen
+from src.utils.batch_utils import get_parsed_settings
+from types import SimpleNamespace
+from src import app
+import pytest
+import json
+import sys
+
+
+@pytest.mark.parametrize("error", [KeyboardInterrupt, RuntimeError])
+def test_main_profile_summary_on_error_success(error, tmp_path, monkeypatch, capsys):
+    path = tmp_path / "trace.json"
+
+    def show(self):
+        with self._profiler.phase("mutate"):
+            pass
+
+        raise error()
+
+    # Skips the menu (settings as given) and cuts the run short
+    monkeypatch.setattr(sys, "argv", ["game-of-life.py", "--profile", "--trace", str(path)])
+    monkeypatch.setattr(app, "MenuScreen", lambda settings: SimpleNamespace(show=lambda: get_parsed_settings(app.get_cli_args())))
+    monkeypatch.setattr(SimulationScreen, "show", show)
+
+    app.main()
+
+    out = capsys.readouterr().out
+    assert "mutate" in out and "p95 ms" in out
+    assert [event["name"] for event in json.loads(path.read_text())["traceEvents"]] == ["mutate"]
@@ -10,11 +10,29 @@ def test_get_cli_args_success():
         "num_of_generations",
         "updates_per_s",
         "is_ghost_mode",
+        "ghost_length",
         "is_wrap_mode",
         "survival_rule",
         "resurrection_rule",
         "neighbourhood",
         "radius",
+        "engine",
+        "generation_step",
+        "workers",
+        "on_cycle",
+        "is_headless",
+        "num_of_runs",
+        "rng_seed",
+        "output",
+        "sweep_path",
+        "num_of_jobs",
+        "pattern_path",
+        "checkpoint_every",
+        "checkpoint_dir",
+        "is_resume",
+        "is_profiling",
+        "is_profiling_memory",
+        "trace_path",
     }
 
     assert isinstance(args, dict)
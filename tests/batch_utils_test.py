@@ -0,0 +1,31 @@
+from src.utils.batch_utils import get_run_stats
+from src.models.cell_matrix import CellMatrix
+from src.enums.on_cycle import OnCycle
+import pytest
+
+BLINKER = [(1, 2), (2, 2), (3, 2)]
+
+
+@pytest.mark.parametrize("on_cycle, expected_generation", [
+    (OnCycle.STOP, 2),
+    (OnCycle.FAST_FORWARD, 11),
+    (OnCycle.CONTINUE, 11),
+])
+def test_get_run_stats_cycle_success(on_cycle, expected_generation):
+    stats = get_run_stats(CellMatrix(seed=BLINKER, cols=5, rows=5), 11, on_cycle=on_cycle)
+    expected_gen = CellMatrix(seed=BLINKER, cols=5, rows=5)
+    expected_gen.advance(expected_generation)
+
+    assert stats["generation"] == expected_generation
+    assert stats["population"] == 3
+    assert stats["period"] == (None if on_cycle == OnCycle.CONTINUE else 2)
+    assert stats["extinct_generation"] is None
+    assert stats["alive_cell_coords"] == expected_gen.alive_cell_coords
+
+
+def test_get_run_stats_extinct_success():
+    stats = get_run_stats(CellMatrix(seed=[(2, 2)], cols=5, rows=5), 10)
+
+    assert stats["population"] == 0
+    assert stats["extinct_generation"] == 1
+    assert (stats["cycle_start"], stats["period"]) == (1, 1)
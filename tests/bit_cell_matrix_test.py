@@ -0,0 +1,52 @@
+from src.models.sparse_cell_matrix import SparseCellMatrix
+from src.models.hash_life_matrix import HashLifeMatrix
+from src.models.bit_cell_matrix import BitCellMatrix
+from src.enums.neighbourhood import Neighbourhood
+from src.models.cell_matrix import CellMatrix
+from src.enums.cell_state import CellState
+from src.enums.cell_code import CellCode
+from src.enums.engine import Engine
+import random
+import pytest
+
+
+@pytest.mark.parametrize("neighbourhood, radius", [(Neighbourhood.MOORE, 1), (Neighbourhood.VON_NEUMANN, 2)])
+@pytest.mark.parametrize("is_wrap", [True, False])
+@pytest.mark.parametrize("cols, rows", [(13, 9), (70, 4), (2, 5)])
+def test_mutate_matches_python_engine(neighbourhood, radius, is_wrap, cols, rows):
+    NUM_OF_GENERATIONS = 8
+    random.seed(cols * rows)
+    settings = {
+        "cols": cols,
+        "rows": rows,
+        "radius": radius,
+        "is_wrap": is_wrap,
+        "neighbourhood": neighbourhood,
+        "survival_rule": {2, 3},
+        "resurrection_rule": {3, 6},
+    }
+    python_matrix = CellMatrix(engine=Engine.PYTHON, **settings)
+    bit_matrix = BitCellMatrix(seed=python_matrix.alive_cell_coords, **settings)
+
+    for _ in range(NUM_OF_GENERATIONS):
+        python_matrix.mutate()
+        bit_matrix.mutate()
+
+        assert bit_matrix.as_str == python_matrix.as_str
+
+
+@pytest.mark.parametrize("matrix_type", [CellMatrix, BitCellMatrix, HashLifeMatrix, SparseCellMatrix])
+def test_change_state_alive_to_ghost_success(matrix_type):
+    # Alive cells changed to a ghost state can't mutate, so no engine keeps them alive
+    blinker = [(1, 2), (2, 2), (3, 2)]
+    matrix = matrix_type(seed=blinker, cols=5, rows=5)
+    empty_matrix = matrix_type(seed=blinker, cols=5, rows=5)
+    empty_matrix.apply_cells(blinker, CellState.DEAD)
+
+    matrix.change_state(CellState.RARE)
+    matrix.mutate()
+
+    assert matrix.population == 0
+    assert matrix.alive_cell_coords == []
+    assert all(code == CellCode.DEAD for row in matrix.codes for code in row)
+    assert matrix.fingerprint == empty_matrix.fingerprint
@@ -0,0 +1,60 @@
+from src.enums.neighbourhood import Neighbourhood
+from src.models.cell_matrix import CellMatrix
+from src.enums.cell_state import CellState
+from src.enums.cell_code import CellCode
+from src.enums.engine import Engine
+import random
+import pytest
+
+
+@pytest.mark.parametrize("engine", [Engine.NUMPY, Engine.INCREMENTAL])
+@pytest.mark.parametrize("neighbourhood", [Neighbourhood.MOORE, Neighbourhood.VON_NEUMANN])
+@pytest.mark.parametrize("is_wrap", [True, False])
+@pytest.mark.parametrize("radius, cols, rows", [(1, 12, 9), (2, 12, 9), (3, 4, 5)])
+def test_mutate_engine_matches_python_engine(engine, neighbourhood, is_wrap, radius, cols, rows):
+    NUM_OF_GENERATIONS = 24
+    random.seed(radius * cols * rows)
+    settings = {
+        "cols": cols,
+        "rows": rows,
+        "radius": radius,
+        "is_wrap": is_wrap,
+        "neighbourhood": neighbourhood,
+        "survival_rule": {2, 3, 5},
+        "resurrection_rule": {3, 4},
+    }
+    python_matrix = CellMatrix(engine=Engine.PYTHON, **settings)
+    engine_matrix = CellMatrix(engine=engine, seed=python_matrix.alive_cell_coords, **settings)
+
+    for _ in range(NUM_OF_GENERATIONS):
+        python_matrix.mutate()
+        engine_matrix.mutate()
+
+        assert engine_matrix.matrix == python_matrix.matrix
+
+
+def test_change_state_stores_codes_and_renders_chars():
+    matrix = CellMatrix(seed=[(0, 0), (2, 1)], cols=3, rows=2)
+    matrix.change_state(CellState.MEDIUM)
+
+    assert matrix.codes == [
+        [CellCode.MEDIUM, CellCode.DEAD, CellCode.DEAD],
+        [CellCode.DEAD, CellCode.DEAD, CellCode.MEDIUM],
+    ]
+    assert matrix.as_str == "\n".join([
+        CellState.MEDIUM.value + CellState.DEAD.value + CellState.DEAD.value,
+        CellState.DEAD.value + CellState.DEAD.value + CellState.MEDIUM.value,
+    ])
+
+
+def test_mutate_incremental_copies_changed_rows_only():
+    # A blinker in rows 2..4, the other rows never change
+    matrix = CellMatrix(seed=[(2, 3), (3, 3), (4, 3)], cols=7, rows=7, engine=Engine.INCREMENTAL)
+    prev_codes = matrix.codes
+    prev_rows = [row.copy() for row in prev_codes]
+
+    matrix.mutate()
+    matrix.mutate()
+
+    assert prev_codes == prev_rows  # older matrices aren't mutated
+    assert [matrix.codes[y] is prev_codes[y] for y in range(7)] == [True, True, False, False, False, True, True]
@@ -0,0 +1,81 @@
+from src.utils.checkpoint_utils import write_checkpoint, read_checkpoint, get_checkpoint_path, get_latest_checkpoint, get_resume, HEADER_SIZE
+from src.models.hash_life_matrix import HashLifeMatrix
+from src.enums.neighbourhood import Neighbourhood
+from src.models.cell_matrix import CellMatrix
+import pytest
+import os
+
+GLIDER = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
+SETTINGS_DICT = {
+    "neighbourhood": Neighbourhood.VON_NEUMANN,
+    "is_wrap_mode": False,
+    "radius": 2,
+    "survival_rule": {2, 3, 100},
+    "resurrection_rule": {3},
+}
+
+
+def test_read_checkpoint_success(tmp_path):
+    path = get_checkpoint_path(str(tmp_path), 42)
+    write_checkpoint(path, CellMatrix(seed=GLIDER, cols=13, rows=7), 42, SETTINGS_DICT)
+
+    header, cells = read_checkpoint(path)
+
+    assert header == {
+        "generation": 42,
+        "cols": 13,
+        "rows": 7,
+        "neighbourhood": "VonNeumann",
+        "is_wrap_mode": False,
+        "radius": 2,
+        "survival_rule": "2,3,100",
+        "resurrection_rule": "3",
+    }
+    assert set(map(tuple, cells.tolist())) == set(GLIDER)
+    assert os.path.getsize(path) == HEADER_SIZE + 7 * 2  # 13 cols packed into 2 bytes per row
+
+
+def test_get_resume_cells_outside_matrix_success(tmp_path):
+    # Unbounded engines keep cells outside the matrix, their coords are stored instead of a board
+    cells = GLIDER + [(-5, -3), (20, 9)]
+    args = {"checkpoint_dir": str(tmp_path), "cols": 1, "rows": 1}
+    write_checkpoint(get_checkpoint_path(str(tmp_path), 7), HashLifeMatrix(seed=cells, cols=6, rows=6), 7, SETTINGS_DICT)
+
+    resumed_args, resumed_cells, generation = get_resume(args)
+
+    assert (resumed_args["cols"], resumed_args["rows"]) == (6, 6)
+    assert set(map(tuple, resumed_cells.tolist())) == set(cells)
+    assert generation == 7
+
+
+def test_read_checkpoint_far_apart_cells_success(tmp_path):
+    # Cells far apart (e.g. a glider after a HashLife jump) cost the same as cells close together
+    cells = GLIDER + [(10**9, -10**9)]
+    path = get_checkpoint_path(str(tmp_path), 1)
+    write_checkpoint(path, HashLifeMatrix(seed=cells, cols=6, rows=6), 1, SETTINGS_DICT)
+
+    _, resumed_cells = read_checkpoint(path)
+
+    assert set(map(tuple, resumed_cells.tolist())) == set(cells)
+    assert os.path.getsize(path) == HEADER_SIZE + len(cells) * 16
+
+
+def test_get_latest_checkpoint_success(tmp_path):
+    for generation in [9, 100, 10]:
+        write_checkpoint(get_checkpoint_path(str(tmp_path), generation), CellMatrix(seed=GLIDER), generation, SETTINGS_DICT)
+
+    assert get_latest_checkpoint(str(tmp_path)) == get_checkpoint_path(str(tmp_path), 100)
+    assert get_latest_checkpoint(str(tmp_path / "missing")) is None
+
+
+def test_read_checkpoint_invalid_failure(tmp_path):
+    path = tmp_path / "checkpoint-1.ckpt"
+    path.write_bytes(b"not a checkpoint" * 8)
+
+    with pytest.raises(ValueError):
+        read_checkpoint(str(path))
+
+
+def test_get_resume_no_checkpoints_failure(tmp_path):
+    with pytest.raises(ValueError):
+        get_resume({"checkpoint_dir": str(tmp_path)})
@@ -0,0 +1,31 @@
+from src.utils.checkpoint_utils import get_checkpoint_paths, get_checkpoint_path
+from src.enums.neighbourhood import Neighbourhood
+from src.models.checkpointer import Checkpointer
+from src.models.cell_matrix import CellMatrix
+
+SETTINGS_DICT = {
+    "neighbourhood": Neighbourhood.MOORE,
+    "is_wrap_mode": True,
+    "radius": 1,
+    "survival_rule": {2, 3},
+    "resurrection_rule": {3},
+}
+
+
+def test_checkpointer_add_success(tmp_path):
+    checkpointer = Checkpointer(str(tmp_path), every=10, settings_dict=SETTINGS_DICT, max_checkpoints=2)
+    matrix = CellMatrix()
+
+    # Steps of 4 cross a multiple of 10 at 12, 20, 32 and 40
+    written_generations = [generation for generation in range(4, 44, 4) if checkpointer.add(matrix, generation)]
+
+    assert written_generations == [12, 20, 32, 40]
+    assert checkpointer.num_of_checkpoints_written == 4
+    assert get_checkpoint_paths(str(tmp_path)) == [get_checkpoint_path(str(tmp_path), g) for g in [32, 40]]
+
+
+def test_checkpointer_add_resumed_success(tmp_path):
+    checkpointer = Checkpointer(str(tmp_path), every=10, settings_dict=SETTINGS_DICT, initial_generation=20)
+
+    assert not checkpointer.add(CellMatrix(), 21)
+    assert checkpointer.add(CellMatrix(), 30)
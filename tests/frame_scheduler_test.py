@@ -0,0 +1,63 @@
+from src.models.frame_scheduler import FrameScheduler
+from threading import Event
+import pytest
+
+
+class FakeClock:
+    """A clock that only moves when slept (or told to)"""
+
+    def __init__(self):
+        self.now_s = 0.0
+
+    def __call__(self) -> float:
+        return self.now_s
+
+    def sleep(self, duration_s: float):
+        self.now_s += duration_s
+
+
+def test_frames_are_shown_on_schedule():
+    NUM_OF_FRAMES = 10
+    clock = FakeClock()
+    scheduler = FrameScheduler(range(NUM_OF_FRAMES), 4, clock=clock, sleep=clock.sleep)
+    shown_at_s = []
+
+    for _ in scheduler:
+        shown_at_s.append(clock.now_s)
+
+    assert shown_at_s == [pytest.approx((idx + 1) / 4) for idx in range(NUM_OF_FRAMES)]
+    assert scheduler.achieved_rate == pytest.approx(4)
+    assert scheduler.num_of_dropped_frames == 0
+
+
+def test_frames_are_dropped_when_behind():
+    NUM_OF_FRAMES = 8
+    is_produced = Event()
+
+    def frames():
+        yield from range(NUM_OF_FRAMES)
+        is_produced.set()
+
+    clock = FakeClock()
+    scheduler = FrameScheduler(frames(), 10, max_queued=NUM_OF_FRAMES, clock=clock, sleep=clock.sleep)
+    shown_frames = []
+
+    for frame in scheduler:
+        is_produced.wait(timeout=5)  # all frames are ready before falling behind
+        shown_frames.append(frame)
+        clock.now_s += 0.25  # each draw takes 2.5 frames
+
+    assert shown_frames[-1] == NUM_OF_FRAMES - 1  # the last frame is always shown
+    assert len(shown_frames) + scheduler.num_of_dropped_frames == NUM_OF_FRAMES
+    assert scheduler.num_of_dropped_frames > 0
+
+
+def test_producer_errors_are_raised():
+    def frames():
+        yield 1
+        raise ValueError("boom")
+
+    clock = FakeClock()
+
+    with pytest.raises(ValueError):
+        list(FrameScheduler(frames(), 10, clock=clock, sleep=clock.sleep))
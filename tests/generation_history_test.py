@@ -0,0 +1,51 @@
+from src.models.generation_history import GenerationHistory
+import numpy as np
+import pytest
+
+
+def get_generations(num_of_generations: int, shape: tuple[int, int] = (6, 9)) -> list[np.ndarray]:
+    """Gets random generations of codes (0..4)"""
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 5, size=shape, dtype=np.uint8) for _ in range(num_of_generations)]
+
+
+def test_generation_history_get_success():
+    generations = get_generations(11)
+
+    with GenerationHistory(keyframe_interval=4) as history:
+        for codes in generations:
+            history.add(codes)
+
+        # Any order, keyframes (0, 4, 8) and deltas alike
+        for index in [10, 0, 5, 4, 3, -1, -11]:
+            assert np.array_equal(history[index], generations[index])
+
+        assert len(history) == 11
+        assert all(np.array_equal(a, b) for a, b in zip(history, generations))
+
+
+def test_generation_history_compresses_success():
+    # A still life after the first generation, deltas are all zeros
+    codes = get_generations(1, shape=(30, 30))[0]
+
+    with GenerationHistory(keyframe_interval=1_000) as history:
+        for _ in range(1_000):
+            history.add(codes)
+
+        assert history.num_of_bytes < 1_000 * codes.size // 10
+
+
+def test_generation_history_out_of_range_failure():
+    with GenerationHistory() as history:
+        history.add(get_generations(1)[0])
+
+        with pytest.raises(IndexError):
+            history[1]
+
+
+def test_generation_history_different_size_failure():
+    with GenerationHistory() as history:
+        history.add(np.zeros((3, 4), dtype=np.uint8))
+
+        with pytest.raises(ValueError):
+            history.add(np.zeros((4, 3), dtype=np.uint8))
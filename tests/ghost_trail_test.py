@@ -0,0 +1,46 @@
+from src.models.ghost_trail import GhostTrail
+from src.enums.cell_code import CellCode
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("length, expected_codes", [
+    (1, [CellCode.ALIVE, CellCode.WELL_DONE, CellCode.DEAD, CellCode.DEAD]),
+    (3, [CellCode.ALIVE, CellCode.WELL_DONE, CellCode.MEDIUM, CellCode.RARE, CellCode.DEAD, CellCode.DEAD]),
+    (6, [CellCode.ALIVE] + [CellCode.WELL_DONE] * 2 + [CellCode.MEDIUM] * 2 + [CellCode.RARE] * 2 + [CellCode.DEAD]),
+])
+def test_codes_fade_as_cell_ages(length, expected_codes):
+    alive = np.array([[CellCode.ALIVE]], dtype=np.uint8)
+    dead = np.array([[CellCode.DEAD]], dtype=np.uint8)
+    ghost_trail = GhostTrail(length)
+    ghost_trail.update(alive)
+    codes_to_assert = [ghost_trail.codes[0][0]]
+
+    for _ in range(len(expected_codes) - 1):
+        ghost_trail.update(dead)
+        codes_to_assert.append(ghost_trail.codes[0][0])
+
+    assert codes_to_assert == expected_codes
+
+
+def test_update_resets_alive_cells():
+    ghost_trail = GhostTrail(3)
+    ghost_trail.update(np.array([[CellCode.ALIVE, CellCode.ALIVE]], dtype=np.uint8))
+    ghost_trail.update(np.array([[CellCode.DEAD, CellCode.DEAD]], dtype=np.uint8))
+    ghost_trail.update(np.array([[CellCode.DEAD, CellCode.ALIVE]], dtype=np.uint8))
+
+    assert ghost_trail.ages.tolist() == [[2, 0]]
+    assert ghost_trail.codes.tolist() == [[CellCode.MEDIUM, CellCode.ALIVE]]
+
+
+def test_shift_moves_ages_success():
+    ghost_trail = GhostTrail(length=3)
+    codes = np.zeros((3, 4), dtype=np.uint8)
+    codes[1, 1] = CellCode.ALIVE
+    ghost_trail.update(codes)
+
+    ghost_trail.shift(2, -1)
+
+    expected_ages = np.full((3, 4), 4, dtype=np.uint8)  # moved in cells are dead (length + 1)
+    expected_ages[0, 3] = 0
+    assert (ghost_trail.ages == expected_ages).all()
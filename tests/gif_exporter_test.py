@@ -0,0 +1,54 @@
+from src.models.gif_exporter import GifExporter
+from src.enums.cell_code import CellCode
+from PIL import Image
+import numpy as np
+import pytest
+import signal
+import time
+import os
+
+
+def test_finish_exports_all_frames_success(tmp_path):
+    NUM_OF_FRAMES = 6
+    path = tmp_path / "test.gif"
+    rng = np.random.default_rng(0)
+
+    with GifExporter(str(path), cell_size=2) as gif_exporter:
+        for _ in range(NUM_OF_FRAMES):
+            gif_exporter.add(rng.integers(CellCode.DEAD, CellCode.ALIVE + 1, size=(3, 4), dtype=np.uint8))
+
+    assert gif_exporter.is_done
+    assert gif_exporter.num_of_frames_written == gif_exporter.num_of_frames_added == NUM_OF_FRAMES
+
+    with Image.open(path) as gif:
+        assert gif.n_frames == 2 * NUM_OF_FRAMES - 1  # w boomerang
+
+
+def test_add_after_worker_failed_fails(tmp_path):
+    gif_exporter = GifExporter(str(tmp_path / "test.gif"), max_queued=1)
+    gif_exporter.add(np.zeros((3, 4), dtype=np.uint8))
+    gif_exporter.add(np.zeros((2, 2), dtype=np.uint8))  # a different size, fails the worker
+
+    # Raises (instead of waiting forever on the full queue) once the worker has exited
+    with pytest.raises(RuntimeError):
+        for _ in range(100):
+            gif_exporter.add(np.zeros((3, 4), dtype=np.uint8))
+
+    with pytest.raises(RuntimeError):
+        gif_exporter.finish()
+
+
+def test_finish_after_worker_interrupted_success(tmp_path):
+    path = tmp_path / "test.gif"
+    gif_exporter = GifExporter(str(path), cell_size=2)
+    gif_exporter.add(np.zeros((3, 4), dtype=np.uint8))
+
+    while not gif_exporter.num_of_frames_written:
+        time.sleep(0.01)
+
+    # Ctrl-C reaches the worker too, it carries on til finished
+    os.kill(gif_exporter._process.pid, signal.SIGINT)
+    gif_exporter.add(np.ones((3, 4), dtype=np.uint8))
+
+    assert gif_exporter.finish()
+    assert path.exists()
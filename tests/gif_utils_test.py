@@ -1,56 +1,33 @@
-from src.utils.gif_utils import _convert_to_img_bytes, _get_inches_xy
-from PIL import Image
+from src.utils.gif_utils import convert_to_img, BORDER_INDEX
+from src.enums.cell_code import CellCode
+import numpy as np
 import pytest
 
 
 @pytest.fixture
-def mock_cell_matrix_strings() -> list[str]:
+def mock_cell_matrix_codes() -> list[np.ndarray]:
     # Pillow throws when trying to create GIF (append Images) w different sizes
-    # Matplotlib renders chars varying slightly in width/height (points) even though hardcoding points per char
-    # To handle this, we do not remove the padding around the plot to ensure all images have the same dimensions
     # To mock this, supply the following cell matrices w variations of cell states/placement
-    return [
-        """╭┈┈┈┈┈┈┈┈╮
-        ┊▓▓░░▓▓░░┊
-        ┊░░▓▓░░▓▓┊
-        ┊▓▓░░▓▓░░┊
-        ┊░░▓▓░░▓▓┊
-        ╰┈┈┈┈┈┈┈┈╯""",
-        """╭┈┈┈┈┈┈┈┈╮
-        ┊▓▓▓▓▓▓░░┊
-        ┊    ▓▓  ┊
-        ┊▓▓  ▓▓  ┊
-        ┊  ▓▓▓▓  ┊
-        ╰┈┈┈┈┈┈┈┈╯""",
-        """╭┈┈┈┈┈┈┈┈╮
-        ┊░░▓▓▓▓░░┊
-        ┊▓▓    ▓▓┊
-        ┊▓▓    ▓▓┊
-        ┊░░▓▓▓▓░░┊
-        ╰┈┈┈┈┈┈┈┈╯""",
-        """╭┈┈┈┈┈┈┈┈╮
-        ┊▓▓    ░░┊
-        ┊▓▓▓▓  ▓▓┊
-        ┊▓▓  ▓▓▓▓┊
-        ┊▓▓    ▓▓┊
-        ╰┈┈┈┈┈┈┈┈╯""",
-        """╭┈┈┈┈┈┈┈┈╮
-        ┊░░▓▓  ▓▓┊
-        ┊  ░░▓▓  ┊
-        ┊    ▓▓░░┊
-        ┊    ▓▓  ┊
-        ╰┈┈┈┈┈┈┈┈╯""",
-    ]
-
-
-def test_convert_to_img_bytes_all_same_size_success(mock_cell_matrix_strings):
-    img_bytes_list = []
-    x, y = _get_inches_xy(mock_cell_matrix_strings[0])
-
-    for s in mock_cell_matrix_strings:
-        img_bytes_list.append(_convert_to_img_bytes(s, x, y))
-
-    images = [Image.open(img) for img in img_bytes_list]
+    rng = np.random.default_rng(0)
+    return [rng.integers(CellCode.DEAD, CellCode.ALIVE + 1, size=(4, 5), dtype=np.uint8) for _ in range(5)]
+
+
+def test_convert_to_img_all_same_size_success(mock_cell_matrix_codes):
+    images = [convert_to_img(codes, cell_size=10) for codes in mock_cell_matrix_codes]
     size_to_assert = images[0].size
 
     assert all(img.size == size_to_assert for img in images)
+    assert all(img.mode == "P" for img in images)
+
+
+def test_convert_to_img_paints_cells_success():
+    CELL_SIZE = 10
+    codes = np.array([[CellCode.ALIVE, CellCode.RARE]], dtype=np.uint8)
+    pixels = np.array(convert_to_img(codes, cell_size=CELL_SIZE))
+    offset = CELL_SIZE // 2 + CELL_SIZE // 5  # margin + border
+
+    assert pixels[0, 0] == CellCode.DEAD
+    assert pixels[offset - 1, offset] == BORDER_INDEX
+    assert (pixels[offset:offset + CELL_SIZE, offset:offset + CELL_SIZE] == CellCode.ALIVE).all()
+    assert (pixels[offset:offset + CELL_SIZE, offset + CELL_SIZE:offset + 2 * CELL_SIZE] == CellCode.RARE).all()
+
@@ -0,0 +1,104 @@
+from src.utils.gif_utils import convert_to_img, FRAME_DURATION
+from src.models.gif_writer import GifWriter
+from src.enums.cell_code import CellCode
+from PIL import Image, ImageSequence
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def mock_cell_matrix_codes() -> list[np.ndarray]:
+    rng = np.random.default_rng(0)
+    return [rng.integers(CellCode.DEAD, CellCode.ALIVE + 1, size=(4, 5), dtype=np.uint8) for _ in range(4)]
+
+
+def test_add_streams_frames_w_boomerang_success(mock_cell_matrix_codes, tmp_path):
+    CELL_SIZE = 4
+    path = tmp_path / "test.gif"
+
+    with GifWriter(str(path), CELL_SIZE) as gif_writer:
+        for codes in mock_cell_matrix_codes:
+            gif_writer.add(codes)
+
+    # Frames forwards, then backwards (excluding the last)
+    expected_frames = mock_cell_matrix_codes + mock_cell_matrix_codes[-2::-1]
+
+    with Image.open(path) as gif:
+        frames = [np.array(frame.convert("RGB")) for frame in ImageSequence.Iterator(gif)]
+
+    assert len(frames) == len(expected_frames)
+
+    for frame, codes in zip(frames, expected_frames):
+        assert (frame == np.array(convert_to_img(codes, CELL_SIZE).convert("RGB"))).all()
+
+
+def test_add_different_size_fails(mock_cell_matrix_codes, tmp_path):
+    with GifWriter(str(tmp_path / "test.gif")) as gif_writer:
+        gif_writer.add(mock_cell_matrix_codes[0])
+
+        with pytest.raises(ValueError):
+            gif_writer.add(np.zeros((2, 2), dtype=np.uint8))
+
+
+def test_close_wo_frames_removes_file(tmp_path):
+    path = tmp_path / "test.gif"
+    GifWriter(str(path)).close()
+
+    assert not path.exists()
+
+
+def test_add_merges_identical_frames_success(mock_cell_matrix_codes, tmp_path):
+    CELL_SIZE = 4
+    path = tmp_path / "test.gif"
+    a, b, c = mock_cell_matrix_codes[:3]
+
+    with GifWriter(str(path), CELL_SIZE) as gif_writer:
+        for codes in [a, a, b, c, c, c]:
+            gif_writer.add(codes)
+
+    # Forwards then backwards is a a b c c c c c b a a, merged into runs
+    expected_frames = [a, b, c, b, a]
+    expected_repeats = [2, 1, 5, 1, 2]
+
+    with Image.open(path) as gif:
+        frames = []
+        durations = []
+
+        for frame in ImageSequence.Iterator(gif):
+            frames.append(np.array(frame.convert("RGB")))
+            durations.append(frame.info["duration"])
+
+    assert gif_writer.num_of_frames_written == len(expected_frames)
+    assert durations == [FRAME_DURATION * repeats // 10 * 10 for repeats in expected_repeats]  # stored in 10ms units
+
+    for frame, codes in zip(frames, expected_frames):
+        assert (frame == np.array(convert_to_img(codes, CELL_SIZE).convert("RGB"))).all()
+
+
+def test_add_long_identical_frames_splits_success(mock_cell_matrix_codes, tmp_path):
+    CELL_SIZE = 4
+    path = tmp_path / "test.gif"
+    a, b = mock_cell_matrix_codes[:2]
+    max_repeats = GifWriter._MAX_DURATION_MS // FRAME_DURATION
+
+    # A still run longer than a GIF delay can hold, doubled going backwards (2 * (max + 10) - 1 repeats)
+    with GifWriter(str(path), CELL_SIZE) as gif_writer:
+        gif_writer.add(a)
+
+        for _ in range(max_repeats + 10):
+            gif_writer.add(b)
+
+    expected_repeats = [1, max_repeats, max_repeats, 19, 1]
+
+    with Image.open(path) as gif:
+        frames = []
+        durations = []
+
+        for frame in ImageSequence.Iterator(gif):
+            frames.append(np.array(frame.convert("RGB")))
+            durations.append(frame.info["duration"])
+
+    assert durations == [FRAME_DURATION * repeats // 10 * 10 for repeats in expected_repeats]
+
+    for frame, codes in zip(frames, [a, b, b, b, a]):
+        assert (frame == np.array(convert_to_img(codes, CELL_SIZE).convert("RGB"))).all()
@@ -0,0 +1,84 @@
+from src.models.hash_life_matrix import HashLifeMatrix
+from src.models.cell_matrix import CellMatrix
+from src.constants.seeds import GLIDER
+from src.constants import constants
+from src.enums.engine import Engine
+import random
+import pytest
+
+
+@pytest.fixture
+def mock_soup() -> list[tuple[int, int]]:
+    # 12x12 random soup in the middle of a 64x64 matrix, can't reach the bounds in 16 generations
+    random.seed(3)
+    return [(x + 26, y + 26) for x in range(12) for y in range(12) if random.random() < 0.5]
+
+
+def test_mutate_matches_bounded_engine(mock_soup):
+    NUM_OF_GENERATIONS = 16
+    bounded_matrix = CellMatrix(seed=mock_soup, cols=64, rows=64, is_wrap=False, engine=Engine.NUMPY)
+    hash_life_matrix = HashLifeMatrix(seed=mock_soup, cols=64, rows=64)
+
+    for _ in range(NUM_OF_GENERATIONS):
+        bounded_matrix.mutate()
+        hash_life_matrix.mutate()
+
+        assert hash_life_matrix.alive_cell_coords == bounded_matrix.alive_cell_coords
+
+
+def test_advance_jumps_and_collects_garbage(mock_soup, monkeypatch):
+    NUM_OF_GENERATIONS = 16
+    stepped_matrix = HashLifeMatrix(seed=mock_soup, cols=64, rows=64)
+    stepped_matrix.advance(NUM_OF_GENERATIONS)
+
+    monkeypatch.setattr(constants, "HASHLIFE_MAX_NODES", 50)
+    jumped_matrix = HashLifeMatrix(seed=mock_soup, cols=64, rows=64)
+    jumped_matrix.advance(NUM_OF_GENERATIONS // 2)
+    jumped_matrix.advance(NUM_OF_GENERATIONS // 2)
+
+    assert jumped_matrix.alive_cell_coords == stepped_matrix.alive_cell_coords
+
+
+def test_advance_glider_far_away_success():
+    # A glider moves 1 cell diagonally every 4 generations
+    NUM_OF_GENERATIONS = 4 * 10**9
+    matrix = HashLifeMatrix(seed=GLIDER, cols=4, rows=4)
+    matrix.advance(NUM_OF_GENERATIONS)
+
+    assert matrix.population == len(GLIDER)
+    assert matrix.alive_cell_coords == []  # long gone from the window
+
+
+def test_fingerprint_same_cells_success(mock_soup, monkeypatch):
+    monkeypatch.setattr(constants, "HASHLIFE_MAX_NODES", 50)
+    jumped_matrix = HashLifeMatrix(seed=mock_soup, cols=64, rows=64)
+    jumped_matrix.advance(64)  # root grown and cropped, nodes collected along the way
+
+    # Same cells built from scratch (a different root size) hash the same, other cells don't
+    rebuilt_matrix = HashLifeMatrix(seed=jumped_matrix.plane_cell_coords, cols=64, rows=64)
+    moved_matrix = HashLifeMatrix(seed=[(x + 1, y) for x, y in jumped_matrix.plane_cell_coords], cols=64, rows=64)
+
+    assert rebuilt_matrix.fingerprint == jumped_matrix.fingerprint
+    assert moved_matrix.fingerprint != jumped_matrix.fingerprint
+
+
+def test_advance_collects_garbage_once_grown(monkeypatch):
+    # Blinkers (period 2) on their own have more nodes than the cap, but stepping them reuses memoised nodes
+    monkeypatch.setattr(constants, "HASHLIFE_MAX_NODES", 50)
+    blinkers = [(x * 7 + dx, y * 9) for x in range(8) for y in range(8) for dx in range(3)]
+    matrix = HashLifeMatrix(seed=blinkers, cols=64, rows=64)
+    num_of_collections = 0
+    collect_garbage = matrix._collect_garbage
+
+    def count_collect_garbage():
+        nonlocal num_of_collections
+        num_of_collections += 1
+        collect_garbage()
+
+    monkeypatch.setattr(matrix, "_collect_garbage", count_collect_garbage)
+
+    for _ in range(16):
+        matrix.mutate()
+
+    assert matrix.population == len(blinkers)
+    assert 0 < num_of_collections <= 2  # not every generation (recomputing everything)
@@ -0,0 +1,25 @@
+from src.utils.neighbourhood_utils import get_offsets, get_neighbour_indices
+from src.enums.neighbourhood import Neighbourhood
+import pytest
+
+
+@pytest.mark.parametrize("radius", [1, 2, 5])
+def test_get_offsets_shape_success(radius):
+    moore = get_offsets(Neighbourhood.MOORE, radius)
+    von_neumann = get_offsets(Neighbourhood.VON_NEUMANN, radius)
+
+    assert len(set(moore)) == (2 * radius + 1) ** 2 - 1
+    assert len(set(von_neumann)) == 2 * radius * (radius + 1)
+    assert all(abs(dx) + abs(dy) <= radius for dx, dy in von_neumann)
+    assert get_offsets(Neighbourhood.MOORE, radius) is moore  # cached
+
+
+def test_get_neighbour_indices_wrap_success():
+    # 2x2 matrix: radius 1 wraps onto the other cells only once, radius 2 wraps back onto the host too
+    wrapped = get_neighbour_indices(Neighbourhood.MOORE, 1, 2, 2, True)
+    wrapped_onto_host = get_neighbour_indices(Neighbourhood.MOORE, 2, 2, 2, True)
+    bounded = get_neighbour_indices(Neighbourhood.MOORE, 2, 2, 2, False)
+
+    assert sorted(wrapped[0]) == [1, 2, 3]
+    assert all(sorted(indices) == [0, 1, 2, 3] for indices in wrapped_onto_host)
+    assert sorted(bounded[0]) == [1, 2, 3]
@@ -0,0 +1,19 @@
+from src.utils.numpy_utils import _count_by_shifts, _count_by_summed_area, _is_summed_area_supported
+from src.enums.neighbourhood import Neighbourhood
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("neighbourhood", [Neighbourhood.MOORE, Neighbourhood.VON_NEUMANN])
+@pytest.mark.parametrize("is_wrap", [True, False])
+@pytest.mark.parametrize("radius, cols, rows", [(1, 9, 7), (3, 16, 12), (5, 11, 30), (7, 30, 30), (40, 6, 9)])
+def test_count_by_summed_area_matches_count_by_shifts(neighbourhood, is_wrap, radius, cols, rows):
+    board = np.random.default_rng(radius).integers(0, 2, size=(rows, cols), dtype=np.uint8)
+
+    if not _is_summed_area_supported(board, neighbourhood, radius, is_wrap):
+        pytest.skip("Falls back to shifted sums")
+
+    expected = _count_by_shifts(board, neighbourhood, radius, is_wrap)
+    actual = _count_by_summed_area(board, neighbourhood, radius, is_wrap)
+
+    assert np.array_equal(actual, expected)
@@ -0,0 +1,52 @@
+from src.enums.neighbourhood import Neighbourhood
+from src.enums.cell_state import CellState
+from src.models.cell_matrix import CellMatrix
+from src.enums.engine import Engine
+import random
+import pytest
+
+
+@pytest.mark.parametrize("neighbourhood, radius", [(Neighbourhood.MOORE, 1), (Neighbourhood.VON_NEUMANN, 2)])
+@pytest.mark.parametrize("is_wrap", [True, False])
+def test_mutate_workers_matches_single_process(neighbourhood, radius, is_wrap):
+    NUM_OF_GENERATIONS = 6
+    random.seed(radius)
+    settings = {
+        "cols": 17,
+        "rows": 11,
+        "radius": radius,
+        "is_wrap": is_wrap,
+        "neighbourhood": neighbourhood,
+        "engine": Engine.NUMPY,
+    }
+    single_matrix = CellMatrix(**settings)
+    parallel_matrix = CellMatrix(seed=single_matrix.alive_cell_coords, workers=3, **settings)
+
+    try:
+        for _ in range(NUM_OF_GENERATIONS):
+            single_matrix.mutate()
+            parallel_matrix.mutate()
+
+            assert parallel_matrix.matrix == single_matrix.matrix
+    finally:
+        parallel_matrix.close()
+
+
+def test_mutate_workers_cells_changed_between_success():
+    random.seed(0)
+    settings = {"cols": 12, "rows": 9, "engine": Engine.NUMPY}
+    single_matrix = CellMatrix(**settings)
+    parallel_matrix = CellMatrix(seed=single_matrix.alive_cell_coords, workers=2, **settings)
+
+    try:
+        for matrix in [single_matrix, parallel_matrix]:
+            matrix.mutate()
+            matrix.apply_cells([(0, 0), (1, 0), (2, 0)])  # the workers' board must be refreshed
+            matrix.change_state(CellState.RARE, CellState.ALIVE)  # RARE cells can't mutate
+            matrix.apply_cells([(5, 5), (6, 5), (7, 5)])
+            matrix.mutate()
+            matrix.mutate()
+
+        assert parallel_matrix.matrix == single_matrix.matrix
+    finally:
+        parallel_matrix.close()
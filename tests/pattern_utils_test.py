@@ -0,0 +1,98 @@
+from src.utils.pattern_utils import load_pattern, parse_pattern, get_centred_cells
+from src.utils.batch_utils import get_parsed_settings
+from src.utils.matrix_utils import setup_matrix
+from src.utils.args_utils import get_cli_args
+from src.models.bit_cell_matrix import BitCellMatrix
+from src.models.cell_matrix import CellMatrix
+from src.constants import constants
+import numpy as np
+import pytest
+import random
+import sys
+
+GLIDER = {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}
+
+GLIDER_RLE = b"""#N Glider
+#C A comment
+x = 3, y = 3, rule = B3/S23
+bob$2bo$3o!
+"""
+
+GLIDER_PLAINTEXT = b"""!Name: Glider
+!
+.O.
+..O
+OOO
+"""
+
+GLIDER_LIFE_106 = b"""#Life 1.06
+0 -1
+1 0
+-1 1
+0 1
+1 1
+"""
+
+
+@pytest.mark.parametrize("content", [GLIDER_RLE, GLIDER_PLAINTEXT, GLIDER_LIFE_106, GLIDER_PLAINTEXT.replace(b"\n", b"\r\n")])
+def test_parse_pattern_success(content):
+    assert set(map(tuple, parse_pattern(content).tolist())) == GLIDER
+
+
+@pytest.mark.parametrize("content", [b"x = 4, y = 3\n4o2$o2bo!", b"x = 4, y = 3\n4o2$o\n2bo!", b"x = 4, y = 3\n4o2$o2\nbo!"])
+def test_parse_pattern_rle_multiple_rows_success(content):
+    # "2$" skips an empty row, runs longer than 1 cell are expanded (even if split across lines)
+    cells = parse_pattern(content)
+
+    assert set(map(tuple, cells.tolist())) == {(0, 0), (1, 0), (2, 0), (3, 0), (0, 2), (3, 2)}
+
+
+def test_parse_pattern_empty_success():
+    assert parse_pattern(b"x = 0, y = 0\n!").shape == (0, 2)
+
+
+def test_load_pattern_cache_success(tmp_path, monkeypatch):
+    monkeypatch.setattr(constants, "PATTERN_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "glider.rle"
+    path.write_bytes(GLIDER_RLE)
+
+    cells = load_pattern(str(path))
+    cache_paths = list((tmp_path / "cache").iterdir())
+
+    assert len(cache_paths) == 1
+    assert np.array_equal(load_pattern(str(path)), cells)
+
+    # Same content (different path) hits the cache, so a corrupted entry proves it was read
+    np.save(cache_paths[0], np.array([[7, 7]]))
+    other_path = tmp_path / "copy.rle"
+    other_path.write_bytes(GLIDER_RLE)
+
+    assert load_pattern(str(other_path)).tolist() == [[7, 7]]
+
+
+def test_get_centred_cells_success():
+    cells = get_centred_cells(parse_pattern(GLIDER_RLE), cols=7, rows=9)
+
+    assert set(map(tuple, cells.tolist())) == {(x + 2, y + 3) for x, y in GLIDER}
+
+
+@pytest.mark.parametrize("matrix_type", [CellMatrix, BitCellMatrix])
+def test_apply_cells_bulk_success(matrix_type):
+    # Out of bounds cells are dropped
+    cells = np.array([[1, 0], [2, 1], [0, 2], [1, 2], [2, 2], [-1, 0], [5, 5]])
+    matrix = matrix_type(seed=cells, cols=5, rows=5)
+
+    assert set(matrix.alive_cell_coords) == GLIDER
+
+
+@pytest.mark.parametrize("engine", ["NumPy", "Bitwise", "HashLife", "Sparse"])
+def test_setup_matrix_empty_pattern_success(engine, monkeypatch):
+    # No alive cells stays empty (not a random soup, nor drawing from the random state)
+    monkeypatch.setattr(sys, "argv", ["game-of-life.py"])
+    args = {**get_cli_args(), "engine": engine, "is_wrap_mode": False}
+    random_state = random.getstate()
+
+    matrix = setup_matrix(get_parsed_settings(args), pattern=parse_pattern(b"...\n...\n"))
+
+    assert matrix.population == 0
+    assert random.getstate() == random_state
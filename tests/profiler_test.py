@@ -0,0 +1,78 @@
+from src.models.simulation_screen import SimulationScreen
+from src.models.cell_matrix import CellMatrix
+from src.models.profiler import Profiler
+import tracemalloc
+import json
+
+
+def test_profiler_summary_success():
+    profiler = Profiler()
+
+    for ms in range(1, 101):
+        profiler.add("mutate", 0, ms / 1000)
+
+    with profiler.phase("draw"):
+        pass
+
+    summary = profiler.get_summary()
+
+    assert profiler.phases == ["mutate", "draw"]
+    assert summary["mutate"]["calls"] == 100
+    assert summary["mutate"]["p50_ms"] == 50.5
+    assert summary["mutate"]["p95_ms"] == 95.05
+    assert summary["mutate"]["max_ms"] == 100
+    assert summary["mutate"]["total_ms"] == 5050
+    assert summary["draw"]["calls"] == 1
+    assert "mean_alloc_kib" not in summary["draw"]
+    assert len(profiler.get_summary_lines()) == 3  # header + 1 per phase
+
+
+def test_profiler_count_success():
+    profiler = Profiler()
+    profiler.count("population", 5)
+    profiler.count("population", 8)
+
+    assert profiler.counters == {"population": 8}
+    assert any("population 8" in line for line in profiler.get_overlay_lines())
+
+
+def test_profiler_memory_success():
+    profiler = Profiler(is_tracing_memory=True)
+
+    with profiler.phase("allocate"):
+        data = bytearray(1024 * 1024)
+
+    profiler.close()
+
+    assert profiler.get_summary()["allocate"]["mean_alloc_kib"] >= 1024
+    assert not tracemalloc.is_tracing()
+    assert len(data)
+
+
+def test_profiler_write_trace_success(tmp_path):
+    profiler = Profiler(is_keeping_events=True)
+    path = str(tmp_path / "trace.json")
+
+    with profiler.phase("mutate"):
+        pass
+
+    profiler.count("population", 3)
+    profiler.write_trace(path)
+
+    with open(path) as file:
+        events = json.load(file)["traceEvents"]
+
+    assert [(e["name"], e["ph"]) for e in events] == [("mutate", "X"), ("population", "C")]
+    assert events[0]["dur"] >= 0
+    assert events[1]["args"] == {"population": 3}
+
+
+def test_simulation_screen_profiler_success():
+    profiler = Profiler()
+    simulation = SimulationScreen(initial_gen=CellMatrix(cols=5, rows=5), profiler=profiler)
+
+    simulation._get_next_generation()
+    simulation._get_generation_as_str(True)
+
+    assert {"mutate", "ghost", "compose"} <= set(profiler.phases)
+    assert "population" in profiler.counters
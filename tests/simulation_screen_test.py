@@ -1,10 +1,14 @@
 from src.models.simulation_screen import SimulationScreen
+from src.models.hash_life_matrix import HashLifeMatrix
+from src.models.cell_matrix import CellMatrix
+from src.constants.seeds import GLIDER
+from src.enums.on_cycle import OnCycle
 import pytest
 
 
 @pytest.fixture
 def mock_model() -> SimulationScreen:
-    return SimulationScreen()
+    return SimulationScreen(on_cycle=OnCycle.CONTINUE)
 
 
 def test_generations_generator_success(mock_model):
@@ -16,3 +20,34 @@ def test_generations_generator_success(mock_model):
         count_to_assert += 1
 
     assert count_to_assert == NUM_OF_GENERATIONS
+
+
+def test_generations_generator_step_success():
+    NUM_OF_GENERATIONS = 3
+    GENERATION_STEP = 5
+    initial_gen = HashLifeMatrix(seed=GLIDER, cols=8, rows=8)
+    expected_gen = HashLifeMatrix(seed=GLIDER, cols=8, rows=8)
+    expected_gen.advance(NUM_OF_GENERATIONS * GENERATION_STEP)
+
+    model = SimulationScreen(initial_gen=initial_gen)
+    all_gens = list(model.generations_generator(NUM_OF_GENERATIONS, False, GENERATION_STEP))
+
+    assert len(all_gens) == NUM_OF_GENERATIONS
+    assert model.curr_gen.alive_cell_coords == expected_gen.alive_cell_coords
+
+
+@pytest.mark.parametrize("on_cycle, expected_generation", [(OnCycle.STOP, 2), (OnCycle.FAST_FORWARD, 11)])
+def test_generations_generator_cycle_success(on_cycle, expected_generation):
+    # Blinker oscillates w a period of 2, the initial generation is repeated by the 2nd
+    NUM_OF_GENERATIONS = 11
+    BLINKER = [(1, 2), (2, 2), (3, 2)]
+    expected_gen = CellMatrix(seed=BLINKER, cols=5, rows=5)
+    expected_gen.advance(expected_generation)
+
+    model = SimulationScreen(initial_gen=CellMatrix(seed=BLINKER, cols=5, rows=5), on_cycle=on_cycle)
+    all_gens = list(model.generations_generator(NUM_OF_GENERATIONS, False))
+
+    assert len(all_gens) == 2
+    assert model.cycle == (0, 2)
+    assert model.generation == expected_generation
+    assert model.curr_gen.alive_cell_coords == expected_gen.alive_cell_coords
@@ -0,0 +1,61 @@
+from src.models.sparse_cell_matrix import SparseCellMatrix
+from src.enums.neighbourhood import Neighbourhood
+from src.models.cell_matrix import CellMatrix
+from src.constants.seeds import GLIDER
+from src.enums.engine import Engine
+import random
+import pytest
+
+
+@pytest.mark.parametrize("neighbourhood, radius", [(Neighbourhood.MOORE, 1), (Neighbourhood.VON_NEUMANN, 3)])
+def test_mutate_wrap_matches_python_engine(neighbourhood, radius):
+    NUM_OF_GENERATIONS = 12
+    random.seed(radius)
+    settings = {
+        "cols": 15,
+        "rows": 6,
+        "radius": radius,
+        "is_wrap": True,
+        "neighbourhood": neighbourhood,
+        "survival_rule": {2, 3, 4},
+        "resurrection_rule": {3},
+    }
+    python_matrix = CellMatrix(engine=Engine.PYTHON, **settings)
+    sparse_matrix = SparseCellMatrix(seed=python_matrix.alive_cell_coords, **settings)
+
+    for _ in range(NUM_OF_GENERATIONS):
+        python_matrix.mutate()
+        sparse_matrix.mutate()
+
+        assert sparse_matrix.as_str == python_matrix.as_str
+
+
+def test_mutate_unbounded_glider_bounding_box():
+    # The glider seed moves 1 cell up-right every 4 generations, far beyond the matrix
+    NUM_OF_GENERATIONS = 400
+    matrix = SparseCellMatrix(seed=GLIDER, cols=5, rows=5, is_wrap=False)
+    min_x, min_y, max_x, max_y = matrix.bounding_box
+
+    for _ in range(NUM_OF_GENERATIONS):
+        matrix.mutate()
+
+    assert matrix.population == len(GLIDER)
+    assert matrix.alive_cell_coords == []
+    assert matrix.bounding_box == (min_x + 100, min_y - 100, max_x + 100, max_y - 100)
+
+
+def test_follow_unbounded_glider_success():
+    # The window re-centres on the glider once it leaves, so it's always shown
+    matrix = SparseCellMatrix(seed=GLIDER, cols=5, rows=5, is_wrap=False)
+    moved = [0, 0]
+
+    for _ in range(400):
+        matrix.mutate()
+        dx, dy = matrix.follow()
+        moved = [moved[0] + dx, moved[1] + dy]
+
+        assert len(matrix.alive_cell_coords) == len(GLIDER)
+
+    assert matrix.window_origin == tuple(moved)
+    assert {(x + moved[0], y + moved[1]) for x, y in matrix.alive_cell_coords} == set(matrix.plane_cell_coords)
+    assert SparseCellMatrix(seed=GLIDER, cols=5, rows=5).follow() == (0, 0)  # wrapped, never moves
@@ -0,0 +1,29 @@
+from src.utils.string_utils import get_frame, get_lines_diff
+from src.enums.cell_state import CellState
+from src.enums.cell_code import CellCode
+import numpy as np
+import pytest
+
+
+def test_get_frame_success():
+    codes = np.array([[CellCode.ALIVE, CellCode.DEAD], [CellCode.RARE, CellCode.MEDIUM]], dtype=np.uint8)
+    expected_frame = "\n".join([
+        "╭┈┈┈┈╮",
+        f"┊{CellState.ALIVE.value}{CellState.DEAD.value}┊",
+        f"┊{CellState.RARE.value}{CellState.MEDIUM.value}┊",
+        "╰┈┈┈┈╯",
+    ])
+
+    assert get_frame(codes) == expected_frame
+    assert get_frame(codes, is_bordered=False) == "\n".join(expected_frame.split("\n")[1:-1]).replace("┊", "")
+
+
+@pytest.mark.parametrize("prev_lines, lines, expected_diff", [
+    (["abcd", "efgh"], ["abcd", "efgh"], []),
+    (["abcd", "efgh"], ["aXcY", "efgh"], [(0, 1, "X"), (0, 3, "Y")]),
+    (["abcd"], ["aXYd", "ef"], [(0, 1, "XY"), (1, 0, "ef")]),
+    (["abcd", "ef"], ["ab"], [(0, 2, "  "), (1, 0, "  ")]),
+    ([], ["ab"], [(0, 0, "ab")]),
+])
+def test_get_lines_diff_success(prev_lines, lines, expected_diff):
+    assert get_lines_diff(prev_lines, lines) == expected_diff
@@ -0,0 +1,35 @@
+from benchmarks.suite_benchmark import get_regressions, _compare
+from argparse import Namespace
+import pytest
+import json
+
+BASELINE = {"mutate/a": 100.0, "mutate/b": 100.0, "compose": 0.0, "gone": 10.0}
+CURRENT = {"mutate/a": 105.0, "mutate/b": 125.0, "compose": 50.0, "new": 10.0}
+
+
+def test_get_regressions_success():
+    # Only cases in both (w a non-zero baseline) slower than the threshold
+    assert get_regressions(BASELINE, CURRENT, 0.1) == {"mutate/b": 1.25}
+    assert get_regressions(BASELINE, CURRENT, 0.3) == {}
+
+
+@pytest.mark.parametrize("threshold, is_exit", [(0.1, True), (0.3, False)])
+def test_compare_exits_on_regressions(threshold, is_exit, tmp_path, capsys):
+    paths = []
+
+    for name, results in [("baseline", BASELINE), ("current", CURRENT)]:
+        path = tmp_path / f"{name}.json"
+        path.write_text(json.dumps({"meta": {}, "results": results}))
+        paths.append(str(path))
+
+    args = Namespace(baseline=paths[0], current=paths[1], threshold=threshold)
+
+    if is_exit:
+        with pytest.raises(SystemExit) as ex:
+            _compare(args)
+
+        assert ex.value.code != 0
+    else:
+        _compare(args)
+
+    assert ("REGRESSION" in capsys.readouterr().out) == is_exit
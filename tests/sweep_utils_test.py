@@ -0,0 +1,68 @@
+from src.utils.sweep_utils import get_sweep_values, get_sweep_combinations, get_done_keys, get_run_key, run_sweep
+from src.utils.args_utils import get_cli_args
+import pytest
+import json
+import sys
+
+
+@pytest.fixture
+def default_args(monkeypatch) -> dict:
+    # Parsed w/o the test runner's own args (e.g. "pytest -p no:cacheprovider" would set the pattern)
+    monkeypatch.setattr(sys, "argv", ["game-of-life.py"])
+    return get_cli_args()
+
+
+@pytest.mark.parametrize("value, expected_values", [
+    ("1..3", [1, 2, 3]),
+    ("10..90:20", [10, 30, 50, 70, 90]),
+    (["2,3", "3,4"], ["2,3", "3,4"]),
+    ("Moore", ["Moore"]),
+    (5, [5]),
+])
+def test_get_sweep_values_success(value, expected_values):
+    assert get_sweep_values(value) == expected_values
+
+
+def test_get_sweep_combinations_success(default_args):
+    combinations = get_sweep_combinations({"radius": "1..2", "neighbourhood": ["Moore", "VonNeumann"]}, default_args)
+
+    assert combinations == [
+        {"neighbourhood": "Moore", "radius": 1},
+        {"neighbourhood": "Moore", "radius": 2},
+        {"neighbourhood": "VonNeumann", "radius": 1},
+        {"neighbourhood": "VonNeumann", "radius": 2},
+    ]
+
+
+@pytest.mark.parametrize("spec", [{"colour": ["red"]}, {"radius": []}])
+def test_get_sweep_combinations_invalid_failure(spec, default_args):
+    with pytest.raises(ValueError):
+        get_sweep_combinations(spec, default_args)
+
+
+def test_get_done_keys_skips_cut_off_lines_success(tmp_path):
+    path = tmp_path / "sweep.jsonl"
+    path.write_text(json.dumps({"combination": {"radius": 1}, "run": 0}) + "\n" + '{"combination": {"rad')
+
+    assert get_done_keys(str(path)) == {get_run_key({"radius": 1}, 0)}
+
+
+def test_run_sweep_resumes_success(tmp_path, default_args):
+    path = tmp_path / "sweep.jsonl"
+    args = {**default_args, "num_of_runs": 2, "rng_seed": 42}
+    spec = {"radius": "1..2"}
+
+    # Leave 1 finished run and a cut off one, as if interrupted
+    path.write_text(json.dumps({"combination": {"radius": 1}, "run": 0}) + "\n" + '{"combination": {"rad')
+
+    assert run_sweep(args, spec, str(path), num_of_jobs=2) == 3
+    assert run_sweep(args, spec, str(path), num_of_jobs=2) == 0
+
+    results = [json.loads(line) for line in path.read_text().splitlines()[2:]]
+    assert sorted((result["combination"]["radius"], result["run"]) for result in results) == [(1, 1), (2, 0), (2, 1)]
+    assert all(result["rng_seed"] == 42 + result["run"] for result in results)
+
+
+def test_run_sweep_invalid_settings_failure(tmp_path, default_args):
+    with pytest.raises(ValueError):
+        run_sweep(default_args, {"radius": [-1]}, str(tmp_path / "sweep.jsonl"))